@@ -0,0 +1,5 @@
+"""
+Benchmarks for the `terminal_ui` module.\n
+They replay recorded key traces against generated menus with the `Memory_backend`, and compare the results with a stored baseline.\n
+Run them with `python -m benchmarks.run`.
+"""
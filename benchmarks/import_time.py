@@ -0,0 +1,53 @@
+"""
+Measures how long importing the package (and showing the first frame of a menu) takes in a new python process, like in a short-lived command line tool.\n
+Every case runs in `repeat` new processes, and the median and the fastest times are shown.\n
+Usage: `python -m benchmarks.import_time [--repeat 20]`
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+CASES = {
+    "import terminal_ui": "import terminal_ui",
+    "from terminal_ui import UI_list": "from terminal_ui import UI_list",
+    "from terminal_ui import *": "from terminal_ui import *",
+    "first frame": (
+        "from terminal_ui import UI_list, Memory_backend, Keys\n"
+        "UI_list(['yes', 'no'], 'Continue?').display(backend=Memory_backend([Keys.ENTER], capture=False))"
+    ),
+}
+
+_TIMER = """
+from time import perf_counter
+_start = perf_counter()
+{code}
+print(perf_counter() - _start)
+"""
+
+
+def time_case(code:str, repeat:int):
+    """Returns the times (in seconds) the code took in `repeat` new processes."""
+    env = dict(os.environ, PYTHONPATH=str(Path(__file__).parent.parent))
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", _TIMER.format(code=code)], capture_output=True, text=True, env=env, check=True)
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def main(argv:list[str]=None):
+    parser = argparse.ArgumentParser(description="terminal_ui import time benchmark")
+    parser.add_argument("--repeat", type=int, default=20, help="number of processes per case")
+    args = parser.parse_args(argv)
+
+    for name, code in CASES.items():
+        times = sorted(time_case(code, args.repeat))
+        print(f"{name:<36} median {times[len(times) // 2] * 1000:>8.2f}ms  min {times[0] * 1000:>8.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
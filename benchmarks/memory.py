@@ -0,0 +1,86 @@
+"""
+Shows how much memory the UI element classes use per object, compared to dict-backed objects with the same attributes, a `Cursor_icon` for every `UI_list` and a list of choices for every `Choice` (the old layout).\n
+Usage: `python -m benchmarks.memory [count]`
+"""
+import sys
+import tracemalloc
+from typing import Callable
+
+from terminal_ui import Cursor_icon, UI_list, UI_list_button, Slider, Choice, Toggle, Button
+
+
+class _Dict_backed:
+    """Object that stores its attributes in a `__dict__`, like the classes did before `__slots__`."""
+    pass
+
+
+def _slot_names(obj:object):
+    names = []
+    for cls in type(obj).__mro__:
+        names.extend(cls.__dict__.get("__slots__", ()))
+    return names
+
+
+def dict_backed_copy(obj:object):
+    """Returns a dict-backed object with the same attribute values as the slotted object."""
+    copy = _Dict_backed()
+    for name in _slot_names(obj):
+        if hasattr(obj, name):
+            copy.__dict__[name] = getattr(obj, name)
+    return copy
+
+
+def measure(make:Callable[[int], object], count:int):
+    """Returns the bytes allocated per object, when making `count` objects with `make`."""
+    objects = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for x in range(count):
+        objects.append(make(x))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def _old_ui_list_button(x:int):
+    button = UI_list_button("button", None)
+    copy = dict_backed_copy(button)
+    # every UI_list made its own Cursor_icon
+    icon = _Dict_backed()
+    icon.__dict__.update(s_icon=">", s_icon_r="", icon=" ", icon_r="")
+    copy.cursor_icon = icon
+    return copy
+
+
+def _old_choice(x:int):
+    choice = Choice(["low", "medium", "high"], x % 3, "choice ")
+    copy = dict_backed_copy(choice)
+    copy.choice_list = [str(choice) for choice in ["low", "medium", "high"]]
+    return copy
+
+
+CASES:list[tuple[str, Callable[[int], object], Callable[[int], object]]] = [
+    ("Cursor_icon", lambda x: Cursor_icon(), lambda x: dict_backed_copy(Cursor_icon())),
+    ("UI_list", lambda x: UI_list(["a", "b"]), lambda x: dict_backed_copy(UI_list(["a", "b"]))),
+    ("UI_list_button", lambda x: UI_list_button("button", None), _old_ui_list_button),
+    ("Slider", lambda x: Slider(10, x % 10, "slider "), lambda x: dict_backed_copy(Slider(10, x % 10, "slider "))),
+    ("Choice", lambda x: Choice(["low", "medium", "high"], x % 3, "choice "), _old_choice),
+    ("Toggle", lambda x: Toggle(x % 2, "toggle "), lambda x: dict_backed_copy(Toggle(x % 2, "toggle "))),
+    ("Button", lambda x: Button("button"), lambda x: dict_backed_copy(Button("button"))),
+]
+
+
+def main(argv:list[str]=None):
+    argv = sys.argv[1:] if argv is None else argv
+    count = int(argv[0]) if argv else 10000
+    print(f"{'class':<16} {'now B/obj':>10} {'old B/obj':>10} {'saved':>8}")
+    for name, make_new, make_old in CASES:
+        new = measure(make_new, count)
+        # the slotted objects the old ones are copied from are freed, only the copies are kept
+        old = measure(make_old, count)
+        print(f"{name:<16} {new:>10.1f} {old:>10.1f} {(1 - new / old) * 100 if old else 0:>7.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+from terminal_ui import UI_list, Answer_source, Slider, Choice, Toggle, Button, Table
+
+
+def make_answers(size:int, nones=False, multiline=False):
+    """Returns an answer list with `size` elements, with every 4. element being None if `nones` is True, and every answer being 2 lines if `multiline` is True."""
+    answers = []
+    for x in range(size):
+        if nones and x % 4 == 3:
+            answers.append(None)
+        elif multiline:
+            answers.append(f"answer {x}\n  details of answer {x}")
+        else:
+            answers.append(f"answer {x}")
+    return answers
+
+
+def make_lazy_answers(size:int):
+    """Returns an `Answer_source` with `size` answers, that are only made when they are fetched."""
+    return Answer_source(lambda offset, count: [f"answer {x}" for x in range(offset, min(offset + count, size))], size)
+
+
+def make_ui_list(size:int, nones=False, multiline=False, scroll=True):
+    """Returns a `UI_list` with `size` answers."""
+    return UI_list(make_answers(size, nones, multiline), f"UI_list with {size} answers", multiline=multiline, scroll=scroll)
+
+
+def make_elements(size:int, kind="mixed", nones=False):
+    """
+    Returns a list of `options_ui` elements with `size` elements.\n
+    `kind` can be "slider", "wide_slider", "choice", "multiline" or "mixed".
+    """
+    elements = []
+    for x in range(size):
+        if nones and x % 4 == 3:
+            elements.append(None)
+            continue
+        element_kind = kind if kind != "mixed" else ("slider", "choice", "toggle", "button")[x % 4]
+        if element_kind == "slider":
+            elements.append(Slider(range(0, 20), x % 20, f"slider {x} |", "#", "-", "| ", True))
+        elif element_kind == "wide_slider":
+            elements.append(Slider(range(0, 100000, 10), x * 10 % 100000, f"limit {x} |", "#", "-", "| ", True, bar_width=40, partial_symbols="123456", acceleration=True))
+        elif element_kind == "choice":
+            elements.append(Choice(["low", "medium", "high"], x % 3, f"choice {x} ", "", True))
+        elif element_kind == "multiline":
+            elements.append(Choice(["first\nchoice", "second\nchoice"], x % 2, f"multiline {x}\n", " ", True, multiline=True))
+        elif element_kind == "toggle":
+            elements.append(Toggle(x % 2, f"toggle {x} "))
+        else:
+            elements.append(Button(f"button {x}", lambda: False))
+    return elements
+
+
+def make_table(size:int):
+    """Returns an `options_ui` element list with a `Table` with `size` rows and 6 columns."""
+    columns = {
+        "id": range(size),
+        "name": [f"customer {x:07}" for x in range(size)],
+        "city": [("Budapest", "Vienna", "Prague", "Warsaw")[x % 4] for x in range(size)],
+        "orders": [x * 7919 % 1000 for x in range(size)],
+        "balance": [x * 7919 % 100003 / 100 for x in range(size)],
+        "status": [("active", "inactive", "blocked")[x % 3] for x in range(size)],
+    }
+    return [Table(columns, height=20, formats={"balance": ".2f"})]
@@ -0,0 +1,272 @@
+"""
+Replays the recorded key traces against generated menus, and reports the frame build time, the render time, the keystroke to frame latency, the bytes written per frame and the allocations.\n
+Every case runs `repeat` times, and the median of the timings is reported.\n
+The results are compared with the stored baseline, and the process exits with 1 if a case renders more (or bigger) frames, or allocates more than the tolerance allows. The timings that got slower are only shown, unless `--gate-timings` is used.\n
+Usage: `python -m benchmarks.run [--sizes 10 1000] [--full] [--only name] [--repeat 3] [--update-baseline] [--tolerance 2.0] [--gate-timings]`\n
+The timing values of the baseline are only meaningful on the machine they were recorded on, so update the baseline before gating on the timings on a new machine.
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import Callable
+
+from terminal_ui import Keys, Memory_backend, Renderer, UI_list, options_ui
+from benchmarks.menus import make_ui_list, make_lazy_answers, make_elements, make_table
+from benchmarks.traces import load_trace
+
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DEFAULT_SIZES = [10, 1000, 100000]
+FULL_SIZES = [10, 1000, 100000, 1000000]
+# the metrics that depend on the speed of the machine
+TIMING_METRICS = {"total_ms", "build_p50_us", "build_p99_us", "render_p50_us", "render_p99_us", "latency_p50_us", "latency_p90_us", "latency_p99_us", "latency_max_us"}
+
+
+class Replay_backend(Memory_backend):
+    """
+    Memory backend that replays the keys of a trace, and throws away the frames.\n
+    If `buffered` is True, the keys but the last one (that exits the menu) arrive at once (like a key-repeat flood), and the last one only after the frame that shows the result of the flood, so the coalesced frame is rendered (and measured) too.
+    """
+    def __init__(self, keys:list[Keys], buffered=False):
+        keys = list(keys)
+        self.held_keys = keys[-1:] if buffered else []
+        super().__init__(keys[:-1] if buffered else keys, capture=False, buffered=buffered)
+
+
+    def key_pending(self, timeout:float=0):
+        # the pause after the flood
+        if self.held_keys and not self._has_keys():
+            return False
+        return super().key_pending(timeout)
+
+
+    def write(self, text:str):
+        super().write(text)
+        if self.held_keys and not self._has_keys():
+            self.add_keys(self.held_keys)
+            self.held_keys = []
+
+
+class Timing_backend(Replay_backend):
+    """
+    Memory backend that records the time of the first key after every frame, and the size of every frame.\n
+    (with a flood of keys, the latency is the time it took to apply the whole flood, and render it)
+    """
+    def __init__(self, keys:list[Keys], buffered=False):
+        super().__init__(keys, buffered)
+        self.key_time:float|None = None
+        self.latencies:list[float] = []
+        self.frame_bytes:list[int] = []
+
+
+    def read_key(self, key_map):
+        key = super().read_key(key_map)
+        # the first key after a frame
+        if self.key_time is None:
+            self.key_time = perf_counter()
+        return key
+
+
+    def write(self, text:str):
+        if self.key_time is not None:
+            self.latencies.append(perf_counter() - self.key_time)
+            self.key_time = None
+        self.frame_bytes.append(len(text.encode()))
+        super().write(text)
+
+
+class Timing_renderer(Renderer):
+    """Renderer that records how long building the frames (since the last key) and rendering them took."""
+    def __init__(self, backend:Timing_backend):
+        super().__init__()
+        self.backend = backend
+        self.build_times:list[float] = []
+        self.render_times:list[float] = []
+
+
+    def render(self, txt:str, terminal_size:tuple[int, int]=None, cursor:tuple[int, int]=None):
+        start = perf_counter()
+        if self.backend.key_time is not None:
+            self.build_times.append(start - self.backend.key_time)
+        out = super().render(txt, terminal_size, cursor)
+        self.render_times.append(perf_counter() - start)
+        return out
+
+
+def percentile(values:list[float], percent:float):
+    """Returns the `percent` percentile of the values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+
+def _replay(menu, run_menu:Callable, backend:Memory_backend, renderer:Renderer):
+    try:
+        run_menu(menu, backend, renderer)
+    except EOFError:
+        pass
+
+
+def _timed_run(make_menu:Callable, run_menu:Callable, keys:list[Keys], buffered:bool):
+    """Runs the keys against a new menu once, and returns the timings and the sizes of the frames."""
+    backend = Timing_backend(keys, buffered)
+    renderer = Timing_renderer(backend)
+    menu = make_menu()
+    start = perf_counter()
+    _replay(menu, run_menu, backend, renderer)
+    total = perf_counter() - start
+    frames = max(len(backend.frame_bytes), 1)
+    us = 1000000
+    return {
+        "keys": len(keys),
+        "frames": len(backend.frame_bytes),
+        "total_ms": round(total * 1000, 3),
+        "build_p50_us": round(percentile(renderer.build_times, 50) * us, 2),
+        "build_p99_us": round(percentile(renderer.build_times, 99) * us, 2),
+        "render_p50_us": round(percentile(renderer.render_times, 50) * us, 2),
+        "render_p99_us": round(percentile(renderer.render_times, 99) * us, 2),
+        "latency_p50_us": round(percentile(backend.latencies, 50) * us, 2),
+        "latency_p90_us": round(percentile(backend.latencies, 90) * us, 2),
+        "latency_p99_us": round(percentile(backend.latencies, 99) * us, 2),
+        "latency_max_us": round(percentile(backend.latencies, 100) * us, 2),
+        "bytes_per_frame": round(sum(backend.frame_bytes) / frames, 2),
+        "first_frame_bytes": backend.frame_bytes[0] if backend.frame_bytes else 0,
+    }
+
+
+def run_case(make_menu:Callable, run_menu:Callable, keys:list[Keys], buffered=False, repeat=3):
+    """
+    Runs the keys against a new menu `repeat` times, and returns the results, with the median of the timings.\n
+    If `buffered` is True, the keys arrive all at once (like a key-repeat flood, except the last one), otherwise one by one after every frame.
+    """
+    runs = [_timed_run(make_menu, run_menu, keys, buffered) for _ in range(max(repeat, 1))]
+    result = {name: (round(median(run[name] for run in runs), 2) if name in TIMING_METRICS else value) for name, value in runs[0].items()}
+    # allocations in a separate run (on a new menu)
+    menu = make_menu()
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    _replay(menu, run_menu, Replay_backend(keys, buffered), Renderer())
+    blocks_after = sys.getallocatedblocks()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result["alloc_peak_kb"] = round(peak / 1024, 2)
+    result["alloc_blocks"] = blocks_after - blocks_before
+    return result
+
+
+def _run_ui_list(menu, backend, renderer):
+    menu.display(backend=backend, renderer=renderer)
+
+
+def _options_runner(scroll:bool):
+    def run(elements, backend, renderer):
+        options_ui(elements, "settings", renderer=renderer, scroll=scroll, backend=backend)
+    return run
+
+
+def make_cases(sizes:list[int]):
+    """Returns the benchmark cases as (name, make_menu, run_menu, trace name, buffered) tuples."""
+    cases = []
+    for size in sizes:
+        for nones in (False, True):
+            for multiline in (False, True):
+                name = f"ui_list[{size}{',nones' if nones else ''}{',multiline' if multiline else ''}]"
+                make = (lambda size=size, nones=nones, multiline=multiline: make_ui_list(size, nones, multiline))
+                cases.append((f"{name}:browse", make, _run_ui_list, "browse", False))
+                if not nones and not multiline:
+                    cases.append((f"{name}:page_through", make, _run_ui_list, "page_through", False))
+                    cases.append((f"{name}:page_through_flood", make, _run_ui_list, "page_through", True))
+        make = (lambda size=size: UI_list(make_lazy_answers(size), f"UI_list with {size} lazy answers", scroll=True))
+        cases.append((f"ui_list[{size},lazy]:page_through", make, _run_ui_list, "page_through", False))
+        for kind in ("slider", "wide_slider", "choice", "multiline", "mixed"):
+            make = (lambda size=size, kind=kind: make_elements(size, kind))
+            trace = "slider_drag" if kind in ("slider", "wide_slider") else "settings"
+            cases.append((f"options_ui[{size},{kind}]:{trace}", make, _options_runner(True), trace, False))
+            if kind == "slider":
+                cases.append((f"options_ui[{size},{kind}]:{trace}_flood", make, _options_runner(True), trace, True))
+        cases.append((f"options_ui[{size},table]:browse", (lambda size=size: make_table(size)), _options_runner(False), "browse", False))
+    return cases
+
+
+def compare(results:dict[str, dict], baseline:dict[str, dict], tolerance:float, gate_timings=False):
+    """
+    Returns the list of regressions compared to the baseline, and the list of the timings that got slower.\n
+    Only the metrics that don't depend on the speed of the machine (the number and the size of the frames, and the allocations) are regressions, unless `gate_timings` is True.
+    """
+    regressions = []
+    slowdowns = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        checks = [
+            ("frames", 1.0, 0.0),
+            ("bytes_per_frame", 1.05, 1.0),
+            ("first_frame_bytes", 1.05, 1.0),
+            ("alloc_peak_kb", 1.5, 64.0),
+        ]
+        for metric, metric_tolerance, slack in checks:
+            if metric in base and result[metric] > base[metric] * metric_tolerance + slack:
+                regressions.append(f"{name}: {metric} {base[metric]} -> {result[metric]}")
+        for metric, slack in (("latency_p50_us", 20.0), ("latency_p99_us", 50.0)):
+            if metric in base and result[metric] > base[metric] * tolerance + slack:
+                (regressions if gate_timings else slowdowns).append(f"{name}: {metric} {base[metric]} -> {result[metric]}")
+    return regressions, slowdowns
+
+
+def main(argv:list[str]=None):
+    parser = argparse.ArgumentParser(description="terminal_ui render benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None, help="menu sizes to run")
+    parser.add_argument("--full", action="store_true", help=f"run all sizes {FULL_SIZES}")
+    parser.add_argument("--only", default=None, help="only run the cases whose name contains this")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=2.0, help="allowed slowdown factor of the timings")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs of every case (the median of the timings is used)")
+    parser.add_argument("--gate-timings", action="store_true", help="also fail if the timings got slower than the tolerance allows")
+    parser.add_argument("--json", type=Path, default=None, help="also write the results into this file")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (FULL_SIZES if args.full else DEFAULT_SIZES)
+    traces:dict[str, list[Keys]] = {}
+    results:dict[str, dict] = {}
+    for name, make_menu, run_menu, trace, buffered in make_cases(sizes):
+        if args.only is not None and args.only not in name:
+            continue
+        if trace not in traces:
+            traces[trace] = load_trace(trace)
+        result = run_case(make_menu, run_menu, traces[trace], buffered, args.repeat)
+        results[name] = result
+        print(f"{name:<48} p50 {result['latency_p50_us']:>10.1f}us  p99 {result['latency_p99_us']:>10.1f}us  "
+              f"{result['bytes_per_frame']:>10.1f}B/frame  peak {result['alloc_peak_kb']:>10.1f}KB")
+    if args.json is not None:
+        args.json.write_text(json.dumps(results, indent=4))
+
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=4, sort_keys=True))
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+    regressions, slowdowns = compare(results, baseline, args.tolerance, args.gate_timings)
+    if slowdowns:
+        print("\nSlower than the baseline (not a failure, the timings depend on the machine):")
+        for slowdown in slowdowns:
+            print("  " + slowdown)
+    if regressions:
+        print("\nRENDER REGRESSIONS:", file=sys.stderr)
+        for regression in regressions:
+            print("  " + regression, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Load test of the `Menu_server`: runs `sessions` scripted clients at the same time against one server on a Unix socket, all in one event loop (one process, one core, so the clients take some of the time too).\n
+Every client answers the size query, opens a settings menu from the root menu, drags a slider, toggles a toggle, types its number into a text field, goes back, and exits, waiting for the frame after every key.\n
+The keystroke to frame latency (which includes waiting for the keys of the other sessions, and the 60 fps frame pacing of the renderers), the throughput, and the memory per session (in a second run, because tracing the allocations is slow) are shown.\n
+The process exits with 1 if a session failed, or its values ended up in an other session.\n
+Usage: `python -m benchmarks.server_load [--sessions 1000]`
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter, process_time
+
+from terminal_ui import Menu_server, Navigator, Options_menu, Session_backend, Slider, Text_field, Toggle, UI_list
+from benchmarks.run import percentile
+
+
+DOWN = b"\x1b[B"
+RIGHT = b"\x1b[C"
+ENTER = b"\n"
+ESCAPE = b"\x1b"
+
+
+def make_script(number:int):
+    """Returns the keys the client with the `number` sends."""
+    return [ENTER, RIGHT, RIGHT, RIGHT, DOWN, ENTER, DOWN] + [char.encode() for char in str(number)] + [ESCAPE, DOWN, ENTER]
+
+
+class Load_test:
+    """The server and the menus of the sessions, made for every session with `make_menu`."""
+    def __init__(self):
+        self.elements:dict[Session_backend, tuple[Slider, Toggle, Text_field]] = {}
+        self.results:list[int] = []
+        self.server = Menu_server(self.make_menu, on_done=lambda session, result: self.results.append(result))
+
+
+    def make_menu(self, session:Session_backend):
+        elements = (Slider(10, 0, "volume "), Toggle(0, "mute "), Text_field("", "name "))
+        self.elements[session] = elements
+        settings = Options_menu(list(elements), "settings")
+        return Navigator(UI_list(["settings", "exit"], "session", action_list=[settings, None]))
+
+
+async def run_client(path:str, number:int, latencies:list[float]):
+    """Runs the script of a client, and returns the number of bytes it got."""
+    reader, writer = await asyncio.open_unix_connection(path)
+    received = 0
+    try:
+        # the size query, and the first frame
+        data = await reader.read(65536)
+        received += len(data)
+        if b"\x1b[18t" in data:
+            writer.write(b"\x1b[8;24;80t")
+        while b"\x1b[H" not in data:
+            data = await reader.read(65536)
+            received += len(data)
+        for key in make_script(number):
+            start = perf_counter()
+            writer.write(key)
+            data = await reader.read(65536)
+            if not data:
+                break
+            latencies.append(perf_counter() - start)
+            received += len(data)
+        # the rest, until the server closes the connection
+        while data:
+            data = await reader.read(65536)
+            received += len(data)
+    finally:
+        writer.close()
+    return received
+
+
+async def run_load_test(sessions:int, trace_memory=False):
+    """Runs the load test, and returns the results, and the errors. (if `trace_memory` is True, the peak of the allocated memory is measured, but everything is slower)"""
+    test = Load_test()
+    latencies:list[float] = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "menu.sock")
+        await test.server.start_unix(path)
+        if trace_memory:
+            tracemalloc.start()
+        start = perf_counter()
+        cpu_start = process_time()
+        received = await asyncio.gather(*(run_client(path, x, latencies) for x in range(sessions)), return_exceptions=True)
+        total = perf_counter() - start
+        cpu = process_time() - cpu_start
+        peak = 0
+        if trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        await test.server.close()
+    errors = [f"client {x}: {result!r}" for x, result in enumerate(received) if isinstance(result, BaseException)]
+    # every session has its own values
+    for x, (slider, toggle, field) in enumerate(test.elements.values()):
+        if slider.value != 3 or toggle.value != 1 or not field.value.isdigit():
+            errors.append(f"session {x}: wrong values {slider.value} {toggle.value} {field.value!r}")
+    if sorted(int(field.value) for _, _, field in test.elements.values() if field.value.isdigit()) != list(range(sessions)):
+        errors.append("the typed numbers got mixed up between the sessions")
+    if len(test.results) != sessions or any(result != 1 for result in test.results):
+        errors.append(f"{len(test.results)} of {sessions} sessions exited normally")
+    us = 1000000
+    return {
+        "sessions": sessions,
+        "keys": len(latencies),
+        "total_ms": round(total * 1000, 1),
+        "cpu_ms": round(cpu * 1000, 1),
+        "keys_per_s": round(len(latencies) / total, 1),
+        "latency_p50_us": round(percentile(latencies, 50) * us, 1),
+        "latency_p99_us": round(percentile(latencies, 99) * us, 1),
+        "latency_max_us": round(percentile(latencies, 100) * us, 1),
+        "bytes_per_session": round(sum(result for result in received if type(result) is int) / sessions, 1),
+        "peak_kb_per_session": round(peak / 1024 / sessions, 1),
+    }, errors
+
+
+def main(argv:list[str]=None):
+    parser = argparse.ArgumentParser(description="terminal_ui menu server load test")
+    parser.add_argument("--sessions", type=int, default=1000, help="number of simultaneous sessions")
+    args = parser.parse_args(argv)
+
+    results, errors = asyncio.run(run_load_test(args.sessions))
+    memory_results, memory_errors = asyncio.run(run_load_test(args.sessions, True))
+    results["peak_kb_per_session"] = memory_results["peak_kb_per_session"]
+    errors += memory_errors
+    for name, value in results.items():
+        print(f"{name:<24} {value}")
+    for error in errors[:20]:
+        print(f"ERROR {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
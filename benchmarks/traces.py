@@ -0,0 +1,102 @@
+"""
+Recorded key traces.\n
+A trace is stored as a json file in the `traces` folder, in a run-length encoded form: [["DOWN", 500], ["ENTER", 1]]\n
+Record a new trace from the terminal with `python -m benchmarks.traces <name> [size]`, by using the menu that appears.
+"""
+import json
+import sys
+from pathlib import Path
+
+from terminal_ui import Keys, IO_backend, Terminal_backend
+
+
+TRACES_DIR = Path(__file__).parent / "traces"
+
+
+def encode_trace(keys:list[Keys]):
+    """Returns the run-length encoded form of the keys."""
+    runs = []
+    for key in keys:
+        if runs and runs[-1][0] == key.name:
+            runs[-1][1] += 1
+        else:
+            runs.append([key.name, 1])
+    return runs
+
+
+def decode_trace(runs:list[list[str|int]]):
+    """Returns the keys from the run-length encoded form."""
+    keys = []
+    for name, count in runs:
+        keys.extend([Keys[name]] * int(count))
+    return keys
+
+
+def load_trace(name:str):
+    """Returns the keys of the recorded trace."""
+    with open(TRACES_DIR / f"{name}.json", "r", encoding="utf-8") as file:
+        return decode_trace(json.load(file))
+
+
+def save_trace(name:str, keys:list[Keys]):
+    """Saves the keys as a recorded trace."""
+    TRACES_DIR.mkdir(exist_ok=True)
+    with open(TRACES_DIR / f"{name}.json", "w", encoding="utf-8") as file:
+        json.dump(encode_trace(keys), file)
+
+
+def trace_names():
+    """Returns the names of the recorded traces."""
+    return sorted(path.stem for path in TRACES_DIR.glob("*.json"))
+
+
+class Recording_backend(IO_backend):
+    """Backend that uses an other backend, and remembers every key that was read from it."""
+    def __init__(self, backend:IO_backend):
+        self.backend = backend
+        self.keys:list[Keys] = []
+
+
+    def read_key(self, key_map):
+        key = self.backend.read_key(key_map)
+        if key is not None:
+            self.keys.append(key)
+        return key
+
+
+    def key_pending(self, timeout:float=0):
+        return self.backend.key_pending(timeout)
+
+
+    async def read_key_async(self, key_map):
+        key = await self.backend.read_key_async(key_map)
+        if key is not None:
+            self.keys.append(key)
+        return key
+
+
+    async def key_pending_async(self, timeout:float=0):
+        return await self.backend.key_pending_async(timeout)
+
+
+    def write(self, text:str):
+        self.backend.write(text)
+
+
+    def terminal_size(self):
+        return self.backend.terminal_size()
+
+
+    def restore(self):
+        self.backend.restore()
+
+
+if __name__ == "__main__":
+    from benchmarks.menus import make_ui_list
+
+    name = sys.argv[1]
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    backend = Recording_backend(Terminal_backend())
+    make_ui_list(size, True).display(backend=backend)
+    save_trace(name, backend.keys)
+    print(f"Saved {len(backend.keys)} keys to {name}.json")
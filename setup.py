@@ -10,7 +10,7 @@ setup(
     author='Kalandor01',
     author_email='rohovszkyakoska@gmail.com',
 
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     
     install_requires=[
         
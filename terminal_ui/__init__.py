@@ -7,13 +7,80 @@ __version__ = "0.1"
 if __name__ == "__main__":
     from cursor import Cursor_icon
     from ui_list import UI_list, UI_list_s, UI_list_button
-    from options_ui import Base_UI, Choice, Slider, Toggle, Button, UINoSelectablesError, options_ui
+    from answer_source import Answer_source
+    from options_menu import Base_UI, Choice, Slider, Toggle, Button, Job_button, Text_field, Table, Tree, UINoSelectablesError, options_ui, options_ui_async, Options_menu
     from utils import get_key, Get_key_modes, Keys, imput
+    from key_map import Key_map
+    from backends import IO_backend, Terminal_backend, Memory_backend
+    from renderer import Renderer, Render_modes
+    from canvas import Canvas
+    from frame_writer import Frame_writer
+    from observable import Observable
+    from viewport import Viewport
+    from navigator import Navigator
+    from server import Menu_server, Session_backend
+    from jobs import Job, Job_states
+    from instrumentation import Instrumentation, Frame_stats, get_instrumentation
 else:
-    from terminal_ui.cursor import Cursor_icon
-    from terminal_ui.ui_list import UI_list, UI_list_s, UI_list_button
-    from terminal_ui.options_ui import Base_UI, Choice, Slider, Toggle, Button, UINoSelectablesError, options_ui
-    from terminal_ui.utils import get_key, Get_key_modes, Keys, imput
+    # the submodules are only imported when one of their names is first used, so importing the package (and showing one menu) stays fast
+    # (the submodule of the elements is `options_menu`, so importing it doesn't hide the `options_ui` function with the submodule)
+    from typing import TYPE_CHECKING
+
+    _LAZY_NAMES = {
+        "Cursor_icon": "cursor",
+        "UI_list": "ui_list", "UI_list_s": "ui_list", "UI_list_button": "ui_list",
+        "Answer_source": "answer_source",
+        "Base_UI": "options_menu", "Choice": "options_menu", "Slider": "options_menu", "Toggle": "options_menu", "Button": "options_menu", "Job_button": "options_menu",
+        "Text_field": "options_menu", "Table": "options_menu", "Tree": "options_menu",
+        "UINoSelectablesError": "options_menu", "options_ui": "options_menu", "options_ui_async": "options_menu", "Options_menu": "options_menu",
+        "get_key": "utils", "imput": "utils",
+        "Get_key_modes": "keys", "Keys": "keys",
+        "Key_map": "key_map",
+        "IO_backend": "backends", "Terminal_backend": "backends", "Memory_backend": "backends",
+        "Renderer": "renderer", "Render_modes": "renderer",
+        "Canvas": "canvas",
+        "Frame_writer": "frame_writer",
+        "Observable": "observable",
+        "Viewport": "viewport",
+        "Navigator": "navigator",
+        "Menu_server": "server", "Session_backend": "server",
+        "Job": "jobs", "Job_states": "jobs",
+        "Instrumentation": "instrumentation", "Frame_stats": "instrumentation", "get_instrumentation": "instrumentation",
+    }
+    __all__ = list(_LAZY_NAMES)
+
+    def __getattr__(name:str):
+        module_name = _LAZY_NAMES.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        from importlib import import_module
+        module = import_module(f"{__name__}.{module_name}")
+        # the next uses (of all names of the submodule) don't need __getattr__
+        for lazy_name, lazy_module_name in _LAZY_NAMES.items():
+            if lazy_module_name == module_name:
+                globals()[lazy_name] = getattr(module, lazy_name)
+        return globals()[name]
+
+    def __dir__():
+        return sorted(set(globals()) | set(_LAZY_NAMES))
+
+    if TYPE_CHECKING:
+        from terminal_ui.cursor import Cursor_icon
+        from terminal_ui.ui_list import UI_list, UI_list_s, UI_list_button
+        from terminal_ui.answer_source import Answer_source
+        from terminal_ui.options_menu import Base_UI, Choice, Slider, Toggle, Button, Job_button, Text_field, Table, Tree, UINoSelectablesError, options_ui, options_ui_async, Options_menu
+        from terminal_ui.utils import get_key, Get_key_modes, Keys, imput
+        from terminal_ui.key_map import Key_map
+        from terminal_ui.backends import IO_backend, Terminal_backend, Memory_backend
+        from terminal_ui.renderer import Renderer, Render_modes
+        from terminal_ui.canvas import Canvas
+        from terminal_ui.frame_writer import Frame_writer
+        from terminal_ui.observable import Observable
+        from terminal_ui.viewport import Viewport
+        from terminal_ui.navigator import Navigator
+        from terminal_ui.server import Menu_server, Session_backend
+        from terminal_ui.jobs import Job, Job_states
+        from terminal_ui.instrumentation import Instrumentation, Frame_stats, get_instrumentation
 
 
 # def over(a=5, b=1, c="def c", d="def d", e="def e", f="def f", g="def g"):
@@ -0,0 +1,178 @@
+from enum import Enum, auto
+from operator import is_
+from typing import Any, Callable
+
+from terminal_ui.run_context import Run_context, call_in_context
+# from run_context import Run_context, call_in_context
+
+
+# the flag of the code of a function, that takes **kwargs
+_CO_VARKEYWORDS = 0x08
+
+
+def accepts_argument(func:Callable, name:str):
+    """
+    Returns if the function (or method) can be called with the keyword argument `name`.\n
+    (functions and classes made for the older versions don't accept the newer arguments, and objects without code, like builtin functions, are treated as if they didn't)
+    """
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return False
+    if code.co_flags & _CO_VARKEYWORDS:
+        return True
+    return name in code.co_varnames[code.co_posonlyargcount:code.co_argcount + code.co_kwonlyargcount]
+
+
+class Action_kinds(Enum):
+    CALL = auto()
+    MENU = auto()
+    DISPLAY = auto()
+    NONE = auto()
+
+
+class Compiled_action:
+    """
+    An action of a `UI_list` or a `Button`, with the function, the arguments and the keyword arguments already separated, so running it doesn't have to look through the action again.\n
+    `kind` is `CALL` for a function (or a list with a function and its arguments), `MENU` for a nested menu (that has a `_display`), `DISPLAY` for an other object with a `display` function, and `NONE` for anything else.\n
+    The `display` function of a `DISPLAY` action only gets the arguments it accepts (`display_arguments`), because older objects only take the `key_mapping`.\n
+    The elements of a list action are remembered, so `is_valid_for` can tell if the list was changed in place.
+    """
+    __slots__ = ("source", "_items", "kind", "func", "args", "kwargs", "display_arguments")
+
+    def __init__(self, action:Callable|list[Callable|Any]|Any):
+        self.source = action
+        self._items:tuple|None = None
+        self.func:Callable|None = None
+        self.args:tuple = ()
+        self.kwargs:dict[str, Any] = {}
+        self.display_arguments:tuple[str, ...] = ()
+        # list
+        if type(action) is list and len(action) >= 2:
+            self._items = tuple(action)
+            args = []
+            for elem in action:
+                if type(elem) is dict:
+                    self.kwargs.update(elem)
+                else:
+                    args.append(elem)
+            self.kind = Action_kinds.CALL
+            self.func = args[0]
+            self.args = tuple(args[1:])
+        # normal function
+        elif callable(action):
+            self.kind = Action_kinds.CALL
+            self.func = action
+        # ui
+        elif hasattr(action, "_display"):
+            self.kind = Action_kinds.MENU
+        elif hasattr(action, "display"):
+            self.kind = Action_kinds.DISPLAY
+            self.display_arguments = tuple(name for name in ("renderer", "backend") if accepts_argument(action.display, name))
+        else:
+            self.kind = Action_kinds.NONE
+
+
+    def is_valid_for(self, action:Any):
+        """Returns if the action is still the one this was compiled from. (and a list action still has the same elements)"""
+        if action is not self.source:
+            return False
+        items = self._items
+        return items is None or (len(action) == len(items) and all(map(is_, action, items)))
+
+
+    async def call(self, ctx:Run_context, *first_args):
+        """Calls the function of a `CALL` action with `ctx.call`, with the `first_args` before the bound arguments."""
+        return await ctx.call(self.func, *first_args, *self.args, **self.kwargs)
+
+
+    def display(self, ctx:Run_context, key_mapping:Any, renderer:Any):
+        """Calls the `display` function of a `DISPLAY` action, with the `renderer` and the backend of the `ctx`, if it accepts them."""
+        kwargs = {"key_mapping": key_mapping}
+        if "renderer" in self.display_arguments:
+            kwargs["renderer"] = renderer
+        if "backend" in self.display_arguments:
+            kwargs["backend"] = ctx.backend
+        return self.source.display(**kwargs)
+
+
+class Compiled_actions:
+    """
+    The compiled actions of an action list.\n
+    An action is compiled when it's first used, and compiled again, if the element of the list (or the list action) changed since then.
+    """
+    __slots__ = ("_compiled",)
+
+    def __init__(self):
+        self._compiled:list[Compiled_action|None] = []
+
+
+    def get(self, actions:list, index:int) -> Compiled_action:
+        """Returns the compiled action of `actions[index]`."""
+        compiled_list = self._compiled
+        if len(compiled_list) > len(actions):
+            del compiled_list[len(actions):]
+        elif len(compiled_list) <= index:
+            compiled_list.extend([None] * (index + 1 - len(compiled_list)))
+        action = actions[index]
+        compiled = compiled_list[index]
+        if compiled is None or not compiled.is_valid_for(action):
+            compiled = Compiled_action(action)
+            compiled_list[index] = compiled
+        return compiled
+
+
+def get_compiled_action(compiled:Compiled_action|None, action:Any):
+    """Returns `compiled`, if it was compiled from the `action`, otherwise the newly compiled `action`."""
+    if compiled is None or not compiled.is_valid_for(action):
+        compiled = Compiled_action(action)
+    return compiled
+
+
+_accepted_arguments:dict[tuple[type, str, str], bool] = {}
+_sync_handlers:dict[type, bool] = {}
+
+
+def method_accepts(cls:type, method_name:str, argument:str):
+    """`accepts_argument` for the method of a class. (only checked once for every class)"""
+    key = (cls, method_name, argument)
+    accepts = _accepted_arguments.get(key)
+    if accepts is None:
+        accepts = accepts_argument(getattr(cls, method_name), argument)
+        _accepted_arguments[key] = accepts
+    return accepts
+
+
+def has_sync_handler(cls:type):
+    """Returns if the class overrides `_handle_action` below the class that has its `_handle_action_async`, like a subclass made for an older version, so the menus have to call `_handle_action`."""
+    sync = _sync_handlers.get(cls)
+    if sync is None:
+        sync = False
+        for base in cls.__mro__:
+            if "_handle_action_async" in base.__dict__:
+                break
+            if "_handle_action" in base.__dict__:
+                sync = True
+                break
+        _sync_handlers[cls] = sync
+    return sync
+
+
+def call_sync_handler(element:Any, first:Any, key_mapping:Any, renderer:Any, ctx:Run_context):
+    """
+    Calls the `_handle_action` of the element (a UI element or a `UI_list`), with the `renderer` and the backend of the `ctx`, if it accepts them.\n
+    If it calls the `_handle_action` of its base class without them, that still runs its actions in the `ctx`. (see `handler_context`)
+    """
+    cls = type(element)
+    kwargs = {}
+    if method_accepts(cls, "_handle_action", "renderer"):
+        kwargs["renderer"] = renderer
+    if method_accepts(cls, "_handle_action", "backend"):
+        kwargs["backend"] = ctx.backend
+    return call_in_context(ctx, element._handle_action, first, key_mapping, **kwargs)
+
+
+async def handle_action(element:Any, first:Any, key_mapping:Any, renderer:Any, ctx:Run_context):
+    """Runs the `_handle_action_async` of the element (a UI element or a `UI_list`), or its `_handle_action`, if a subclass overrides only that."""
+    if has_sync_handler(type(element)):
+        return call_sync_handler(element, first, key_mapping, renderer, ctx)
+    return await element._handle_action_async(first, key_mapping, renderer, ctx)
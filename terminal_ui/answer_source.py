@@ -0,0 +1,180 @@
+from collections import OrderedDict
+from typing import Callable, Sequence
+
+
+class Answer_source:
+    """
+    Lazy answers for a `UI_list`, so only the answers that are displayed get fetched and converted to strings.\n
+    `source` is either a sequence (anything with `__len__` and `__getitem__`), or a `fetch(offset, count)` function, that returns (at most) `count` answers from `offset`.\n
+    `length` is the number of answers a `fetch` function has. If it's None, the length is unknown, and it's found out while fetching (a page with less than `page_size` answers is the last one). Until then, the length is the number of answers that were found so far.\n
+    The answers are fetched in pages of `page_size`, and the `cache_pages` most recently used pages are kept.\n
+    Like in a `UI_list`, a None answer is a blank line that can't be selected.\n
+    It also finds the selectable answers for the `UI_list` (instead of a `Selectable_index`), by only looking at the pages around the selection.
+    (only wrapping around upwards and `exclude_nones` need every page until the end or the selected answer)\n
+    Use it with `scroll=True`, otherwise every answer is displayed, so every page is fetched.\n
+    If the answers change, call `invalidate`.
+    """
+    __slots__ = ("_sequence", "_fetch", "_given_length", "_length", "_found_length", "page_size", "cache_pages", "_pages")
+
+    def __init__(self, source:Sequence|Callable[[int, int], Sequence], length:int=None, page_size=100, cache_pages=16):
+        if callable(source) and not hasattr(source, "__getitem__"):
+            self._sequence = None
+            self._fetch = source
+            self._given_length = None if length is None else int(length)
+        else:
+            self._sequence = source
+            self._fetch = self._fetch_sequence
+            self._given_length = None
+        self._length = self._given_length
+        self._found_length = 0
+        self.page_size = max(int(page_size), 1)
+        self.cache_pages = max(int(cache_pages), 1)
+        self._pages:OrderedDict[int, tuple[str|None, ...]] = OrderedDict()
+
+
+    def _fetch_sequence(self, offset:int, count:int):
+        return [self._sequence[x] for x in range(offset, min(offset + count, len(self._sequence)))]
+
+
+    def _get_length(self):
+        """Returns the length, if it's known, otherwise None."""
+        if self._sequence is not None:
+            return len(self._sequence)
+        return self._length
+
+
+    @property
+    def length_known(self):
+        """If the number of answers is known. (otherwise `len` is only the number of answers that were found so far)"""
+        return self._get_length() is not None
+
+
+    def invalidate(self):
+        """Forgets the fetched pages (and the found length of an unknown length `fetch`)."""
+        self._pages.clear()
+        self._length = self._given_length
+        self._found_length = 0
+
+
+    def _get_page(self, page_number:int):
+        """Returns the answers of the page (fetching it, if it's not cached)."""
+        page = self._pages.get(page_number)
+        if page is not None:
+            self._pages.move_to_end(page_number)
+            return page
+        start = page_number * self.page_size
+        length = self._get_length()
+        if length is not None and start >= length:
+            return ()
+        count = self.page_size if length is None else min(self.page_size, length - start)
+        page = tuple((answer if answer is None else str(answer)) for answer in self._fetch(start, count))[:count]
+        if self._get_length() is None:
+            if len(page) < self.page_size:
+                self._length = start + len(page)
+            self._found_length = max(self._found_length, start + len(page))
+        self._pages[page_number] = page
+        if len(self._pages) > self.cache_pages:
+            self._pages.popitem(last=False)
+        return page
+
+
+    def _get_full_length(self):
+        """Returns the length, fetching every page until the end, if it's not known."""
+        page_number = self._found_length // self.page_size
+        while self._get_length() is None:
+            self._get_page(page_number)
+            page_number += 1
+        return self._get_length()
+
+
+    def __len__(self):
+        length = self._get_length()
+        if length is None:
+            if not self._found_length:
+                self._get_page(0)
+            length = self._get_length()
+            if length is None:
+                return self._found_length
+        return length
+
+
+    def __getitem__(self, index:int) -> str|None:
+        if index < 0:
+            index += self._get_full_length()
+        if index < 0:
+            raise IndexError("answer index out of range")
+        page = self._get_page(index // self.page_size)
+        offset = index % self.page_size
+        if offset >= len(page):
+            raise IndexError("answer index out of range")
+        return page[offset]
+
+
+    def __iter__(self):
+        page_number = 0
+        while True:
+            page = self._get_page(page_number)
+            yield from page
+            if len(page) < self.page_size:
+                return
+            page_number += 1
+
+
+    def _find(self, index:int, step:int):
+        """Returns the index of the first not None answer from `index`, going forward if `step` is 1, or backward if it's -1, (without wrapping around) or -1 if there is none."""
+        while index >= 0:
+            page_number = index // self.page_size
+            page = self._get_page(page_number)
+            start = page_number * self.page_size
+            if index - start >= len(page):
+                return -1
+            if step > 0:
+                for x in range(index - start, len(page)):
+                    if page[x] is not None:
+                        return start + x
+                if len(page) < self.page_size:
+                    return -1
+                index = start + self.page_size
+            else:
+                for x in range(index - start, -1, -1):
+                    if page[x] is not None:
+                        return start + x
+                index = start - 1
+        return -1
+
+
+    def first(self, index:int=0):
+        """Returns the first selectable index from `index` (wrapping around), or -1 if there are no selectable answers."""
+        if index > 0:
+            found = self._find(index, 1)
+            if found != -1:
+                return found
+        return self._find(0, 1)
+
+
+    def next(self, index:int):
+        """Returns the next selectable index after `index` (wrapping around), or -1 if there are no selectable answers."""
+        return self.first(index + 1)
+
+
+    def previous(self, index:int):
+        """Returns the previous selectable index before `index` (wrapping around), or -1 if there are no selectable answers."""
+        if index > 0:
+            found = self._find(index - 1, -1)
+            if found != -1:
+                return found
+        return self._find(self._get_full_length() - 1, -1)
+
+
+    def nones_before(self, index:int):
+        """Returns the number of `None` answers before `index`."""
+        nones = 0
+        page_number = 0
+        while page_number * self.page_size < index:
+            page = self._get_page(page_number)
+            end = min(index - page_number * self.page_size, len(page))
+            nones += page[:end].count(None)
+            if len(page) < self.page_size:
+                break
+            page_number += 1
+        return nones
@@ -0,0 +1,247 @@
+from collections import deque
+from io import StringIO
+from shutil import get_terminal_size
+from typing import Callable, Iterable
+
+from terminal_ui.keys import Get_key_modes, Keys, IGNORED_KEYS
+from terminal_ui.key_map import Key_map
+from terminal_ui.key_readers import get_key_reader
+from terminal_ui.frame_writer import Frame_writer
+from terminal_ui.layout import on_resize
+# from keys import Get_key_modes, Keys, IGNORED_KEYS
+# from key_map import Key_map
+# from key_readers import get_key_reader
+# from frame_writer import Frame_writer
+# from layout import on_resize
+
+
+class IO_backend:
+    """
+    Base class for the objects that the UI elements read keys from, and write their frames to.
+    """
+    def read_key(self, key_map:Key_map) -> Keys|str|None:
+        """Waits for one key sequence, and returns the key it means (or the typed character, if the `key_map` is a text key map), or None if it's not in the `key_map`."""
+        raise NotImplementedError
+
+
+    def key_pending(self, timeout:float=0) -> bool:
+        """Returns if there are keys that can be read without waiting, after waiting at most `timeout` seconds for them."""
+        return False
+
+
+    def get_key(self, mode:Get_key_modes, key_map:Key_map) -> Keys|str:
+        """Waits for a key that is in the `key_map`, and not ignored by the `mode`."""
+        ignored = IGNORED_KEYS[mode]
+        while True:
+            key = self.read_key(key_map)
+            if key is not None and key not in ignored:
+                return key
+
+
+    def poll_key(self, mode:Get_key_modes, key_map:Key_map, timeout:float=0) -> Keys|str|None:
+        """Returns the next key that is in the `key_map`, and not ignored by the `mode`, if it comes in `timeout` seconds, otherwise None."""
+        ignored = IGNORED_KEYS[mode]
+        while self.key_pending(timeout):
+            key = self.read_key(key_map)
+            if key is not None and key not in ignored:
+                return key
+        return None
+
+
+    async def read_key_async(self, key_map:Key_map) -> Keys|str|None:
+        """Like `read_key`, but lets the event loop run while waiting. (by default, it just calls `read_key`)"""
+        return self.read_key(key_map)
+
+
+    async def key_pending_async(self, timeout:float=0) -> bool:
+        """Like `key_pending`, but lets the event loop run while waiting. (by default, it just calls `key_pending`)"""
+        return self.key_pending(timeout)
+
+
+    async def get_key_async(self, mode:Get_key_modes, key_map:Key_map) -> Keys|str:
+        """Like `get_key`, but lets the event loop run while waiting."""
+        ignored = IGNORED_KEYS[mode]
+        while True:
+            key = await self.read_key_async(key_map)
+            if key is not None and key not in ignored:
+                return key
+
+
+    async def poll_key_async(self, mode:Get_key_modes, key_map:Key_map, timeout:float=0) -> Keys|str|None:
+        """Like `poll_key`, but lets the event loop run while waiting."""
+        ignored = IGNORED_KEYS[mode]
+        while await self.key_pending_async(timeout):
+            key = await self.read_key_async(key_map)
+            if key is not None and key not in ignored:
+                return key
+        return None
+
+
+    def write(self, text:str):
+        """Writes the text to the output."""
+        raise NotImplementedError
+
+
+    def terminal_size(self) -> tuple[int, int]:
+        """Returns the size of the output in (columns, lines)."""
+        return (80, 24)
+
+
+    def restore(self):
+        """Called before running an action that could use the terminal, and when a menu exits."""
+        pass
+
+
+class Terminal_backend(IO_backend):
+    """
+    Backend that reads the keys from the terminal (with the key reader of the platform), and writes the frames to `sys.stdout` (or to `fd`) with a `Frame_writer`.\n
+    If `synchronized` is True, the frames are written as synchronized updates, so they don't tear.\n
+    The size of the terminal is only asked for again, when it's resized (if the resizes can be watched with `SIGWINCH`). The resizes are only watched until `restore`, so a backend that isn't used anymore isn't kept alive by them.\n
+    The async methods wait for the keys without blocking the event loop.
+    """
+    def __init__(self, fd:int=None, synchronized=False):
+        self.writer = Frame_writer(fd, synchronized)
+        self._size:tuple[int, int]|None = None
+        # removes the resize callback (None while the resizes aren't watched)
+        self._stop_watching_size:Callable[[], None]|None = None
+
+
+    def _forget_size(self):
+        self._size = None
+
+
+    def read_key(self, key_map:Key_map):
+        return get_key_reader().read_key(key_map)
+
+
+    def key_pending(self, timeout:float=0):
+        return get_key_reader().key_pending(timeout)
+
+
+    async def read_key_async(self, key_map:Key_map):
+        return await get_key_reader().read_key_async(key_map)
+
+
+    async def key_pending_async(self, timeout:float=0):
+        return await get_key_reader().key_pending_async(timeout)
+
+
+    def write(self, text:str):
+        self.writer.write(text)
+
+
+    def terminal_size(self):
+        size = self._size
+        if size is None:
+            size = tuple(get_terminal_size())
+            if self._stop_watching_size is None:
+                self._stop_watching_size = on_resize(self._forget_size)
+            if self._stop_watching_size is not None:
+                self._size = size
+        return size
+
+
+    def restore(self):
+        get_key_reader().restore()
+        if self._stop_watching_size is not None:
+            self._stop_watching_size()
+            self._stop_watching_size = None
+        # (the terminal can be resized before the backend is used again)
+        self._size = None
+
+
+class Memory_backend(IO_backend):
+    """
+    Backend that reads the keys from the `keys` iterable, and writes into a buffer, so menus can be used without a terminal.\n
+    The `keys` can also contain strings, as typed characters. (they are skipped, if the key map is not a text key map)\n
+    When the `keys` run out, `get_key` (or waiting for more than `key_delay` seconds in `key_pending`) throws an `EOFError`.\n
+    If `buffered` is True, all of the keys count as already pressed (like a key-repeat flood), so they get applied together. If it's False, they act like they were typed `key_delay` seconds apart: a key is only pending after `key_pending` waited that long for it since the last key. (the time is simulated, so `key_pending` never actually waits)\n
+    If `capture` is False, the written text is thrown away, and only counted in `bytes_written`, `last_frame_bytes` and `writes`.\n
+    `columns` and `lines` is the size of the fake terminal.
+    """
+    def __init__(self, keys:Iterable[Keys|str]=(), capture=True, columns=80, lines=24, buffered=True, key_delay=0.05):
+        self.keys = iter(keys)
+        self.buffered = bool(buffered)
+        self.key_delay = float(key_delay)
+        self.capture = bool(capture)
+        self.columns = int(columns)
+        self.lines = int(lines)
+        self.buffer = StringIO()
+        self.bytes_written = 0
+        self.last_frame_bytes = 0
+        self.writes = 0
+        self.keys_read = 0
+        self._peeked:deque[Keys|str] = deque()
+        self._waited = 0.0
+
+
+    def add_keys(self, keys:Iterable[Keys|str]):
+        """Adds more keys to the end of the keys that can be read."""
+        self._peeked.extend(self.keys)
+        self._peeked.extend(keys)
+
+
+    def _next_key(self):
+        if self._peeked:
+            return self._peeked.popleft()
+        try:
+            return next(self.keys)
+        except StopIteration:
+            raise EOFError("The keys of the memory backend ran out.")
+
+
+    def read_key(self, key_map:Key_map):
+        key = self._next_key()
+        self.keys_read += 1
+        self._waited = 0.0
+        if type(key) is str and not key_map.text:
+            return None
+        return key
+
+
+    def _has_keys(self):
+        if self._peeked:
+            return True
+        for key in self.keys:
+            self._peeked.append(key)
+            return True
+        return False
+
+
+    def key_pending(self, timeout:float=0):
+        if self.buffered and self._has_keys():
+            return True
+        self._waited += timeout
+        if self._waited < self.key_delay:
+            return False
+        if not self._has_keys():
+            raise EOFError("The keys of the memory backend ran out.")
+        return True
+
+
+    def write(self, text:str):
+        self.last_frame_bytes = len(text.encode())
+        self.bytes_written += self.last_frame_bytes
+        self.writes += 1
+        if self.capture:
+            self.buffer.write(text)
+
+
+    def terminal_size(self):
+        return (self.columns, self.lines)
+
+
+    def getvalue(self):
+        """Returns everything that was written to the backend."""
+        return self.buffer.getvalue()
+
+
+_terminal_backend:Terminal_backend = None
+
+
+def get_terminal_backend():
+    """Returns the (shared) backend of the terminal."""
+    global _terminal_backend
+    if _terminal_backend is None:
+        _terminal_backend = Terminal_backend()
+    return _terminal_backend
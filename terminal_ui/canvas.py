@@ -0,0 +1,242 @@
+from array import array
+
+from terminal_ui.layout import char_width, split_sgr
+# from layout import char_width, split_sgr
+
+
+def _apply_sgr(attr:str, codes:str):
+    """Returns the attribute, after the SGR escape sequence with the `codes` (like "1;31")."""
+    if codes in ("", "0"):
+        return ""
+    if codes.startswith("0;"):
+        return codes[2:]
+    return f"{attr};{codes}" if attr else codes
+
+
+class Canvas:
+    """
+    A grid of character cells (with SGR attributes, like "1;31"), that remembers what was flushed to the terminal, and only writes the cells that changed since then.\n
+    The parts that were drawn on are tracked as dirty rectangles, so `flush` only compares the cells in them.\n
+    A wide character takes up 2 cells. (the second one is an empty string)
+    """
+    __slots__ = ("columns", "lines", "_chars", "_attrs", "_front_chars", "_front_attrs", "_attr_table", "_attr_codes", "_dirty")
+
+    def __init__(self, columns:int, lines:int):
+        self.columns = max(int(columns), 1)
+        self.lines = max(int(lines), 1)
+        size = self.columns * self.lines
+        self._chars:list[str] = [" "] * size
+        self._attrs = array("H", bytes(2 * size))
+        # what the terminal displays (None if it's unknown)
+        self._front_chars:list[str|None] = [None] * size
+        self._front_attrs = array("H", bytes(2 * size))
+        self._attr_table:list[str] = [""]
+        self._attr_codes:dict[str, int] = {"": 0}
+        self._dirty:list[tuple[int, int, int, int]] = [(0, 0, self.columns, self.lines)]
+
+
+    def _attr_code(self, attr:str):
+        code = self._attr_codes.get(attr)
+        if code is None:
+            code = len(self._attr_table)
+            self._attr_table.append(attr)
+            self._attr_codes[attr] = code
+        return code
+
+
+    def mark_dirty(self, x:int, y:int, width:int, height:int):
+        """Marks the rectangle as changed, so `flush` checks its cells."""
+        x_end = min(x + width, self.columns)
+        y_end = min(y + height, self.lines)
+        x = max(x, 0)
+        y = max(y, 0)
+        if x < x_end and y < y_end:
+            self._dirty.append((x, y, x_end, y_end))
+
+
+    def invalidate(self):
+        """Forgets what the terminal displays, so the next `flush` writes every cell."""
+        self._front_chars = [None] * len(self._chars)
+        self._dirty = [(0, 0, self.columns, self.lines)]
+
+
+    def mark_flushed(self):
+        """Tells the canvas, that the terminal displays the cells as they are now. (if they were written some other way)"""
+        self._front_chars = list(self._chars)
+        self._front_attrs = array("H", self._attrs)
+        self._dirty.clear()
+
+
+    def resize(self, columns:int, lines:int):
+        """Changes the size of the canvas, keeping the cells that are still on it, and forgets what the terminal displays."""
+        old_columns = self.columns
+        old_chars = self._chars
+        old_attrs = self._attrs
+        self.columns = max(int(columns), 1)
+        self.lines = max(int(lines), 1)
+        size = self.columns * self.lines
+        self._chars = [" "] * size
+        self._attrs = array("H", bytes(2 * size))
+        for y in range(min(self.lines, len(old_chars) // old_columns)):
+            width = min(self.columns, old_columns)
+            self._chars[y * self.columns:y * self.columns + width] = old_chars[y * old_columns:y * old_columns + width]
+            self._attrs[y * self.columns:y * self.columns + width] = old_attrs[y * old_columns:y * old_columns + width]
+            # a wide character that got cut in half
+            if width < old_columns and self._chars[y * self.columns + width - 1] != "" and old_chars[y * old_columns + width] == "":
+                self._chars[y * self.columns + width - 1] = " "
+        self._front_attrs = array("H", bytes(2 * size))
+        self.invalidate()
+
+
+    def _set(self, index:int, char:str, code:int):
+        self._chars[index] = char
+        self._attrs[index] = code
+
+
+    def put(self, x:int, y:int, text:str, attr=""):
+        """
+        Writes the (one line) text onto the canvas from the cell at `x`, `y`, cutting it off at the edge. Returns the `x` after the text.\n
+        The color and style escape sequences in the text change the attribute of the text after them, instead of being written into the cells.
+        """
+        if not 0 <= y < self.lines:
+            return x
+        if "\x1b" in text:
+            for number, part in enumerate(split_sgr(text)):
+                if number % 2:
+                    attr = _apply_sgr(attr, part[2:-1])
+                elif part:
+                    x = self.put(x, y, part, attr)
+            return x
+        code = self._attr_code(attr)
+        row = y * self.columns
+        chars = self._chars
+        start = x
+        for char in text:
+            if x >= self.columns:
+                break
+            width = char_width(char)
+            if width == 0:
+                # combining characters go into the previous cell
+                if x > 0 and x - 1 >= start:
+                    index = row + x - 1
+                    if chars[index] == "" and x > 1:
+                        index -= 1
+                    chars[index] += char
+                continue
+            if x < 0:
+                x += width
+                start = x
+                continue
+            if width == 2 and x + 1 >= self.columns:
+                break
+            # don't leave half of a wide character behind
+            if chars[row + x] == "" and x > 0:
+                self._set(row + x - 1, " ", self._attrs[row + x - 1])
+                start = min(start, x - 1)
+            end = x + width
+            if end < self.columns and chars[row + end] == "":
+                self._set(row + end, " ", self._attrs[row + end])
+            self._set(row + x, char, code)
+            if width == 2:
+                self._set(row + x + 1, "", code)
+            x = end
+        self.mark_dirty(start, y, x - start + 1, 1)
+        return x
+
+
+    def put_line(self, y:int, text:str, attr=""):
+        """Writes the text as the whole line `y`, clearing the rest of the line."""
+        end = self.put(0, y, text, attr)
+        if end < self.columns:
+            self.fill(end, y, self.columns - end, 1)
+
+
+    def fill(self, x:int, y:int, width:int, height:int, char=" ", attr=""):
+        """Fills the rectangle with the (one cell wide) character."""
+        code = self._attr_code(attr)
+        x_end = min(x + width, self.columns)
+        x = max(x, 0)
+        if x >= x_end:
+            return
+        for row_y in range(max(y, 0), min(y + height, self.lines)):
+            row = row_y * self.columns
+            # don't leave half of a wide character behind
+            if x > 0 and self._chars[row + x] == "":
+                self._set(row + x - 1, " ", self._attrs[row + x - 1])
+            if x_end < self.columns and self._chars[row + x_end] == "":
+                self._set(row + x_end, " ", self._attrs[row + x_end])
+            for index in range(row + x, row + x_end):
+                self._set(index, char, code)
+        self.mark_dirty(x - 1, y, x_end - x + 2, height)
+
+
+    def clear(self):
+        """Fills the whole canvas with spaces."""
+        self.fill(0, 0, self.columns, self.lines)
+
+
+    def text(self):
+        """Returns the characters of the canvas as lines of text. (without the attributes)"""
+        return "\n".join("".join(self._chars[y * self.columns:(y + 1) * self.columns]) for y in range(self.lines))
+
+
+    def flush(self):
+        """Returns the text that makes the terminal display the canvas, by only writing the cells in the dirty rectangles, that changed since the last flush."""
+        if not self._dirty:
+            return ""
+        # the dirty part of every line
+        spans:dict[int, list[int]] = {}
+        for x, y, x_end, y_end in self._dirty:
+            for row_y in range(y, y_end):
+                span = spans.get(row_y)
+                if span is None:
+                    spans[row_y] = [x, x_end]
+                else:
+                    span[0] = min(span[0], x)
+                    span[1] = max(span[1], x_end)
+        self._dirty.clear()
+        chars = self._chars
+        attrs = self._attrs
+        front_chars = self._front_chars
+        front_attrs = self._front_attrs
+        out = []
+        position = None
+        # (every flush ends with the default attributes)
+        current_code = 0
+        for y in sorted(spans):
+            x, x_end = spans[y]
+            row = y * self.columns
+            # start at the start of a wide character
+            if x > 0 and chars[row + x] == "":
+                x -= 1
+            while x < x_end:
+                index = row + x
+                char = chars[index]
+                if char == front_chars[index] and attrs[index] == front_attrs[index]:
+                    x += 1
+                    continue
+                if char == "":
+                    # the second half of a wide character, that is written with the first half
+                    front_chars[index] = char
+                    front_attrs[index] = attrs[index]
+                    x += 1
+                    continue
+                if position != (x, y):
+                    out.append(f"\x1b[{y + 1};{x + 1}H")
+                code = attrs[index]
+                if code != current_code:
+                    attr = self._attr_table[code]
+                    out.append(f"\x1b[0;{attr}m" if attr else "\x1b[0m")
+                    current_code = code
+                out.append(char)
+                front_chars[index] = char
+                front_attrs[index] = code
+                x += 2 if (x + 1 < self.columns and chars[index + 1] == "") else 1
+                if x - 1 < self.columns and chars[row + x - 1] == "":
+                    front_chars[row + x - 1] = ""
+                    front_attrs[row + x - 1] = code
+                position = (x, y)
+        if current_code > 0:
+            out.append("\x1b[0m")
+        return "".join(out)
+
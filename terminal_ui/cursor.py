@@ -1,9 +1,33 @@
-
 class Cursor_icon():
-    """Cursor icon object for UI objects."""
+    """
+    Cursor icon object for UI objects.\n
+    The object is immutable, so the same cursor icon can be shared between any number of UI objects.
+    """
+    __slots__ = ("s_icon", "s_icon_r", "icon", "icon_r")
 
     def __init__(self, selected_icon:str = ">", selected_icon_right:str = "", not_selected_icon:str = " ", not_selected_icon_right:str = ""):
-        self.s_icon = str(selected_icon)
-        self.s_icon_r = str(selected_icon_right)
-        self.icon = str(not_selected_icon)
-        self.icon_r = str(not_selected_icon_right)
\ No newline at end of file
+        object.__setattr__(self, "s_icon", str(selected_icon))
+        object.__setattr__(self, "s_icon_r", str(selected_icon_right))
+        object.__setattr__(self, "icon", str(not_selected_icon))
+        object.__setattr__(self, "icon_r", str(not_selected_icon_right))
+
+
+    def __setattr__(self, name:str, value):
+        raise AttributeError("Cursor_icon objects are immutable")
+
+
+    def __delattr__(self, name:str):
+        raise AttributeError("Cursor_icon objects are immutable")
+
+
+    def __eq__(self, other:object):
+        if not isinstance(other, Cursor_icon):
+            return NotImplemented
+        return (self.s_icon, self.s_icon_r, self.icon, self.icon_r) == (other.s_icon, other.s_icon_r, other.icon, other.icon_r)
+
+
+    def __hash__(self):
+        return hash((self.s_icon, self.s_icon_r, self.icon, self.icon_r))
+
+
+DEFAULT_CURSOR_ICON = Cursor_icon()
@@ -0,0 +1,62 @@
+import os
+import sys
+
+
+SYNC_BEGIN = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+
+
+class Frame_writer:
+    """
+    Writes the rendered frames to a file descriptor, with one `os.write` per frame (encoded once), instead of through the text layer of `sys.stdout`.\n
+    `fd` is the file descriptor to write to. If it's None, it's the one of `sys.stdout` (if it has one, otherwise the frames are written to `sys.stdout` itself).\n
+    If `synchronized` is True, every frame is wrapped in the synchronized update sequences, so the terminals that support them display the frame at once, instead of tearing in the middle of it. (the others ignore them)\n
+    `last_frame_bytes` is the number of bytes the last frame was, `bytes_written` and `frames` are the totals.
+    """
+    __slots__ = ("fd", "synchronized", "encoding", "last_frame_bytes", "bytes_written", "frames")
+
+    def __init__(self, fd:int=None, synchronized=False, encoding="utf-8"):
+        self.fd = fd
+        self.synchronized = bool(synchronized)
+        self.encoding = str(encoding)
+        self.last_frame_bytes = 0
+        self.bytes_written = 0
+        self.frames = 0
+
+
+    def _get_fd(self):
+        """Returns the file descriptor to write to, or None if the frames should go to `sys.stdout`."""
+        if self.fd is not None:
+            return self.fd
+        # the windows console needs the text layer for the non ascii characters
+        if os.name == "nt":
+            return None
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, ValueError, OSError):
+            return None
+        # what was printed before has to come before the frame
+        sys.stdout.flush()
+        return fd
+
+
+    def write(self, text:str):
+        """Writes the frame (if it's not empty), and returns how many bytes it was."""
+        if not text:
+            self.last_frame_bytes = 0
+            return 0
+        if self.synchronized:
+            text = SYNC_BEGIN + text + SYNC_END
+        data = text.encode(self.encoding, "replace")
+        fd = self._get_fd()
+        if fd is None:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        else:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        self.last_frame_bytes = len(data)
+        self.bytes_written += len(data)
+        self.frames += 1
+        return len(data)
@@ -0,0 +1,182 @@
+import os
+from collections import deque
+from threading import Lock
+from time import perf_counter, time
+from typing import Any, Callable
+
+
+ENV_VARIABLE = "TERMINAL_UI_INSTRUMENT"
+
+
+class Frame_stats:
+    """
+    The measurements of one frame of a menu.\n
+    `build_time` is how long making the text of the frame took, `write_time` is how long rendering and writing it took, `key_wait_time` is how long the menu was blocked waiting for keys since the last frame, `keys` is how many keys it got in that time, and `bytes` is the size of the written frame.\n
+    `latency` is the time from the first key after the last frame to the end of writing this frame (None if the frame wasn't caused by a key). The times are in seconds.
+    """
+    __slots__ = ("time", "menu", "build_time", "write_time", "key_wait_time", "keys", "bytes", "latency")
+    FIELDS = __slots__
+
+    def __init__(self, menu:str, build_time:float, write_time:float, key_wait_time:float, keys:int, bytes:int, latency:float|None):
+        self.time = time()
+        self.menu = menu
+        self.build_time = build_time
+        self.write_time = write_time
+        self.key_wait_time = key_wait_time
+        self.keys = keys
+        self.bytes = bytes
+        self.latency = latency
+
+
+    def as_dict(self) -> dict[str, Any]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+class Frame_probe:
+    """
+    Measures the frames of the menus that run with one `Run_context`, and gives them to the `instrumentation`.\n
+    (the menus call it, only if instrumentation was enabled when the `Run_context` was made)
+    """
+    __slots__ = ("instrumentation", "_key_wait", "_keys", "_first_key", "_start", "_built")
+
+    def __init__(self, instrumentation:"Instrumentation"):
+        self.instrumentation = instrumentation
+        self._key_wait = 0.0
+        self._keys = 0
+        self._first_key:float|None = None
+        self._start = 0.0
+        self._built = 0.0
+
+
+    def key_waited(self, start:float, key:Any):
+        """Called after the menu waited for a key from `start`. (`key` is None if none came)"""
+        now = perf_counter()
+        self._key_wait += now - start
+        if key is not None:
+            self._keys += 1
+            if self._first_key is None:
+                self._first_key = now
+
+
+    def frame_start(self):
+        self._start = perf_counter()
+
+
+    def frame_built(self):
+        self._built = perf_counter()
+
+
+    def frame_written(self, menu:str|None, out:str):
+        """Called after the frame was written, with the title of the menu and the written text."""
+        now = perf_counter()
+        stats = Frame_stats(
+            "" if menu is None else str(menu).split("\n", 1)[0],
+            self._built - self._start,
+            now - self._built,
+            self._key_wait,
+            self._keys,
+            len(out.encode()),
+            None if self._first_key is None else now - self._first_key)
+        self._key_wait = 0.0
+        self._keys = 0
+        self._first_key = None
+        self.instrumentation.record(stats)
+
+
+class Instrumentation:
+    """
+    Collects the measurements of the frames of the menus (`Frame_stats`), if it's enabled.\n
+    It's enabled by default, if the `TERMINAL_UI_INSTRUMENT` environment variable is set (and not "0"), or with `enable`. Only the menus that start while it's enabled are measured, and when it's disabled, they only check that it's off.\n
+    The last `max_records` frames are kept, and every frame is also given to the callbacks. (in the thread of the menu, so they should be fast)
+    """
+    __slots__ = ("enabled", "records", "_callbacks", "_lock")
+
+    def __init__(self, enabled=False, max_records=10000):
+        self.enabled = bool(enabled)
+        self.records:deque[Frame_stats] = deque(maxlen=max_records)
+        self._callbacks:list[Callable[[Frame_stats], Any]] = []
+        self._lock = Lock()
+
+
+    def enable(self):
+        self.enabled = True
+
+
+    def disable(self):
+        self.enabled = False
+
+
+    def make_probe(self):
+        """Returns a new `Frame_probe` if the instrumentation is enabled, otherwise None."""
+        return Frame_probe(self) if self.enabled else None
+
+
+    def add_callback(self, callback:Callable[[Frame_stats], Any]):
+        """Calls the `callback` with every new `Frame_stats`. Returns a function that removes it."""
+        with self._lock:
+            self._callbacks.append(callback)
+        return lambda: self.remove_callback(callback)
+
+
+    def remove_callback(self, callback:Callable[[Frame_stats], Any]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+
+    def record(self, stats:Frame_stats):
+        with self._lock:
+            self.records.append(stats)
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(stats)
+
+
+    def clear(self):
+        """Forgets the recorded frames."""
+        with self._lock:
+            self.records.clear()
+
+
+    def summary(self) -> dict[str, float]:
+        """Returns the number of frames and keys, the bytes written, and the median and the 99th percentile of the build time, the write time and the latency of the recorded frames."""
+        with self._lock:
+            records = list(self.records)
+        result:dict[str, float] = {
+            "frames": len(records),
+            "keys": sum(stats.keys for stats in records),
+            "bytes": sum(stats.bytes for stats in records),
+        }
+        for field in ("build_time", "write_time", "latency"):
+            values = sorted(getattr(stats, field) for stats in records if getattr(stats, field) is not None)
+            for name, percent in (("p50", 50), ("p99", 99)):
+                result[f"{field}_{name}"] = values[min(len(values) * percent // 100, len(values) - 1)] if values else 0.0
+        return result
+
+
+    def export_json(self, path:str|os.PathLike):
+        """Writes the recorded frames into a json file, as a list of objects."""
+        import json
+        with self._lock:
+            records = [stats.as_dict() for stats in self.records]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(records, file, indent=4)
+
+
+    def export_csv(self, path:str|os.PathLike):
+        """Writes the recorded frames into a csv file, with a header line."""
+        import csv
+        with self._lock:
+            records = [stats.as_dict() for stats in self.records]
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, Frame_stats.FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+
+
+_instrumentation = Instrumentation(os.environ.get(ENV_VARIABLE, "0") not in ("", "0"))
+
+
+def get_instrumentation():
+    """Returns the (shared) instrumentation of the menus."""
+    return _instrumentation
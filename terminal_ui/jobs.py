@@ -0,0 +1,144 @@
+from enum import Enum, auto
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+
+class Job_states(Enum):
+    IDLE = auto()
+    RUNNING = auto()
+    DONE = auto()
+    FAILED = auto()
+    CANCELLED = auto()
+
+
+_default_executor:"ThreadPoolExecutor|None" = None
+_default_executor_lock = Lock()
+
+
+def get_default_executor():
+    """Returns the thread pool that runs the jobs, that don't have an executor. (it's only made when it's first needed)"""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            # (concurrent.futures is only imported when the first job starts, because importing it is slow)
+            from concurrent.futures import ThreadPoolExecutor
+            _default_executor = ThreadPoolExecutor(thread_name_prefix="terminal_ui_job")
+        return _default_executor
+
+
+class Job:
+    """
+    A function, that runs in the background (in the `executor`, or in a shared thread pool), so the menu that started it keeps working while it runs.\n
+    A job can be used as an action of a `UI_list` or a `Button` (calling it starts it, and returns immediately), or with a `Job_button`, that also displays its state.\n
+    The arguments the menu passes to the action (like with `modify_list`) come before `args`.\n
+    `state` is one of the `Job_states`, `result` is what the function returned, and `error` is the exception it raised.\n
+    If `pass_job` is True, the function also gets the job as the `job` keyword argument, so it can set the `progress` (from 0 to 1) and check `cancel_requested`. (only with a thread pool, because the job can't be sent to an other process)\n
+    `cancel` stops a job that didn't start yet, and asks a running job to stop. (a running function can only be stopped by itself, so if it doesn't check `cancel_requested`, it runs to the end, but its result is thrown away)\n
+    `on_done` is called with the job (in the thread that ran it) when it finished, failed or got cancelled.\n
+    A job can run again after it ended, but only once at the same time. (use more jobs to run a function more times at once)
+    """
+    __slots__ = ("func", "args", "kwargs", "executor", "pass_job", "on_done", "state", "result", "error", "progress", "_future", "_cancel", "_ended", "_lock")
+
+    def __init__(self, func:Callable, *args, executor:"Executor"=None, pass_job=False, on_done:Callable[["Job"], Any]=None, **kwargs):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.executor = executor
+        self.pass_job = bool(pass_job)
+        self.on_done = on_done
+        self.state = Job_states.IDLE
+        self.result:Any = None
+        self.error:BaseException|None = None
+        self.progress:float|None = None
+        self._future:"Future|None" = None
+        self._cancel = Event()
+        self._ended = Event()
+        self._lock = Lock()
+
+
+    @property
+    def running(self):
+        """If the job is waiting to run, or running."""
+        return self.state == Job_states.RUNNING
+
+
+    @property
+    def cancel_requested(self):
+        """If `cancel` was called since the job started."""
+        return self._cancel.is_set()
+
+
+    def start(self, *first_args):
+        """Starts the job (with the `first_args` before `args`), if it's not running. Returns if it started."""
+        with self._lock:
+            if self.state == Job_states.RUNNING:
+                return False
+            self.state = Job_states.RUNNING
+            self.result = None
+            self.error = None
+            self.progress = None
+            self._cancel.clear()
+            self._ended.clear()
+        kwargs = self.kwargs
+        if self.pass_job:
+            kwargs = dict(kwargs, job=self)
+        executor = get_default_executor() if self.executor is None else self.executor
+        try:
+            future = executor.submit(self.func, *first_args, *self.args, **kwargs)
+        except BaseException as error:
+            self._finish(None, error)
+            raise
+        self._future = future
+        future.add_done_callback(self._done)
+        return True
+
+
+    def __call__(self, *first_args):
+        """Starts the job, so it can be used as an action. (returns None, so the menu keeps running)"""
+        self.start(*first_args)
+
+
+    def cancel(self):
+        """Cancels the job, if it didn't start yet, otherwise asks the function to stop. Returns if the job was running."""
+        with self._lock:
+            if self.state != Job_states.RUNNING:
+                return False
+            self._cancel.set()
+            future = self._future
+        if future is not None:
+            future.cancel()
+        return True
+
+
+    def wait(self, timeout:float=None):
+        """Waits until the job ends (or `timeout` seconds), and returns its state."""
+        if self.state != Job_states.IDLE:
+            self._ended.wait(timeout)
+        return self.state
+
+
+    def _done(self, future:"Future"):
+        if future.cancelled():
+            self._cancel.set()
+            self._finish(None, None)
+            return
+        error = future.exception()
+        self._finish(None if error is not None else future.result(), error)
+
+
+    def _finish(self, result:Any, error:BaseException|None):
+        with self._lock:
+            if self._cancel.is_set():
+                self.state = Job_states.CANCELLED
+            elif error is not None:
+                self.state = Job_states.FAILED
+                self.error = error
+            else:
+                self.state = Job_states.DONE
+                self.result = result
+            self._ended.set()
+        if self.on_done is not None:
+            self.on_done(self)
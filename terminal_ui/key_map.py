@@ -0,0 +1,136 @@
+import os
+import re
+from copy import copy, deepcopy
+
+from terminal_ui.keys import Keys
+# from keys import Keys
+
+
+_KEY_ORDER = (Keys.ESCAPE, Keys.UP, Keys.DOWN, Keys.LEFT, Keys.RIGHT, Keys.ENTER, Keys.BACKSPACE)
+
+WINDOWS_KEY_MAP = ([[[b"\x1b"]], [[], [b"H"]], [[], [b"P"]], [[], [b"K"]], [[], [b"M"]], [[b"\r"]]], [b"\xe0", b"\x00"])
+POSIX_KEY_MAP = ([[[b"\x1b"]], [[], [b"A"]], [[], [b"B"]], [[], [b"D"]], [[], [b"C"]], [[b"\r", b"\n"]]], [b"\x1b[", b"\x1bO"])
+# the backspace keys of the text key maps (if the key map doesn't have its own), so `get_key` only returns them if they are in its key map
+_TEXT_KEYS = {b"\x7f": Keys.BACKSPACE, b"\x08": Keys.BACKSPACE}
+
+# escape sequences that are not in the key map are skipped as a whole, utf-8 characters as a whole, other bytes one by one
+_UNKNOWN_SEQUENCE = rb"\x1b\[[0-9;?]*[ -/]*[@-~]|\x1bO[\s\S]"
+_UTF8_CHARACTER = rb"[\xc2-\xf4][\x80-\xbf]{1,3}"
+_UNKNOWN_BYTE = rb"[\s\S]"
+# the beginnings of the escape sequences (the rest of them could still be coming)
+_INCOMPLETE_SEQUENCE = re.compile(rb"\x1b(?:\[[0-9;?]*[ -/]*|O)?")
+
+
+def _split_keys(keys:list[bytes]|bytes) -> list[bytes]:
+    """Returns the keys in a key map group. (a bytes object counts as a group of 1 byte keys)"""
+    if type(keys) is bytes:
+        return [bytes([key]) for key in keys]
+    return list(keys)
+
+
+class Key_map:
+    """
+    A compiled version of the nested list key map format, used by `get_key`.\n
+    The key map is parsed once into a dictionary keyed on the full byte sequences of the keys, with a set of the byte sequences that are the beginnings of longer sequences, so reading a key is a dictionary lookup.\n
+    For decoding a lot of bytes at once, a regex (that matches the longest sequence first) splits the bytes into keys.\n
+    If `text` is True, the byte sequences that are not keys, but printable characters, are returned as strings (for text input). Use `with_text` to get the text version of a key map.\n
+    For the format of `key_map`, see `get_key`.
+    """
+    def __init__(self, key_map:tuple[list[list[list[bytes]]], list[bytes]], text=False):
+        self.text = bool(text)
+        self._text_map:Key_map|None = None
+        self.sequences:dict[bytes, Keys] = {}
+        groups = key_map[0]
+        prefixes = _split_keys(key_map[1]) if len(key_map) > 1 else []
+        for x in range(min(len(groups), len(_KEY_ORDER))):
+            key_groups = groups[x]
+            if len(key_groups) > 0:
+                for key in _split_keys(key_groups[0]):
+                    self.sequences.setdefault(key, _KEY_ORDER[x])
+            if len(key_groups) > 1:
+                for key in _split_keys(key_groups[1]):
+                    for prefix in prefixes:
+                        self.sequences.setdefault(prefix + key, _KEY_ORDER[x])
+        self.prefixes = frozenset(seq[:x] for seq in self.sequences for x in range(1, len(seq)))
+        ordered = sorted(self.sequences, key=len, reverse=True)
+        longs = [re.escape(seq) for seq in ordered if len(seq) > 1]
+        singles = [re.escape(seq) for seq in ordered if len(seq) == 1]
+        self._pattern = re.compile(b"|".join(longs + [_UNKNOWN_SEQUENCE] + singles + [_UTF8_CHARACTER, _UNKNOWN_BYTE]))
+
+
+    @classmethod
+    def compile(cls, key_map:"tuple[list[list[list[bytes]]], list[bytes]]|Key_map"=None):
+        """
+        Returns the compiled version of the key map.\n
+        If `key_map` is None, it returns the default key map for the platform.\n
+        The last compiled key map is reused, if the next one has the same keys.
+        """
+        global _last_source, _last_compiled
+        if isinstance(key_map, Key_map):
+            return key_map
+        if key_map is None:
+            return get_default_key_map()
+        if key_map != _last_source:
+            _last_compiled = cls(key_map)
+            # (a copy, so a key map that was changed in place is compiled again)
+            _last_source = deepcopy(key_map)
+        return _last_compiled
+
+
+    def with_text(self) -> "Key_map":
+        """Returns the version of the key map, that also returns the typed characters, and backspace. (it's only made once)"""
+        if self.text:
+            return self
+        if self._text_map is None:
+            text_map = copy(self)
+            text_map.text = True
+            text_map.sequences = {**_TEXT_KEYS, **self.sequences}
+            text_map._text_map = text_map
+            self._text_map = text_map
+        return self._text_map
+
+
+    def lookup(self, sequence:bytes) -> Keys|str|None:
+        """Returns the key of the byte sequence (or the character it's, if `text` is True), or None if it's not a key."""
+        key = self.sequences.get(sequence)
+        if key is None and self.text:
+            try:
+                character = sequence.decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+            if character.isprintable():
+                return character
+        return key
+
+
+    def is_incomplete(self, data:bytes):
+        """Returns if the bytes could be the beginning of a longer key sequence (a key in the key map, or an escape sequence), so the reader should wait for the rest of it."""
+        return data in self.prefixes or _INCOMPLETE_SEQUENCE.fullmatch(data) is not None
+
+
+    def split(self, data:bytes, pos=0):
+        """
+        Returns the byte sequence of the first key in `data` (from `pos`).\n
+        Unknown escape sequences are returned whole, and other unknown bytes one by one.
+        """
+        match = self._pattern.match(data, pos)
+        return None if match is None else match.group()
+
+
+    def decode(self, data:bytes) -> list[Keys|str]:
+        """Returns the keys (and characters, if `text` is True) in `data`, skipping the unknown byte sequences."""
+        get = self.lookup if self.text else self.sequences.get
+        return [key for key in map(get, self._pattern.findall(data)) if key is not None]
+
+
+_last_source = None
+_last_compiled:Key_map = None
+_default_key_map:Key_map = None
+
+
+def get_default_key_map():
+    """Returns the compiled default key map for the platform."""
+    global _default_key_map
+    if _default_key_map is None:
+        _default_key_map = Key_map(WINDOWS_KEY_MAP if os.name == "nt" else POSIX_KEY_MAP)
+    return _default_key_map
@@ -0,0 +1,223 @@
+import os
+import sys
+from select import select
+from time import monotonic, sleep
+
+try:
+    import msvcrt
+except ModuleNotFoundError:
+    msvcrt = None
+try:
+    import termios
+    import tty
+except ModuleNotFoundError:
+    termios = None
+
+from terminal_ui.keys import Get_key_modes, Keys, IGNORED_KEYS
+from terminal_ui.key_map import Key_map
+# from keys import Get_key_modes, Keys, IGNORED_KEYS
+# from key_map import Key_map
+
+
+class Key_reader:
+    """Base class for the objects that read keypresses from the terminal."""
+
+    def get_key(self, mode:Get_key_modes, key_map:Key_map) -> Keys|str:
+        """Waits for a key that is in the `key_map`, and not ignored by the `mode`."""
+        ignored = IGNORED_KEYS[mode]
+        while True:
+            key = self.read_key(key_map)
+            if key is not None and key not in ignored:
+                return key
+
+
+    def read_key(self, key_map:Key_map) -> Keys|str|None:
+        """Reads one key sequence, and returns the key it means (or the typed character, if the `key_map` is a text key map), or None if it's not in the `key_map`."""
+        raise NotImplementedError
+
+
+    def key_pending(self, timeout:float=0) -> bool:
+        """Returns if there are keypresses that can be read without waiting, after waiting at most `timeout` seconds for them."""
+        return False
+
+
+    async def read_key_async(self, key_map:Key_map) -> Keys|str|None:
+        """
+        Like `read_key`, but lets the event loop run while waiting for the key.\n
+        By default, it checks `key_pending` every few milliseconds.
+        """
+        import asyncio
+        while not self.key_pending():
+            await asyncio.sleep(0.002)
+        return self.read_key(key_map)
+
+
+    async def key_pending_async(self, timeout:float=0) -> bool:
+        """Like `key_pending`, but lets the event loop run while waiting."""
+        import asyncio
+        end = monotonic() + timeout
+        while not self.key_pending():
+            if monotonic() >= end:
+                return False
+            await asyncio.sleep(0.002)
+        return True
+
+
+    @property
+    def active(self):
+        """If the terminal is in the mode for reading keys, so `restore` has to be called to put it back."""
+        return False
+
+
+    def restore(self):
+        """Puts the terminal back into the mode it was in before reading keys."""
+        pass
+
+
+class Windows_key_reader(Key_reader):
+    """Key reader using `msvcrt.getch`."""
+
+    def read_key(self, key_map:Key_map):
+        sequence = msvcrt.getch()
+        while sequence in key_map.prefixes:
+            sequence += msvcrt.getch()
+        return key_map.lookup(sequence)
+
+
+    def key_pending(self, timeout:float=0):
+        end = monotonic() + timeout
+        while not msvcrt.kbhit():
+            if monotonic() >= end:
+                return False
+            sleep(0.002)
+        return True
+
+
+class Posix_key_reader(Key_reader):
+    """
+    Key reader for POSIX terminals, using termios.\n
+    The terminal is put into cbreak mode on the first read, and stays in it until `restore` is called, so keys pressed while a frame is written don't get echoed.\n
+    Everything that is available is read with one `os.read`, and the bytes are split into keys by the `Key_map`.\n
+    If the bytes end in the middle of a key sequence (or of an escape sequence that is not in the key map), it waits at most `escape_delay` seconds for the rest of it. (this is how a lone escape is told apart from an arrow key)\n
+    The async methods wait for the terminal with a reader registered with the event loop, instead of `select`.
+    """
+    def __init__(self, fd:int=None, escape_delay=0.025):
+        self.fd = sys.stdin.fileno() if fd is None else fd
+        self.escape_delay = escape_delay
+        self._buffer = b""
+        self._old_attributes = None
+
+
+    def _enter_cbreak(self):
+        if self._old_attributes is None and os.isatty(self.fd):
+            self._old_attributes = termios.tcgetattr(self.fd)
+            tty.setcbreak(self.fd, termios.TCSANOW)
+
+
+    @property
+    def active(self):
+        return self._old_attributes is not None
+
+
+    def restore(self):
+        if self._old_attributes is not None:
+            termios.tcsetattr(self.fd, termios.TCSADRAIN, self._old_attributes)
+            self._old_attributes = None
+
+
+    def _read(self):
+        """Reads the available bytes into the buffer. (only call it if the terminal is readable)"""
+        data = os.read(self.fd, 1024)
+        if not data:
+            raise EOFError("The input of the terminal was closed.")
+        self._buffer += data
+
+
+    def _fill(self, timeout:float=None):
+        """Reads the available bytes into the buffer, waiting at most `timeout` seconds (forever if None) for them. Returns if anything was read."""
+        if timeout is not None and not select([self.fd], [], [], timeout)[0]:
+            return False
+        self._read()
+        return True
+
+
+    async def _wait_readable(self, timeout:float=None):
+        """Waits at most `timeout` seconds (forever if None) until the terminal can be read, while letting the event loop run. Returns if it can be read."""
+        if select([self.fd], [], [], 0)[0]:
+            return True
+        if timeout is not None and timeout <= 0:
+            return False
+        # (asyncio is only imported by the async methods, because importing it is slow)
+        import asyncio
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        loop.add_reader(self.fd, lambda: readable.done() or readable.set_result(True))
+        try:
+            return await asyncio.wait_for(readable, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(self.fd)
+
+
+    async def _fill_async(self, timeout:float=None):
+        """Like `_fill`, but lets the event loop run while waiting."""
+        if not await self._wait_readable(timeout):
+            return False
+        self._read()
+        return True
+
+
+    def read_key(self, key_map:Key_map):
+        self._enter_cbreak()
+        if not self._buffer:
+            self._fill()
+        while key_map.is_incomplete(self._buffer) and self._fill(self.escape_delay):
+            pass
+        sequence = key_map.split(self._buffer)
+        self._buffer = self._buffer[len(sequence):]
+        return key_map.lookup(sequence)
+
+
+    def key_pending(self, timeout:float=0):
+        return bool(self._buffer) or bool(select([self.fd], [], [], timeout)[0])
+
+
+    async def read_key_async(self, key_map:Key_map):
+        self._enter_cbreak()
+        if not self._buffer:
+            await self._fill_async()
+        while key_map.is_incomplete(self._buffer) and await self._fill_async(self.escape_delay):
+            pass
+        sequence = key_map.split(self._buffer)
+        self._buffer = self._buffer[len(sequence):]
+        return key_map.lookup(sequence)
+
+
+    async def key_pending_async(self, timeout:float=0):
+        return bool(self._buffer) or await self._wait_readable(timeout)
+
+
+_key_reader:Key_reader = None
+
+
+def get_key_reader():
+    """
+    Returns the key reader for the platform. (it is only created once)\n
+    Throws an error if neither msvcrt nor termios was found.
+    """
+    global _key_reader
+    if _key_reader is None:
+        if msvcrt is not None:
+            _key_reader = Windows_key_reader()
+        elif termios is not None:
+            _key_reader = Posix_key_reader()
+        else:
+            raise ModuleNotFoundError("msvcrt or termios module not found!\nThis module only works on windows and POSIX systems!")
+    return _key_reader
+
+
+def restore_terminal():
+    """Puts the terminal back into the mode it was in before reading keys, if any keys were read."""
+    if _key_reader is not None:
+        _key_reader.restore()
@@ -0,0 +1,28 @@
+from enum import Enum, auto
+
+
+class Get_key_modes(Enum):
+    NO_IGNORE = auto()
+    IGNORE_HORIZONTAL = auto()
+    IGNORE_VERTICAL = auto()
+    IGNORE_ESCAPE = auto()
+    IGNORE_ENTER = auto()
+
+
+class Keys(Enum):
+    ESCAPE = auto()
+    UP = auto()
+    DOWN = auto()
+    LEFT = auto()
+    RIGHT = auto()
+    ENTER = auto()
+    BACKSPACE = auto()
+
+
+IGNORED_KEYS:dict[Get_key_modes, frozenset[Keys]] = {
+    Get_key_modes.NO_IGNORE: frozenset(),
+    Get_key_modes.IGNORE_HORIZONTAL: frozenset((Keys.LEFT, Keys.RIGHT)),
+    Get_key_modes.IGNORE_VERTICAL: frozenset((Keys.UP, Keys.DOWN)),
+    Get_key_modes.IGNORE_ESCAPE: frozenset((Keys.ESCAPE,)),
+    Get_key_modes.IGNORE_ENTER: frozenset((Keys.ENTER,)),
+}
@@ -0,0 +1,150 @@
+import re
+import signal
+import unicodedata
+from functools import lru_cache
+from typing import Callable
+
+
+_char_widths:dict[str, int] = {}
+# the escape sequences that set the color and style of the text (they don't take up any columns)
+_SGR = re.compile(r"(\x1b\[[0-9;:]*m)")
+
+
+def char_width(char:str):
+    """Returns how many columns the character takes up in the terminal. (0 for combining and invisible characters, 2 for wide (CJK, emoji) characters)"""
+    width = _char_widths.get(char)
+    if width is None:
+        if unicodedata.combining(char) or unicodedata.category(char) in ("Mn", "Me", "Cf"):
+            width = 0
+        elif unicodedata.east_asian_width(char) in ("W", "F"):
+            width = 2
+        else:
+            width = 1
+        _char_widths[char] = width
+    return width
+
+
+def text_width(text:str):
+    """Returns how many columns the (one line) text takes up in the terminal. (the color and style escape sequences don't count)"""
+    if "\x1b" in text:
+        text = _SGR.sub("", text)
+    if text.isascii():
+        return len(text)
+    return sum(map(char_width, text))
+
+
+def split_sgr(text:str):
+    """Returns the parts of the text, with the color and style escape sequences (the odd parts) between the texts. (the even parts)"""
+    return _SGR.split(text)
+
+
+@lru_cache(maxsize=4096)
+def wrap_line(line:str, width:int|None) -> tuple[str, ...]:
+    """
+    Returns the pieces of the line, that fit into `width` columns. (the line itself, if `width` is None)\n
+    The color and style escape sequences are kept in the pieces, but they don't take up any columns.
+    """
+    if width is None or text_width(line) <= width:
+        return (line,)
+    pieces = []
+    piece = []
+    piece_width = 0
+    # (the split parts are the texts and the escape sequences between them, after each other)
+    for x, part in enumerate(split_sgr(line)):
+        if x % 2:
+            piece.append(part)
+            continue
+        for char in part:
+            current_width = char_width(char)
+            if piece_width + current_width > width and piece_width:
+                pieces.append("".join(piece))
+                piece = []
+                piece_width = 0
+            piece.append(char)
+            piece_width += current_width
+    pieces.append("".join(piece))
+    return tuple(pieces)
+
+
+@lru_cache(maxsize=4096)
+def split_lines(text:str, width:int|None) -> tuple[str, ...]:
+    """Returns the lines of the text, with the lines that are longer than `width` columns wrapped."""
+    if width is None:
+        return tuple(text.split("\n"))
+    lines = []
+    for line in text.split("\n"):
+        lines.extend(wrap_line(line, width))
+    return tuple(lines)
+
+
+def wrap_text(text:str, width:int|None):
+    """Returns the text, with the lines that are longer than `width` columns wrapped."""
+    if width is None:
+        return text
+    return "\n".join(split_lines(text, width))
+
+
+@lru_cache(maxsize=4096)
+def layout_answer(text:str, icon:str, icon_r:str, multiline:bool, width:int|None) -> str:
+    """
+    Returns the text of an answer, with the cursor icons around it, and the lines wrapped at `width` columns (not counting the icons).\n
+    If `multiline` is True, the icons are around every line, otherwise only around the whole text.
+    """
+    lines = split_lines(text, width)
+    if multiline:
+        return "".join([f"{icon}{line}{icon_r}\n" for line in lines])
+    return icon + "\n".join(lines) + icon_r + "\n"
+
+
+def get_text_width(columns:int|None, icons:tuple[str, str]|list[tuple[str, str]]):
+    """Returns how many columns the text can take up in a terminal with `columns` columns, next to the widest of the (left, right) icon pairs, without wrapping. (None if `columns` is None)"""
+    if columns is None:
+        return None
+    if type(icons) is tuple:
+        icons = [icons]
+    return max(columns - 1 - max(text_width(icon) + text_width(icon_r) for icon, icon_r in icons), 1)
+
+
+def clear_layout_cache():
+    """Forgets the laid out texts."""
+    wrap_line.cache_clear()
+    split_lines.cache_clear()
+    layout_answer.cache_clear()
+
+
+_resize_callbacks:list[Callable[[], object]] = []
+_previous_handler = None
+_resize_handler_installed = False
+
+
+def _handle_resize(signum, frame):
+    # the texts are laid out again for the new width
+    clear_layout_cache()
+    for callback in list(_resize_callbacks):
+        callback()
+    if callable(_previous_handler):
+        _previous_handler(signum, frame)
+
+
+def on_resize(callback:Callable[[], object]):
+    """
+    Calls the `callback` when the terminal is resized (with a `SIGWINCH` handler, that also clears the layout cache, and calls the handler that was there before).\n
+    Returns a function that removes the callback, or None if it's not possible. (not on windows, or outside of the main thread)
+    """
+    global _previous_handler, _resize_handler_installed
+    if not hasattr(signal, "SIGWINCH"):
+        return None
+    if not _resize_handler_installed:
+        try:
+            _previous_handler = signal.signal(signal.SIGWINCH, _handle_resize)
+        except ValueError:
+            return None
+        _resize_handler_installed = True
+    _resize_callbacks.append(callback)
+    return lambda: remove_resize_callback(callback)
+
+
+def remove_resize_callback(callback:Callable[[], object]):
+    """Stops calling the `callback` when the terminal is resized."""
+    if callback in _resize_callbacks:
+        _resize_callbacks.remove(callback)
@@ -0,0 +1,94 @@
+from collections import OrderedDict
+from typing import Any
+
+from terminal_ui.key_map import Key_map
+from terminal_ui.backends import IO_backend, get_terminal_backend
+from terminal_ui.renderer import Renderer
+from terminal_ui.run_context import Run_context, Menu_state, Open_menu, run_sync
+# from key_map import Key_map
+# from backends import IO_backend, get_terminal_backend
+# from renderer import Renderer
+# from run_context import Run_context, Menu_state, Open_menu, run_sync
+
+
+class Navigator:
+    """
+    Runs a menu (a `UI_list` or an `Options_menu`) and its nested menus from one loop, with a stack of the open menus, instead of every menu displaying its nested menus inside its own `display`.\n
+    The menus work the same way as with `display`: a nested menu opens when it's selected, and when it exits, its parent continues, ignoring what the nested menu returned (so -1 and [-1, ...] only exit the menu they were returned in). `run` returns what the root menu returned.\n
+    While a nested menu is open, its parent's selection, scroll position and filter are kept, and the last frame of the `max_frames` most recently displayed parents, so going back redraws the parent instantly, before continuing it.\n
+    If `breadcrumbs` is True, the first lines of the titles of the open menus are displayed above the menu, joined with the `separator`.
+    """
+    __slots__ = ("root", "key_mapping", "renderer", "backend", "breadcrumbs", "separator", "max_frames", "_stack", "_frames")
+
+    def __init__(self, root:Any, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None, breadcrumbs=False, separator=" > ", max_frames=32):
+        self.root = root
+        self.key_mapping = key_mapping
+        self.renderer = renderer
+        self.backend = backend
+        self.breadcrumbs = bool(breadcrumbs)
+        self.separator = str(separator)
+        self.max_frames = max(int(max_frames), 0)
+        self._stack:list[tuple[Any, Menu_state]] = []
+        self._frames:OrderedDict[int, Menu_state] = OrderedDict()
+
+
+    @property
+    def path(self) -> list[str]:
+        """The titles of the open menus, from the root."""
+        return [_get_title(menu) for menu, _ in self._stack]
+
+
+    def run(self):
+        """Displays the root menu (and its nested menus), and returns what the root menu returned."""
+        backend = get_terminal_backend() if self.backend is None else self.backend
+        return run_sync(self._run(Run_context(backend, navigate=True)))
+
+
+    async def run_async(self):
+        """Displays the root menu (and its nested menus) in the running event loop, and returns what the root menu returned."""
+        backend = get_terminal_backend() if self.backend is None else self.backend
+        return await self._run(Run_context(backend, True, navigate=True))
+
+
+    def _keep_frame(self, state:Menu_state):
+        """Keeps the frame of the state in the LRU, and forgets the frames of the least recently displayed menus over `max_frames`."""
+        self._frames[id(state)] = state
+        self._frames.move_to_end(id(state))
+        while len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)[1].frame = None
+
+
+    async def _run(self, ctx:Run_context):
+        renderer = Renderer() if self.renderer is None else self.renderer
+        self._stack = [(self.root, Menu_state())]
+        self._frames.clear()
+        try:
+            while True:
+                menu, state = self._stack[-1]
+                ctx.header = (self.separator.join(self.path) + "\n") if self.breadcrumbs else ""
+                result = await menu._display(ctx, self.key_mapping, renderer, state)
+                if isinstance(result, Open_menu):
+                    self._keep_frame(state)
+                    self._stack.append((result.menu, Menu_state()))
+                    continue
+                self._stack.pop()
+                self._frames.pop(id(state), None)
+                if not self._stack:
+                    return result
+                # back to the parent
+                parent_state = self._stack[-1][1]
+                if parent_state.frame is not None:
+                    ctx.backend.write(renderer.render(parent_state.frame, ctx.backend.terminal_size()))
+        finally:
+            self._stack = []
+            self._frames.clear()
+
+
+def _get_title(menu:Any):
+    """Returns the first line of the title of the menu."""
+    title = getattr(menu, "question", None)
+    if title is None:
+        title = getattr(menu, "title", None)
+    if title is None:
+        return ""
+    return str(title).strip("\n").split("\n", 1)[0]
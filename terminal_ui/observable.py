@@ -0,0 +1,50 @@
+from threading import Lock
+from typing import Any, Callable
+
+
+class Observable:
+    """
+    A value that tells its subscribers when it changes, so UI elements can be bound to it with `Base_UI.bind`.\n
+    The `value` can be set from any thread. (the subscribers are called in the thread that set it)
+    """
+    __slots__ = ("_value", "_subscribers", "_lock")
+
+    def __init__(self, value:Any=None):
+        self._value = value
+        self._subscribers:list[Callable[[Any], Any]] = []
+        self._lock = Lock()
+
+
+    @property
+    def value(self):
+        return self._value
+
+
+    @value.setter
+    def value(self, value:Any):
+        with self._lock:
+            if value == self._value:
+                return
+            self._value = value
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            callback(value)
+
+
+    def subscribe(self, callback:Callable[[Any], Any]):
+        """
+        Calls the `callback` with the current value, and then with every new value.\n
+        Returns a function that unsubscribes the `callback`.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+            value = self._value
+        callback(value)
+        return lambda: self.unsubscribe(callback)
+
+
+    def unsubscribe(self, callback:Callable[[Any], Any]):
+        """Stops calling the `callback` when the value changes."""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
@@ -0,0 +1,1380 @@
+import sys
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import repeat
+from shutil import get_terminal_size
+from time import monotonic
+from typing import Any, Awaitable, Callable, Iterable, Sequence
+
+from terminal_ui.cursor import Cursor_icon, DEFAULT_CURSOR_ICON
+from terminal_ui.ui_list import UI_list
+from terminal_ui.keys import Get_key_modes, Keys
+from terminal_ui.key_map import Key_map
+from terminal_ui.backends import IO_backend, get_terminal_backend
+from terminal_ui.renderer import Renderer, Render_modes
+from terminal_ui.viewport import Viewport
+from terminal_ui.run_context import Run_context, Menu_state, Open_menu, run_sync, handler_context
+from terminal_ui.actions import Action_kinds, Compiled_action, get_compiled_action, call_sync_handler, handle_action, method_accepts
+from terminal_ui.jobs import Job, Job_states
+from terminal_ui.layout import layout_answer, wrap_text, get_text_width, split_lines, text_width, wrap_line
+# from cursor import Cursor_icon, DEFAULT_CURSOR_ICON
+# from ui_list import UI_list
+# from keys import Get_key_modes, Keys
+# from key_map import Key_map
+# from backends import IO_backend, get_terminal_backend
+# from renderer import Renderer, Render_modes
+# from viewport import Viewport
+# from run_context import Run_context, Menu_state, Open_menu, run_sync, handler_context
+# from actions import Action_kinds, Compiled_action, get_compiled_action, call_sync_handler, handle_action, method_accepts
+# from jobs import Job, Job_states
+# from layout import layout_answer, wrap_text, get_text_width, split_lines, text_width, wrap_line
+
+
+class UINoSelectablesError(Exception):
+    """Exeption raised when there are no values in the selectables list in the `options_ui` function."""
+    pass
+
+class Base_UI:
+    """
+    Base class for all `options_ui` classes.\n
+    The text of the element is cached for every cursor icon it was made with, until a public attribute of the element is set.\n
+    (lists in the attributes should be replaced, not modified in place, for the cache to notice the change)\n
+    Attributes can be bound to a live data source with `bind`, and `options_ui` keeps them up to date, if it has a `refresh_fps`.\n
+    If `wants_text` is True, `options_ui` gives the typed characters (and backspace) to the element, as strings.\n
+    Structure: [pre_text][#####][pre_value][value][post_value]
+    """
+    __slots__ = ("_texts", "_bindings", "_pushed", "value", "pre_text", "pre_value", "display_value", "post_value", "multiline")
+    wants_text = False
+
+    def __init__(self, value=0, pre_text="", pre_value="", display_value=False, post_value="", multiline=False):
+        self._texts:dict[tuple[str, str], str] = {}
+        self._bindings:dict[str, tuple[Callable[[], Any]|None, Callable[[], Any]|None]]|None = None
+        self._pushed:dict[str, Any] = None
+        self.value:int = int(value)
+        self.pre_text:str = str(pre_text)
+        self.pre_value:str = str(pre_value)
+        self.display_value:bool = bool(display_value)
+        self.post_value:str = str(post_value)
+        self.multiline:bool = bool(multiline)
+    
+    
+    def __setattr__(self, name:str, value):
+        super().__setattr__(name, value)
+        # the text depends on the public attributes
+        if name[0] != "_":
+            try:
+                texts = self._texts
+            except AttributeError:
+                # (a subclass set it before calling `__init__`)
+                return
+            if texts:
+                texts.clear()
+    
+    
+    def bind(self, attribute:str, source:Callable[[], Any]|Any):
+        """
+        Binds the attribute (like `value` or `pre_text`) to a live data source, so `refresh` can update it.\n
+        The `source` is either a function, that returns the current value (called on every refresh), or an observable (like `Observable`), that has a `subscribe(callback)` method, that calls the callback with the new values.\n
+        Returns the element, so it can be used in the list of elements directly.
+        """
+        if attribute[0] == "_" or not hasattr(self, attribute):
+            raise AttributeError(f"{type(self).__name__} has no public attribute named {attribute!r}")
+        self.unbind(attribute)
+        if self._bindings is None:
+            self._bindings = {}
+            self._pushed = {}
+        if hasattr(source, "subscribe"):
+            pushed = self._pushed
+            def push(value):
+                pushed[attribute] = value
+            self._bindings[attribute] = (None, source.subscribe(push))
+        elif callable(source):
+            self._bindings[attribute] = (source, None)
+        else:
+            raise TypeError("The source must be callable, or have a subscribe method.")
+        return self
+    
+    
+    def unbind(self, attribute:str):
+        """Stops updating the attribute from its data source."""
+        if self._bindings is not None and attribute in self._bindings:
+            unsubscribe = self._bindings.pop(attribute)[1]
+            self._pushed.pop(attribute, None)
+            if callable(unsubscribe):
+                unsubscribe()
+    
+    
+    def refresh(self):
+        """
+        Updates the bound attributes from their data sources.\n
+        Returns if any of them changed. (only the changed elements lose their cached text)
+        """
+        if not self._bindings:
+            return False
+        changed = False
+        for attribute, (poll, _) in self._bindings.items():
+            if poll is None:
+                if attribute not in self._pushed:
+                    continue
+                new_value = self._pushed.pop(attribute)
+            else:
+                new_value = poll()
+            old_value = getattr(self, attribute)
+            if type(old_value) in (bool, int, str):
+                new_value = type(old_value)(new_value)
+            if new_value != old_value:
+                setattr(self, attribute, new_value)
+                changed = True
+        return changed
+    
+    
+    def _clamp_value(self, value:int, v_min:int, v_max:int):
+        value = int(value)
+        if value > v_max:
+            value = v_max
+        elif value < v_min:
+            value = v_min
+        return value
+    
+    
+    def make_text(self, icon:str, icon_r:str, width:int=None):
+        """
+        Returns the text representation of the UI element.\n
+        If `width` is not None, the lines that are longer than `width` columns are wrapped.
+        """
+        key = (icon, icon_r, width)
+        txt = self._texts.get(key)
+        if txt is None:
+            txt = wrap_text(self._make_text(icon, icon_r, width), width)
+            self._texts[key] = txt
+        return txt
+    
+    
+    def _make_text(self, icon:str, icon_r:str, width:int=None):
+        """
+        Makes the text representation of the UI element.\n
+        `width` is how many columns the lines can take up. (None if it's not known)
+        """
+        # current icon group
+        icons = f"{icon_r}\n{icon}"
+        # icon
+        parts = [icon]
+        # pre text
+        if self.multiline:
+            parts.append(self.pre_text.replace("\n", icons))
+        else:
+            parts.append(self.pre_text)
+        # special
+        # (overrides made for older versions don't take the width)
+        if method_accepts(type(self), "_make_special", "width"):
+            parts.append(self._make_special(icons, width=width))
+        else:
+            parts.append(self._make_special(icons))
+        # pre value
+        if self.multiline:
+            parts.append(self.pre_value.replace("\n", icons))
+        else:
+            parts.append(self.pre_value)
+        # value
+        if self.display_value:
+            parts.append(self._make_value())
+        # post value
+        if self.multiline:
+            parts.append(self.post_value.replace("\n", icons))
+        else:
+            parts.append(self.post_value)
+        # icon right
+        parts.append(icon_r)
+        parts.append("\n")
+        return "".join(parts)
+    
+    
+    def _make_special(self, icons_str:str, width:int=None) -> str:
+        """
+        Returns the string representation of the cpecial varable.\n
+        `width` is how many columns the lines of the element can take up. (None if it's not known)
+        """
+        return ""
+    
+    
+    def _move(self, key:Keys) -> bool:
+        """
+        Handles the up and down keys, if the selection can move inside the element (like between the rows of a `Table`).\n
+        Returns False, if the selection should move to an other element instead.
+        """
+        return False
+    
+    
+    def cursor_position(self, icon:str, width:int=None) -> tuple[int, int]|None:
+        """
+        Returns the (line, column) position in the text of the element (made with the `icon` and `width`), where the terminal cursor should be, when the element is selected.\n
+        None means the cursor stays at the end of the frame.
+        """
+        return None
+    
+    
+    def _make_value(self):
+        """
+        Returns the string representation of the value.
+        """
+        return str(self.value)
+    
+    
+    def _handle_action(self, key:Keys, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        """
+        Handles what to return for the input key.\n
+        Returns False if the screen should not update.
+        """
+        return True
+    
+    
+    async def _handle_action_async(self, key:Keys, key_mapping:Key_map, renderer:Renderer|None, ctx:Run_context):
+        """
+        `_handle_action`, that runs the actions (and nested menus) in the way the `ctx` says.\n
+        By default, it calls `_handle_action`. (without the `renderer` and the `backend`, if it's an override, that doesn't accept them)
+        """
+        return call_sync_handler(self, key, key_mapping, renderer, ctx)
+
+
+class Slider(Base_UI):
+    """
+    Object for the options_ui method\n
+    When used as input in the options_ui function, it draws a slider, with the section specifying it's characteristics.\n
+    Multiline makes the "cursor" draw at every line if the text is multiline.\n
+    If `bar_width` is None, the bar has a symbol for every value in the `value_range`. Otherwise the range is scaled to a bar that is `bar_width` characters wide (or as wide as the rest of the line, if it's 0), so large ranges stay cheap to draw and readable.\n
+    `partial_symbols` are the symbols for the partially filled character of a scaled bar, from the least to the most filled. (for example: "▏▎▍▌▋▊▉")\n
+    `step` is how many values of the `value_range` a keypress moves the slider by, and if `acceleration` is True, the step doubles after every 8 fast repeated keypresses in the same direction (up to 1/20 of the range).\n
+    Structure: [pre_text][symbol and symbol_empty][pre_value][value][post_value]
+    """
+    __slots__ = ("value_range", "symbol", "symbol_empty", "bar_width", "partial_symbols", "step", "acceleration", "_segments", "_last_key", "_last_key_time", "_streak")
+
+    def __init__(self, value_range:int|range, value=0, pre_text="", symbol="#", symbol_empty="-", pre_value="", display_value=False, post_value="", multiline=False,
+                 bar_width:int=None, partial_symbols="", step=1, acceleration=False):
+        if type(value_range) is range:
+            self.value_range = value_range
+        elif type(value_range) is int:
+            self.value_range = range(value_range)
+        else:
+            raise TypeError
+        value = super()._clamp_value(value, min(self.value_range.start, self.value_range.stop), max(self.value_range.start, self.value_range.stop))
+        super().__init__(value, pre_text, pre_value, display_value, post_value, multiline)
+        self.symbol = str(symbol)
+        self.symbol_empty = str(symbol_empty)
+        self.bar_width = bar_width
+        self.partial_symbols = str(partial_symbols)
+        self.step = max(int(step), 1)
+        self.acceleration = bool(acceleration)
+        self._segments:tuple[int, str, str, str, str] = None
+        self._last_key:Keys = None
+        self._last_key_time = 0.0
+        self._streak = 0
+    
+    
+    def _make_special(self, icons_str:str, width:int=None):
+        if self.bar_width is None:
+            return "".join((self.symbol_empty if x >= self.value else self.symbol) for x in self.value_range)
+        bar_width = self.bar_width
+        if bar_width <= 0:
+            # the rest of the line (of `width` columns, or of the terminal without its last column)
+            if width is None:
+                width = get_terminal_size().columns - 1
+            icon_r, icon = icons_str.split("\n", 1)
+            before = icon + self.pre_text
+            after = self.pre_value + (self._make_value() if self.display_value else "") + self.post_value
+            if self.multiline:
+                before = before.replace("\n", icons_str)
+                after = after.replace("\n", icons_str)
+            before = before.rsplit("\n", 1)[-1]
+            after = (after + icon_r).split("\n", 1)[0]
+            bar_width = max(width - text_width(before) - text_width(after), 1)
+        return self._make_scaled_bar(bar_width)
+    
+    
+    def _make_scaled_bar(self, width:int):
+        """Returns the bar, scaled to `width` characters, built from precomputed segments."""
+        segments = self._segments
+        if segments is None or segments[0] != width or segments[3] != self.symbol or segments[4] != self.symbol_empty:
+            segments = (width, self.symbol * width, self.symbol_empty * width, self.symbol, self.symbol_empty)
+            self._segments = segments
+        span = self.value_range.stop - self.value_range.start
+        fraction = (self.value - self.value_range.start) / span if span else 1.0
+        fraction = min(max(fraction, 0.0), 1.0)
+        cells = fraction * width
+        full = int(cells)
+        partial = ""
+        if self.partial_symbols and full < width:
+            level = int((cells - full) * (len(self.partial_symbols) + 1))
+            if level > 0:
+                partial = self.partial_symbols[level - 1]
+        empty = width - full - (1 if partial else 0)
+        return segments[1][:full] + partial + segments[2][:empty]
+    
+    
+    def _get_multiplier(self, key:Keys):
+        """Returns how many steps the slider should move, depending on how fast the same key is repeated."""
+        if not self.acceleration:
+            return 1
+        now = monotonic()
+        if key == self._last_key and now - self._last_key_time < 0.2:
+            self._streak += 1
+        else:
+            self._streak = 0
+        self._last_key = key
+        self._last_key_time = now
+        max_multiplier = max(len(self.value_range) // (20 * self.step), 1)
+        return min(2 ** (self._streak // 8), max_multiplier)
+    
+    
+    def _handle_action(self, key:Keys, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        multiplier = self.step * self._get_multiplier(key)
+        delta = self.value_range.step * multiplier
+        if key == Keys.RIGHT:
+            if self.value + delta <= self.value_range.stop:
+                self.value += delta
+            elif multiplier > 1 and self.value + self.value_range.step <= self.value_range.stop:
+                self.value += (self.value_range.stop - self.value) // self.value_range.step * self.value_range.step
+            else:
+                return False
+        else:
+            if self.value - delta >= self.value_range.start:
+                self.value -= delta
+            elif multiplier > 1 and self.value - self.value_range.step >= self.value_range.start:
+                self.value -= (self.value - self.value_range.start) // self.value_range.step * self.value_range.step
+            else:
+                return False
+        return True
+
+
+@lru_cache(maxsize=256)
+def _shared_choices(choices:tuple[str, ...]) -> tuple[str, ...]:
+    """Returns the first equal tuple of choices, of the recently made `Choice` objects. (a bounded cache, so menus that make new choices all the time don't keep every old one)"""
+    return choices
+
+
+def _intern_choices(choice_list:list|range) -> tuple[str, ...]:
+    """Returns the choices as a tuple of interned strings, that is shared between the `Choice` objects with the same choices."""
+    return _shared_choices(tuple(sys.intern(str(choice)) for choice in choice_list))
+
+
+class Choice(Base_UI):
+    """
+    Object for the options_ui method\n
+    When used as input in the options_ui function, it draws a multiple choice seletion, with the choice_list list specifying the choice names.\n
+    Multiline makes the "cursor" draw at every line if the text is multiline.\n
+    The `choice_list` is stored as a tuple of interned strings, and the same choices (of the recently made choice elements) share the same tuple.\n
+    Structure: [pre_text][choice name][pre_value][value][post_value]
+    """
+    __slots__ = ("choice_list",)
+
+    def __init__(self, choice_list:list|range, value=0, pre_text="", pre_value="", display_value=False, post_value="", multiline=False):
+        value = super()._clamp_value(value, 0, len(choice_list) - 1)
+        super().__init__(value, pre_text, pre_value, display_value, post_value, multiline)
+        self.choice_list = _intern_choices(choice_list)
+
+
+    def _make_special(self, icons_str:str):
+        if self.multiline:
+            return self.choice_list[self.value].replace("\n", icons_str)
+        else:
+            return self.choice_list[self.value]
+    
+    
+    def _make_value(self):
+        return f"{self.value + 1}/{len(self.choice_list)}"
+    
+    
+    def _handle_action(self, key:Keys, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        if key == Keys.RIGHT:
+            self.value += 1
+        elif key == Keys.LEFT:
+            self.value -= 1
+        self.value = self.value % len(self.choice_list)
+        return True
+
+
+class Toggle(Base_UI):
+    """
+    Object for the options_ui method\n
+    When used as input in the options_ui function, it draws a field that is toggleable with the enter key.\n
+    Multiline makes the "cursor" draw at every line if the text is multiline.\n
+    Structure: [pre_text][symbol or symbol_off][post_value]
+    """
+    __slots__ = ("symbol", "symbol_off")
+
+    def __init__(self, value=0, pre_text="", symbol="on", symbol_off="off", post_value="", multiline=False):
+        value = super()._clamp_value(value, 0, 1)
+        super().__init__(value, pre_text, "", False, post_value, multiline)
+        self.symbol = str(symbol)
+        self.symbol_off = str(symbol_off)
+        
+    
+    def _make_special(self, icons_str:str):
+        return (self.symbol_off if self.value == 0 else self.symbol)
+    
+    
+    def _handle_action(self, key:Keys, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        if key == Keys.ENTER:
+            self.value = int(not bool(self.value))
+        return True
+
+
+class Button(Base_UI):
+    """
+    Object for the options_ui method\n
+    When used as input in the options_ui function, it text that is pressable with the enter key.\n
+    If `action` is a function (or a list with a function as the 1. element, and arguments as the 2-n. element, including 1 or more dictionaries as **kwargs), it will run that function, if the button is clicked.\n
+    - If the function returns False the screen will not rerender.\n
+    - If it is a `UI_list` (or `Options_menu`) object, the object's `display` function will be automaticly called, allowing for nested menus.\n
+    - If `modify` is `True`, the function (if it's not a `UI_list` object) will get a the `Button` object as it's first argument (and can modify it) when the function is called.\n
+    Multiline makes the "cursor" draw at every line if the text is multiline.\n
+    Structure: [text]
+    """
+    __slots__ = ("action", "modify", "_compiled_action")
+
+    def __init__(self, text="", action:Callable=None, multiline=False, modify=False):
+        super().__init__(-1, text, "", False, "", multiline)
+        self.action = action
+        self.modify = bool(modify)
+        self._compiled_action:Compiled_action|None = None
+    
+    
+    def _handle_action(self, key:Keys, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        return run_sync(self._handle_action_async(key, key_mapping, renderer, handler_context(backend)))
+    
+    
+    async def _handle_action_async(self, key:Keys, key_mapping:Key_map, renderer:Renderer|None, ctx:Run_context):
+        if key == Keys.ENTER:
+            action = self._compiled_action = get_compiled_action(self._compiled_action, self.action)
+            # function (or list)
+            if action.kind == Action_kinds.CALL:
+                if self.modify:
+                    func_return = await action.call(ctx, self)
+                else:
+                    func_return = await action.call(ctx)
+                # the function could have written to the terminal
+                if renderer is not None:
+                    renderer.invalidate()
+                if func_return is None:
+                    return True
+                else:
+                    return bool(func_return)
+            # ui
+            else:
+                # display function or lazy back button
+                try:
+                    if action.kind == Action_kinds.MENU:
+                        # the navigator opens it
+                        if ctx.navigate:
+                            return Open_menu(action.source)
+                        await action.source._display(ctx, key_mapping, renderer)
+                    elif action.kind == Action_kinds.DISPLAY:
+                        action.display(ctx, key_mapping, renderer)
+                except AttributeError:
+                    # print("Option is not a UI_list object!")
+                    pass
+                return True
+        else:
+            return True
+
+
+class Job_button(Button):
+    """
+    Object for the options_ui method\n
+    When used as input in the options_ui function, it text that is pressable with the enter key, that starts the `job` in the background, so the menu keeps working while it runs.
+    Pressing it again while the job runs cancels it. (more job buttons can run their jobs at the same time)\n
+    While the job runs, the `spinner` (and the progress of the job, if it sets it) is displayed after the text, and when it ended, its result (or error).\n
+    Use it with a `refresh_fps` in `options_ui`, so the spinner moves, and the end of the job is displayed without a key press.\n
+    Structure: [text][pre_value][state of the job]
+    """
+    __slots__ = ("spinner",)
+
+    def __init__(self, text="", job:Job=None, pre_value=" ", spinner="|/-\\", multiline=False):
+        super().__init__(text, job, multiline)
+        self.pre_value = str(pre_value)
+        self.spinner = str(spinner)
+        self.bind("post_value", self._make_state_text)
+    
+    
+    @property
+    def job(self) -> Job|None:
+        return self.action
+    
+    
+    def _make_state_text(self):
+        """Returns the text of the state of the job."""
+        job = self.action
+        if job is None or job.state == Job_states.IDLE:
+            return ""
+        if job.state == Job_states.RUNNING:
+            txt = self.spinner[int(monotonic() * 10) % len(self.spinner)] if self.spinner else ""
+            if job.progress is not None:
+                txt += f" {job.progress:.0%}"
+            if job.cancel_requested:
+                txt += " cancelling"
+            return txt
+        if job.state == Job_states.DONE:
+            return "done" if job.result is None else f"done: {job.result}"
+        if job.state == Job_states.FAILED:
+            return f"failed: {job.error}"
+        return "cancelled"
+    
+    
+    async def _handle_action_async(self, key:Keys, key_mapping:Key_map, renderer:Renderer|None, ctx:Run_context):
+        if key == Keys.ENTER and self.action is not None:
+            if self.action.running:
+                self.action.cancel()
+            else:
+                self.action.start()
+            self.refresh()
+        return True
+
+
+class Text_field(Base_UI):
+    """
+    Object for the options_ui method\n
+    When used as input in the options_ui function, it draws a text field, that can be typed into, with the terminal cursor in it. The left and right arrow keys move the cursor, and backspace deletes the character before it.\n
+    The field is edited in place, so (with the CELLS mode `Renderer`, which `options_ui` uses by default, if there is a text field) typing a character only rewrites the characters after the cursor.\n
+    If `max_length` is not None, the text can't be longer than that. The `placeholder` is displayed while the text is empty.\n
+    Multiline makes the "cursor" draw at every line if the text is multiline.\n
+    Structure: [pre_text][value or placeholder][post_value]
+    """
+    __slots__ = ("cursor", "max_length", "placeholder")
+    wants_text = True
+
+    def __init__(self, value="", pre_text="", post_value="", max_length:int=None, placeholder="", multiline=False):
+        super().__init__(0, pre_text, "", False, post_value, multiline)
+        self.value:str = str(value).replace("\n", " ")
+        self.max_length = max_length
+        if max_length is not None:
+            self.max_length = max(int(max_length), 0)
+            self.value = self.value[:self.max_length]
+        self.placeholder = str(placeholder)
+        self.cursor = len(self.value)
+    
+    
+    def _make_special(self, icons_str:str):
+        return self.value if self.value else self.placeholder
+    
+    
+    def cursor_position(self, icon:str, width:int=None):
+        # the text before the cursor, laid out like the whole text
+        if self.multiline:
+            pre_text = self.pre_text.replace("\n", f"{icon}\n{icon}")
+        else:
+            pre_text = self.pre_text
+        lines = split_lines(icon + pre_text + self.value[:self.cursor], width)
+        return (len(lines) - 1, text_width(lines[-1]))
+    
+    
+    def _handle_action(self, key:Keys|str, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        cursor = min(self.cursor, len(self.value))
+        if type(key) is str:
+            if self.max_length is not None:
+                key = key[:max(self.max_length - len(self.value), 0)]
+            if not key:
+                return False
+            self.value = self.value[:cursor] + key + self.value[cursor:]
+            self.cursor = cursor + len(key)
+        elif key == Keys.BACKSPACE:
+            if cursor == 0:
+                return False
+            self.value = self.value[:cursor - 1] + self.value[cursor:]
+            self.cursor = cursor - 1
+        elif key == Keys.LEFT:
+            self.cursor = max(cursor - 1, 0)
+        elif key == Keys.RIGHT:
+            self.cursor = min(cursor + 1, len(self.value))
+        return True
+
+
+def _make_column(values:Sequence) -> array|tuple[str, ...]:
+    """Returns the values of a `Table` column in a compact form: an array, if they are all numbers, otherwise a tuple of (interned) strings."""
+    if type(values) is array:
+        return values
+    values = list(values)
+    if all(type(value) is int for value in values):
+        try:
+            return array("q", values)
+        except OverflowError:
+            pass
+    elif all(type(value) in (int, float) for value in values):
+        return array("d", values)
+    return tuple(sys.intern("" if value is None else str(value).replace("\n", " ")) for value in values)
+
+
+class Table(Base_UI):
+    """
+    Object for the options_ui method\n
+    When used as input in the options_ui function, it draws a table. The up and down arrow keys select a row (at the first and the last row, the selection moves to the other elements), the left and right arrow keys select a column, and the enter key sorts the table by the selected column (or reverses the order, if it's already sorted by it).\n
+    `columns` is a dictionary of the names of the columns, and their values (all of them the same length). Use `from_rows` to make it from a list of rows.\n
+    The columns are stored as arrays (if they are numbers) or tuples of strings. The width of a column is only measured once, when it's first displayed, and the order of the rows sorted by a column is only made once, so sorting by it again (or reversing it) doesn't sort the rows again.\n
+    Only the `height` rows around the selected row, and the columns that fit into the terminal around the selected column are displayed. (with a line that shows which part is displayed, if something is hidden)\n
+    `formats` are the format specifications of the columns by name (like ".2f"), and if `max_column_width` is not None, the longer values are cut off.\n
+    `value` is the number of the selected row in the data (not in the sorted order), and `column` is the number of the selected column. (marked with a "*" in the header, and the sorted column with a "^", or a "v" if it's reversed)\n
+    Structure: [pre_text][header][rows][post_value]
+    """
+    __slots__ = ("headers", "column", "height", "formats", "max_column_width", "separator", "sort_column", "reverse",
+                 "_columns", "_row_count", "_widths", "_orders", "_positions", "_rows_viewport", "_columns_viewport")
+
+    def __init__(self, columns:dict[str, Sequence], value=0, pre_text="", post_value="", height=10, formats:dict[str, str]=None, max_column_width:int=None, separator=" | ",
+                 sort_column:int=None, reverse=False):
+        super().__init__(0, pre_text, "", False, post_value)
+        self._rows_viewport = Viewport()
+        self._columns_viewport = Viewport()
+        self.column = 0
+        self.height = max(int(height), 1)
+        self.formats:dict[str, str] = {} if formats is None else dict(formats)
+        self.max_column_width = max_column_width
+        self.separator = str(separator)
+        self.sort_column:int|None = None
+        self.reverse = bool(reverse)
+        self.set_data(columns)
+        self.value = self._clamp_value(value, 0, max(self._row_count - 1, 0))
+        if sort_column is not None:
+            self.sort(sort_column, reverse)
+    
+    
+    @classmethod
+    def from_rows(cls, headers:Sequence[str], rows:Iterable[Sequence], **kwargs):
+        """Makes a table from the names of the columns, and the rows (sequences of values in the order of the columns). The other arguments are the same as for the `Table`."""
+        columns = [[] for _ in headers]
+        for row in rows:
+            for values, value in zip(columns, row):
+                values.append(value)
+        return cls(dict(zip(headers, columns)), **kwargs)
+    
+    
+    def __setattr__(self, name:str, value):
+        super().__setattr__(name, value)
+        # the widths depend on the attribute
+        if name in ("formats", "max_column_width"):
+            super().__setattr__("_widths", {})
+    
+    
+    def set_data(self, columns:dict[str, Sequence]):
+        """Replaces the columns of the table (and forgets the widths and the sorted orders of the old ones). The selection and the sorting stay, if they still fit."""
+        data = [_make_column(values) for values in columns.values()]
+        lengths = {len(values) for values in data}
+        if len(lengths) > 1:
+            raise ValueError("The columns of the table must have the same length.")
+        self._columns = data
+        self._row_count = lengths.pop() if lengths else 0
+        self._widths:dict[int, int] = {}
+        self._orders:dict[int, array] = {}
+        self._positions:dict[int, array] = {}
+        self.headers = tuple(str(header) for header in columns)
+        if self.sort_column is not None and self.sort_column >= len(data):
+            self.sort_column = None
+        self.column = min(self.column, max(len(data) - 1, 0))
+        self.value = min(self.value, max(self._row_count - 1, 0))
+    
+    
+    def sort(self, column:int|None, reverse=False):
+        """Sorts the table by the column (or back to the order of the data, if it's None), keeping the selected row."""
+        if column is not None and not 0 <= column < len(self._columns):
+            raise IndexError("The table doesn't have a column with that number.")
+        self.sort_column = column
+        self.reverse = bool(reverse)
+    
+    
+    def _get_order(self) -> array|None:
+        """Returns the numbers of the rows in the order of the sorted column (made the first time it's needed), or None if the table is not sorted."""
+        if self.sort_column is None:
+            return None
+        order = self._orders.get(self.sort_column)
+        if order is None:
+            values = self._columns[self.sort_column]
+            order = array("I" if self._row_count <= 0xFFFFFFFF else "Q", sorted(range(self._row_count), key=values.__getitem__))
+            self._orders[self.sort_column] = order
+        return order
+    
+    
+    def _row_at(self, position:int):
+        """Returns the number of the row, that is displayed at the position."""
+        order = self._get_order()
+        if order is None:
+            return position
+        return order[self._row_count - 1 - position] if self.reverse else order[position]
+    
+    
+    def _position_of(self, row:int):
+        """Returns the position, where the row is displayed."""
+        order = self._get_order()
+        if order is None:
+            return row
+        positions = self._positions.get(self.sort_column)
+        if positions is None:
+            positions = array(order.typecode, bytes(order.itemsize * self._row_count))
+            for position, order_row in enumerate(order):
+                positions[order_row] = position
+            self._positions[self.sort_column] = positions
+        position = positions[row]
+        return self._row_count - 1 - position if self.reverse else position
+    
+    
+    def _format(self, column:int, value:Any):
+        spec = self.formats.get(self.headers[column])
+        return str(value) if spec is None else format(value, spec)
+    
+    
+    def _get_width(self, column:int):
+        """Returns the width of the column (measured the first time it's needed)."""
+        width = self._widths.get(column)
+        if width is None:
+            values = self._columns[column]
+            if type(values) is tuple:
+                if self.headers[column] in self.formats:
+                    cells = [self._format(column, value) for value in values]
+                else:
+                    # (the strings are interned, so there are usually a lot less different ones)
+                    cells = set(values)
+                cells_width = max(map(text_width, cells), default=0)
+            elif values.typecode == "q" and self.headers[column] not in self.formats:
+                # the longest integer is the smallest or the largest one
+                cells_width = max(len(str(min(values))), len(str(max(values)))) if values else 0
+            else:
+                # (numbers are ascii)
+                cells_width = max(map(len, map(self._format, repeat(column), values)), default=0)
+            # (with the symbols of the selected and the sorted column)
+            width = max(cells_width, text_width(self.headers[column]) + 3)
+            if self.max_column_width is not None:
+                width = min(width, max(int(self.max_column_width), 1))
+            self._widths[column] = width
+        return width
+    
+    
+    def _make_cell(self, column:int, text:str, right=False):
+        """Returns the text cut off or padded to the width of the column."""
+        width = self._get_width(column)
+        current_width = text_width(text)
+        if current_width > width:
+            text = wrap_line(text, width)[0]
+            current_width = text_width(text)
+        if right:
+            return " " * (width - current_width) + text
+        return text + " " * (width - current_width)
+    
+    
+    def _move(self, key:Keys):
+        if not self._row_count:
+            return False
+        position = self._position_of(self.value)
+        if key == Keys.DOWN and position < self._row_count - 1:
+            self.value = self._row_at(position + 1)
+        elif key == Keys.UP and position > 0:
+            self.value = self._row_at(position - 1)
+        else:
+            return False
+        return True
+    
+    
+    def _handle_action(self, key:Keys, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        if not self._columns:
+            return False
+        if key == Keys.RIGHT:
+            self.column = min(self.column + 1, len(self._columns) - 1)
+        elif key == Keys.LEFT:
+            self.column = max(self.column - 1, 0)
+        elif key == Keys.ENTER:
+            if self.sort_column == self.column:
+                self.reverse = not self.reverse
+            else:
+                self.sort(self.column)
+        return True
+    
+    
+    def make_text(self, icon:str, icon_r:str, width:int=None):
+        """
+        Returns the text representation of the table.\n
+        If `width` is not None, only the columns that fit into `width` columns are displayed.
+        """
+        key = (icon, icon_r, width)
+        txt = self._texts.get(key)
+        if txt is None:
+            txt = self._make_table(icon, icon_r, width)
+            self._texts[key] = txt
+        return txt
+    
+    
+    def _make_table(self, icon:str, icon_r:str, width:int=None):
+        padding = " " * text_width(icon)
+        separator = self.separator
+        lines = []
+        if self.pre_text:
+            lines.extend(icon + line for line in self.pre_text.split("\n"))
+        # columns around the selected one
+        column_count = len(self._columns)
+        if width is None:
+            start, end = (0, column_count)
+        else:
+            separator_width = text_width(separator)
+            start, end = self._columns_viewport.window(self.column, column_count, max(width - text_width(icon) - text_width(icon_r), 1) + separator_width,
+                                                       lambda x: self._get_width(x) + separator_width)
+        visible_columns = range(start, end)
+        # header
+        headers = []
+        for x in visible_columns:
+            header = self.headers[x]
+            if x == self.column:
+                header = "*" + header
+            if x == self.sort_column:
+                header += " v" if self.reverse else " ^"
+            headers.append(self._make_cell(x, header))
+        lines.append(padding + separator.join(headers))
+        # rows around the selected one
+        top, bottom = self._rows_viewport.window(self._position_of(self.value) if self._row_count else 0, self._row_count, self.height)
+        right = [type(self._columns[x]) is array for x in visible_columns]
+        for position in range(top, bottom):
+            row = self._row_at(position)
+            cells = [self._make_cell(x, self._format(x, self._columns[x][row]), right[x - start]) for x in visible_columns]
+            line = separator.join(cells)
+            if row == self.value:
+                lines.append(icon + line + icon_r)
+            else:
+                lines.append(padding + line)
+        # which part is displayed
+        if top > 0 or bottom < self._row_count or start > 0 or end < column_count:
+            lines.append(f"{padding}rows {top + 1}-{bottom}/{self._row_count}, columns {start + 1}-{end}/{column_count}")
+        if self.post_value:
+            lines.extend(padding + line for line in self.post_value.split("\n"))
+        if width is not None:
+            lines = [wrap_line(line, width)[0] for line in lines]
+        return "\n".join(lines) + "\n"
+
+
+class Tree_node:
+    """
+    A node of a `Tree`. `key` is what the loader of the tree gets, to load its children, and `text` is what is displayed.\n
+    `children` are the loaded children (None if they aren't loaded, or were evicted from the cache), and `depth` is 0 for the nodes at the top.
+    """
+    __slots__ = ("key", "text", "has_children", "parent", "depth", "children", "expanded")
+
+    def __init__(self, key:Any, text:str, has_children:bool, parent:"Tree_node|None"):
+        self.key = key
+        self.text = str(text).replace("\n", " ")
+        self.has_children = bool(has_children)
+        self.parent = parent
+        self.depth = -1 if parent is None else parent.depth + 1
+        self.children:tuple[Tree_node, ...]|None = None
+        self.expanded = False
+
+
+class Tree(Base_UI):
+    """
+    Object for the options_ui method\n
+    When used as input in the options_ui function, it draws a tree, with nodes that can be expanded and collapsed. The up and down arrow keys select a node (at the first and the last one, the selection moves to the other elements), the right arrow key expands the selected node (or selects its first child), the left arrow key collapses it (or selects its parent), and the enter key expands or collapses it (or calls the `action` with its key, if it has no children).\n
+    The children of a node are only loaded when it's first expanded, by calling `loader` with the key of the node (and with `root` for the nodes at the top). It returns the children as (key, text, has children) tuples, for example `lambda path: [(entry.path, entry.name, entry.is_dir()) for entry in os.scandir(path)]`. (if it returns an awaitable, it's awaited. The nodes at the top are loaded before the tree is first displayed, so with such a loader, `selected_node` can only be used after that)\n
+    The loaded children of at most `max_loaded` nodes are kept, and when there are more, the children of the least recently loaded, collapsed nodes are forgotten. (they are loaded again, when the node is expanded again)\n
+    The displayed rows are only changed where a node is expanded or collapsed, and only the `height` rows around the selected one are made into text.\n
+    If the `action` returns False the screen will not rerender.\n
+    `value` is the number of the selected row. Use `selected_node` for the selected node.\n
+    Structure: [pre_text][rows][post_value]
+    """
+    __slots__ = ("loader", "root", "action", "height", "max_loaded", "expanded_symbol", "collapsed_symbol", "indent", "_root_node", "_rows", "_loaded", "_viewport")
+
+    def __init__(self, loader:Callable[[Any], Iterable[tuple[Any, str, bool]]], root:Any=None, pre_text="", post_value="", height=10, action:Callable[[Any], Any]=None, max_loaded=1000,
+                 expanded_symbol="- ", collapsed_symbol="+ ", indent="  "):
+        super().__init__(0, pre_text, "", False, post_value)
+        self.loader = loader
+        self.root = root
+        self.action = action
+        self.height = max(int(height), 1)
+        self.max_loaded = max(int(max_loaded), 1)
+        self.expanded_symbol = str(expanded_symbol)
+        self.collapsed_symbol = str(collapsed_symbol)
+        self.indent = str(indent)
+        self._viewport = Viewport()
+        self._root_node:Tree_node|None = None
+        self._rows:list[Tree_node] = []
+        self._loaded:OrderedDict[Tree_node, None] = OrderedDict()
+    
+    
+    @property
+    def selected_node(self) -> Tree_node|None:
+        """The selected node. (None if the tree is empty)"""
+        self._ensure_root()
+        return self._rows[self.value] if self._rows else None
+    
+    
+    def reload(self):
+        """Forgets the loaded nodes, so the tree is loaded again (collapsed), when it's next displayed."""
+        self._root_node = None
+        self._rows = []
+        self._loaded.clear()
+        self.value = 0
+    
+    
+    def _ensure_root(self):
+        """
+        Loads the nodes at the top, if they aren't loaded.\n
+        Throws a TypeError if the loader returns an awaitable. (it can only be awaited by `_load_root`, when the tree is displayed)
+        """
+        if self._root_node is None:
+            children = self.loader(self.root)
+            if isinstance(children, Awaitable):
+                if hasattr(children, "close"):
+                    children.close()
+                raise TypeError("The loader of the tree returned an awaitable, so the nodes at the top can only be loaded by displaying the tree (with options_ui or options_ui_async).")
+            self._set_root(children)
+    
+    
+    async def _load_root(self, ctx:Run_context):
+        """Loads the nodes at the top, if they aren't loaded, in the way the `ctx` says. (awaiting the loader, if it returns an awaitable)"""
+        if self._root_node is None:
+            self._set_root(await ctx.call(self.loader, self.root))
+    
+    
+    def _set_root(self, children:Iterable[tuple[Any, str, bool]]):
+        root = Tree_node(self.root, "", True, None)
+        root.expanded = True
+        self._set_children(root, children)
+        self._root_node = root
+        self._rows = list(root.children)
+        self.value = min(self.value, max(len(self._rows) - 1, 0))
+    
+    
+    def _set_children(self, node:Tree_node, children:Iterable[tuple[Any, str, bool]]):
+        """Makes the nodes of the loaded children, and forgets the children of the least recently loaded nodes, that are not displayed, if too many are loaded."""
+        node.children = tuple(Tree_node(key, text, has_children, node) for key, text, has_children in children)
+        if node.parent is None:
+            return
+        loaded = self._loaded
+        loaded[node] = None
+        loaded.move_to_end(node)
+        if len(loaded) > self.max_loaded:
+            for old_node in list(loaded):
+                if len(loaded) <= self.max_loaded:
+                    break
+                if old_node is not node and not self._is_displayed(old_node):
+                    self._forget_children(old_node)
+    
+    
+    def _is_displayed(self, node:Tree_node):
+        """Returns if the children of the node are displayed. (it's expanded, and all of its parents too)"""
+        while node is not None:
+            if not node.expanded:
+                return False
+            node = node.parent
+        return True
+    
+    
+    def _forget_children(self, node:Tree_node):
+        """Forgets the loaded children of the node (and their children)."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.children is not None:
+                stack.extend(current.children)
+                current.children = None
+                current.expanded = False
+                self._loaded.pop(current, None)
+    
+    
+    def _visible_rows(self, node:Tree_node):
+        """Returns the rows under the expanded node, with the children of its expanded (and still loaded) children."""
+        rows = []
+        stack = list(reversed(node.children))
+        while stack:
+            current = stack.pop()
+            rows.append(current)
+            if current.expanded:
+                if current.children is None:
+                    current.expanded = False
+                else:
+                    stack.extend(reversed(current.children))
+        return rows
+    
+    
+    async def _expand(self, row:int, ctx:Run_context):
+        """Expands the node in the row, and inserts its visible rows under it. Returns if it changed."""
+        node = self._rows[row]
+        if node.expanded or not node.has_children:
+            return False
+        if node.children is None:
+            self._set_children(node, await ctx.call(self.loader, node.key))
+        else:
+            self._loaded.move_to_end(node)
+        node.expanded = True
+        self._rows[row + 1:row + 1] = self._visible_rows(node)
+        return True
+    
+    
+    def _collapse(self, row:int):
+        """Collapses the node in the row, and removes the rows under it. Returns if it changed."""
+        node = self._rows[row]
+        if not node.expanded:
+            return False
+        node.expanded = False
+        end = row + 1
+        while end < len(self._rows) and self._rows[end].depth > node.depth:
+            end += 1
+        del self._rows[row + 1:end]
+        if self.value > row:
+            self.value = row
+        return True
+    
+    
+    def _move(self, key:Keys):
+        self._ensure_root()
+        if key == Keys.DOWN and self.value < len(self._rows) - 1:
+            self.value += 1
+        elif key == Keys.UP and self.value > 0:
+            self.value -= 1
+        else:
+            return False
+        return True
+    
+    
+    def _handle_action(self, key:Keys, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        return run_sync(self._handle_action_async(key, key_mapping, renderer, handler_context(backend)))
+    
+    
+    async def _handle_action_async(self, key:Keys, key_mapping:Key_map, renderer:Renderer|None, ctx:Run_context):
+        await self._load_root(ctx)
+        if not self._rows:
+            return False
+        row = self.value
+        node = self._rows[row]
+        if key == Keys.RIGHT:
+            if not await self._expand(row, ctx):
+                if not (node.expanded and node.children):
+                    return False
+                self.value = row + 1
+        elif key == Keys.LEFT:
+            if not self._collapse(row):
+                if node.depth == 0:
+                    return False
+                # select the parent
+                while self._rows[row] is not node.parent:
+                    row -= 1
+                self.value = row
+        elif key == Keys.ENTER:
+            if node.has_children:
+                if not self._collapse(row):
+                    await self._expand(row, ctx)
+            elif self.action is not None:
+                func_return = await ctx.call(self.action, node.key)
+                # the function could have written to the terminal
+                if renderer is not None:
+                    renderer.invalidate()
+                if func_return is not None:
+                    return bool(func_return)
+        # the rows changed
+        self._texts.clear()
+        return True
+    
+    
+    def make_text(self, icon:str, icon_r:str, width:int=None):
+        """
+        Returns the text representation of the tree.\n
+        If `width` is not None, the rows are cut off at `width` columns.
+        """
+        key = (icon, icon_r, width)
+        txt = self._texts.get(key)
+        if txt is None:
+            txt = self._make_tree(icon, icon_r, width)
+            self._texts[key] = txt
+        return txt
+    
+    
+    def _make_tree(self, icon:str, icon_r:str, width:int=None):
+        self._ensure_root()
+        padding = " " * text_width(icon)
+        lines = []
+        if self.pre_text:
+            lines.extend(icon + line for line in self.pre_text.split("\n"))
+        rows = self._rows
+        start, end = self._viewport.window(self.value, len(rows), self.height)
+        more_up, more_down = self._viewport.make_indicators(start, end, len(rows))
+        if more_up:
+            lines.append(padding + more_up)
+        leaf_symbol = " " * text_width(self.collapsed_symbol)
+        for x in range(start, end):
+            node = rows[x]
+            if not node.has_children:
+                symbol = leaf_symbol
+            elif node.expanded:
+                symbol = self.expanded_symbol
+            else:
+                symbol = self.collapsed_symbol
+            line = self.indent * node.depth + symbol + node.text
+            if x == self.value:
+                lines.append(icon + line + icon_r)
+            else:
+                lines.append(padding + line)
+        if more_down:
+            lines.append(padding + more_down)
+        if self.post_value:
+            lines.extend(padding + line for line in self.post_value.split("\n"))
+        if width is not None:
+            lines = [wrap_line(line, width)[0] for line in lines]
+        return "\n".join(lines) + "\n"
+
+
+def _make_element_text(element:Base_UI|UI_list|object, selected:bool, cursor_icon:Cursor_icon, columns:int=None):
+    """
+    Returns the text that represents an element of the `options_ui` function.\n
+    If `columns` is not None, the lines are wrapped, so they fit into a terminal with that many columns.
+    """
+    width = None if columns is None else columns - 1
+    # UI elements
+    if isinstance(element, Base_UI):
+        icon = cursor_icon.s_icon if selected else cursor_icon.icon
+        icon_r = cursor_icon.s_icon_r if selected else cursor_icon.icon_r
+        if method_accepts(type(element), "make_text", "width"):
+            return element.make_text(icon, icon_r, width=width)
+        # (an override from before the width was passed)
+        return wrap_text(element.make_text(icon, icon_r), width)
+    # UI_list
+    elif isinstance(element, UI_list):
+        if element.answer_list[0] is not None:
+            icon = element.cursor_icon
+            text_width = get_text_width(columns, [(icon.s_icon, icon.s_icon_r), (icon.icon, icon.icon_r)])
+            if selected:
+                return layout_answer(element.answer_list[0], icon.s_icon, icon.s_icon_r, element.multiline, text_width)
+            else:
+                return layout_answer(element.answer_list[0], icon.icon, icon.icon_r, element.multiline, text_width)
+        else:
+            return "\n"
+    elif element is None:
+        return "\n"
+    else:
+        return wrap_text(str(element) + "\n", width)
+
+
+async def _get_options_key(element:Base_UI|UI_list, no_enter:bool, key_mapping:Key_map, ctx:Run_context, timeout:float=None):
+    """
+    Returns the next key for the selected element of the `options_ui` function.\n
+    If `timeout` is not None, it only waits `timeout` seconds for the key, and returns None if it didn't come.
+    """
+    if isinstance(element, (Toggle, Button, UI_list)):
+        mode = Get_key_modes.IGNORE_HORIZONTAL
+    else:
+        mode = Get_key_modes.NO_IGNORE
+    while True:
+        if timeout is None:
+            key = await ctx.get_key(mode, key_mapping)
+        else:
+            key = await ctx.poll_key(mode, key_mapping, timeout)
+        # (tables and trees use all keys)
+        if key == Keys.ENTER and mode == Get_key_modes.NO_IGNORE and not isinstance(element, (Table, Tree)):
+            if no_enter:
+                return Keys.ESCAPE
+            continue
+        return key
+
+
+def options_ui(elements:list[Base_UI|UI_list], title:str=None, cursor_icon:Cursor_icon=None, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, scroll=False, scroll_height:int=None, backend:IO_backend=None, refresh_fps:float=None):
+    """
+    Prints the title and then a list of elements that the user can cycle between with the up and down arrows, and adjust with either the left and right arrow keys or the enter key depending on the input object type, and exit with Escape.\n
+    Accepts mainly a list of objects (Slider, Choice, Toggle (and UI_list)).\n
+    if an element in the list is not one of these objects, the value will be printed, (or if it's None, the line will be blank) and cannot be selected.\n
+    If `scroll` is `True`, only the elements that fit in the terminal (or in `scroll_height` lines) are displayed, with lines showing how many elements are hidden above and below them.\n
+    `renderer` decides how the frames get written to the terminal. (by default, only the lines that changed get rewritten)\n
+    Keys that are pressed faster than the screen can be rendered (or faster than the `max_fps` of the renderer) are applied together, with only one frame rendered for all of them.\n
+    `backend` is where the keys are read from, and the frames are written to. (the terminal by default)\n
+    If `refresh_fps` is not None, the elements that are bound to data sources (with `Base_UI.bind`) are refreshed that many times per second, even without input, and the screen is redrawn if any of them changed.\n
+    Actions that return awaitables (like `async` functions) are run in their own event loop. (use `options_ui_async` to run the menu in an existing event loop)
+    """
+    if backend is None:
+        backend = get_terminal_backend()
+    return run_sync(_options_ui(Run_context(backend), elements, title, cursor_icon, key_mapping, renderer, scroll, scroll_height, refresh_fps))
+
+
+async def options_ui_async(elements:list[Base_UI|UI_list], title:str=None, cursor_icon:Cursor_icon=None, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, scroll=False, scroll_height:int=None, backend:IO_backend=None, refresh_fps:float=None):
+    """
+    The coroutine version of `options_ui`, for using the menu in an event loop.\n
+    The keys are read without blocking the loop, the loop can run after every frame, and actions that return awaitables (like `async` functions) are awaited.
+    """
+    if backend is None:
+        backend = get_terminal_backend()
+    return await _options_ui(Run_context(backend, True), elements, title, cursor_icon, key_mapping, renderer, scroll, scroll_height, refresh_fps)
+
+
+def _save_options_state(state:Menu_state|None, selected:int, viewport:Viewport|None):
+    if state is not None:
+        state.selected = selected
+        state.top = 0 if viewport is None else viewport.top
+
+
+async def _options_ui(ctx:Run_context, elements:list[Base_UI|UI_list], title:str=None, cursor_icon:Cursor_icon=None, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, scroll=False, scroll_height:int=None, refresh_fps:float=None, state:Menu_state=None):
+    """
+    The `options_ui` function, that reads the keys and runs the actions in the way the `ctx` says.\n
+    If there is a `state`, the menu continues from it, and saves into it.
+    """
+    if cursor_icon is None:
+        cursor_icon = DEFAULT_CURSOR_ICON
+    # text input
+    wants_text = any(isinstance(element, Base_UI) and element.wants_text for element in elements)
+    if renderer is None:
+        renderer = Renderer(Render_modes.CELLS) if wants_text else Renderer()
+    backend = ctx.backend
+    viewport = Viewport(scroll_height) if scroll else None
+    title_lines = ctx.header.count("\n")
+    if title is not None:
+        title_lines += str(title).count("\n") + 2
+    # is enter needed?
+    no_enter = True
+    for element in elements:
+        if isinstance(element, (Toggle, UI_list, Table, Tree)):
+            no_enter = False
+            break
+    # put selected on selectable
+    selected = 0
+    while not isinstance(elements[selected], (Base_UI, UI_list)):
+        selected += 1
+        if selected >= len(elements):
+            raise UINoSelectablesError("No selectable element in the elements list.")
+    if state is not None and state.selected is not None:
+        selected = state.selected
+        if viewport is not None:
+            viewport.top = state.top
+    key_mapping = Key_map.compile(key_mapping)
+    if wants_text:
+        key_mapping = key_mapping.with_text()
+    # live elements
+    bound = [element for element in elements if isinstance(element, Base_UI) and element._bindings]
+    refresh_interval = (1 / refresh_fps) if (refresh_fps and bound) else None
+    for element in bound:
+        element.refresh()
+    last_refresh = monotonic()
+    # (the nodes at the top of the trees are loaded before they are rendered, so their loaders can be awaited)
+    trees = [element for element in elements if isinstance(element, Tree)]
+    try:
+        # render/getkey loop
+        key = None
+        while key != Keys.ESCAPE:
+            # render
+            for tree in trees:
+                await tree._load_root(ctx)
+            if ctx.probe is not None:
+                ctx.probe.frame_start()
+            parts = [ctx.header]
+            if title is not None:
+                parts.append(title)
+                parts.append("\n\n")
+            terminal_size = backend.terminal_size()
+            start = 0
+            end = len(elements)
+            if viewport is not None:
+                start, end = viewport.window(selected, len(elements), viewport.get_height(title_lines + 1, terminal_size[1]),
+                                             lambda x: _make_element_text(elements[x], False, cursor_icon, terminal_size[0]).count("\n"))
+                more_up, more_down = viewport.make_indicators(start, end, len(elements))
+                parts.append(more_up)
+                parts.append("\n")
+            cursor = None
+            for x in range(start, end):
+                if x == selected and isinstance(elements[x], Base_UI):
+                    cursor = elements[x].cursor_position(cursor_icon.s_icon, terminal_size[0] - 1)
+                    if cursor is not None:
+                        cursor = (sum(part.count("\n") for part in parts) + cursor[0], cursor[1])
+                parts.append(_make_element_text(elements[x], selected == x, cursor_icon, terminal_size[0]))
+            if viewport is not None:
+                parts.append(more_down)
+                parts.append("\n")
+            txt = "".join(parts)
+            if ctx.probe is not None:
+                ctx.probe.frame_built()
+            out = renderer.render(txt, terminal_size, cursor)
+            backend.write(out)
+            if ctx.probe is not None:
+                ctx.probe.frame_written(title, out)
+            if state is not None:
+                state.frame = txt
+            await ctx.frame_done()
+            # move selection/change value
+            # (wait for a key until the screen changes, then apply the keys that come in before the next frame is due)
+            screen_changed = False
+            while True:
+                if screen_changed:
+                    timeout = renderer.time_until_frame()
+                elif refresh_interval is not None:
+                    timeout = max(last_refresh + refresh_interval - monotonic(), 0.0)
+                else:
+                    timeout = None
+                key = await _get_options_key(elements[selected], no_enter, key_mapping, ctx, timeout)
+                # refresh the live elements
+                if key is None and not screen_changed:
+                    last_refresh = monotonic()
+                    changed = False
+                    for element in bound:
+                        if element.refresh():
+                            changed = True
+                    if changed:
+                        break
+                    continue
+                if key is None or key == Keys.ESCAPE:
+                    break
+                # move selection
+                if (key == Keys.UP or key == Keys.DOWN) and isinstance(elements[selected], Base_UI) and elements[selected]._move(key):
+                    screen_changed = True
+                elif key == Keys.UP or key == Keys.DOWN:
+                    while True:
+                        if key == Keys.DOWN:
+                            selected += 1
+                            if selected > len(elements) - 1:
+                                selected = 0
+                        else:
+                            selected -= 1
+                            if selected < 0:
+                                selected = len(elements) - 1
+                        if isinstance(elements[selected], (Base_UI, UI_list)):
+                            break
+                    screen_changed = True
+                # change value Base_UI
+                elif isinstance(elements[selected], Base_UI) and (key in [Keys.LEFT, Keys.RIGHT, Keys.ENTER] or
+                                                                  (elements[selected].wants_text and (type(key) is str or key == Keys.BACKSPACE))):
+                    # to prevent useless screen re-render at slider
+                    changed = await handle_action(elements[selected], key, key_mapping, renderer, ctx)
+                    if isinstance(changed, Open_menu):
+                        _save_options_state(state, selected, viewport)
+                        return changed
+                    if changed:
+                        screen_changed = True
+                        if key == Keys.ENTER:
+                            break
+                # change value UI_list
+                elif isinstance(elements[selected], UI_list) and key == Keys.ENTER:
+                    action = await handle_action(elements[selected], 0, key_mapping, renderer, ctx)
+                    if action is not None:
+                        _save_options_state(state, selected, viewport)
+                        return action
+                    break
+                # (the other keys don't change anything, so they don't need a new frame)
+    finally:
+        backend.restore()
+
+
+class Options_menu:
+    """
+    An `options_ui` menu as an object, so it can be used as a nested menu (like a `UI_list`) in the `action_list` of a `UI_list`, as the action of a `Button`, or in a `Navigator`.\n
+    The arguments are the same as the ones of `options_ui`.
+    """
+    __slots__ = ("elements", "title", "cursor_icon", "scroll", "scroll_height", "refresh_fps")
+
+    def __init__(self, elements:list[Base_UI|UI_list], title:str=None, cursor_icon:Cursor_icon=None, scroll=False, scroll_height:int=None, refresh_fps:float=None):
+        self.elements = elements
+        self.title = title
+        self.cursor_icon = cursor_icon
+        self.scroll = bool(scroll)
+        self.scroll_height = scroll_height
+        self.refresh_fps = refresh_fps
+    
+    
+    def display(self, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        """Displays the menu with `options_ui`."""
+        if backend is None:
+            backend = get_terminal_backend()
+        return run_sync(self._display(Run_context(backend), key_mapping, renderer))
+    
+    
+    async def display_async(self, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        """Displays the menu with `options_ui_async`."""
+        if backend is None:
+            backend = get_terminal_backend()
+        return await self._display(Run_context(backend, True), key_mapping, renderer)
+    
+    
+    async def _display(self, ctx:Run_context, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, state:Menu_state=None):
+        return await _options_ui(ctx, self.elements, self.title, self.cursor_icon, key_mapping, renderer, self.scroll, self.scroll_height, self.refresh_fps, state)
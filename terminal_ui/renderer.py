@@ -0,0 +1,125 @@
+import os
+from enum import Enum, auto
+from shutil import get_terminal_size
+from time import monotonic
+
+from terminal_ui.layout import text_width
+from terminal_ui.canvas import Canvas
+# from layout import text_width
+# from canvas import Canvas
+
+
+class Render_modes(Enum):
+    FULL = auto()
+    DIFF = auto()
+    CELLS = auto()
+
+
+_vt_enabled = False
+
+
+def _enable_vt():
+    """Makes the windows console understand ANSI escape sequences (only needs to run once)."""
+    global _vt_enabled
+    if not _vt_enabled:
+        if os.name == "nt":
+            os.system("")
+        _vt_enabled = True
+
+
+class Renderer:
+    """
+    Object that turns the frames of the UI elements into the text that has to be written to the terminal.\n
+    Depending on the mode:\n
+    \tFULL: "clears" the screen with 65 newlines and reprints the whole frame every time (old behaviour)
+    \tDIFF: remembers the previously emitted frame, and only rewrites the lines that changed, using ANSI cursor addressing
+    \tCELLS: like DIFF, but the changed lines are drawn on a `Canvas`, so only the characters that changed are rewritten (typing into a `Text_field` only writes one character)\n
+    If a frame doesn't fit into the terminal, the DIFF mode falls back to redrawing the whole frame, because the lines that scrolled off can't be addressed.\n
+    Call `invalidate` if something other than the renderer wrote to the terminal, to make the next frame a full redraw.\n
+    `max_fps` is the most frames per second the UI elements should render. Until the next frame is due, they keep applying the incoming keys instead. (None means no limit)\n
+    The terminal cursor is left at the end of the frame, or at the `cursor` (line, column) position given to `render`, if there is one.
+    """
+    def __init__(self, mode:Render_modes=Render_modes.DIFF, max_fps:float|None=60):
+        self.mode = mode
+        self.max_fps = max_fps
+        self._lines:list[str]|None = None
+        self._canvas:Canvas|None = None
+        self._last_frame_time = 0.0
+
+
+    def time_until_frame(self):
+        """Returns how many seconds are left until the next frame can be rendered."""
+        if not self.max_fps:
+            return 0.0
+        return max(self._last_frame_time + 1 / self.max_fps - monotonic(), 0.0)
+
+
+    def invalidate(self):
+        """Forgets the previously emitted frame, so the next frame will be fully redrawn."""
+        self._lines = None
+
+
+    def render(self, txt:str, terminal_size:tuple[int, int]=None, cursor:tuple[int, int]=None):
+        """
+        Returns the text that has to be written to the terminal, to make it display the `txt` frame.\n
+        `terminal_size` is the (columns, lines) size of the terminal. (if None, it's the size of the real terminal)\n
+        `cursor` is the (line, column) position in the frame (from 0), where the terminal cursor should be left. (not in FULL mode)
+        """
+        self._last_frame_time = monotonic()
+        if self.mode == Render_modes.FULL:
+            return "\n" * 65 + txt + "\n"
+        _enable_vt()
+        lines = txt.split("\n")
+        old_lines = self._lines
+        if not self._fits(lines, terminal_size):
+            self._lines = None
+            return "\x1b[H\x1b[2J" + txt
+        self._lines = lines
+        if self.mode == Render_modes.CELLS:
+            out = self._render_cells(lines, old_lines, terminal_size)
+        elif old_lines is None:
+            out = ["\x1b[H\x1b[2J" + txt]
+        else:
+            out = []
+            for x in range(len(lines)):
+                if x >= len(old_lines) or lines[x] != old_lines[x]:
+                    out.append(f"\x1b[{x + 1};1H{lines[x]}\x1b[K")
+            if len(lines) < len(old_lines):
+                out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")
+        if cursor is not None:
+            out.append(f"\x1b[{cursor[0] + 1};{cursor[1] + 1}H")
+        elif out and old_lines is not None:
+            out.append(f"\x1b[{len(lines)};{text_width(lines[-1]) + 1}H")
+        return "".join(out)
+
+
+    def _render_cells(self, lines:list[str], old_lines:list[str]|None, terminal_size:tuple[int, int]=None):
+        """Draws the lines that changed on the canvas, and returns the parts of the text that rewrite the cells that changed."""
+        columns, rows = get_terminal_size() if terminal_size is None else terminal_size
+        canvas = self._canvas
+        if canvas is None or canvas.columns != columns or canvas.lines != rows:
+            canvas = self._canvas = Canvas(columns, rows)
+            old_lines = None
+        if old_lines is None:
+            # a full redraw, and the canvas remembers it
+            canvas.clear()
+            for y, line in enumerate(lines):
+                canvas.put(0, y, line)
+            canvas.mark_flushed()
+            return ["\x1b[H\x1b[2J" + "\n".join(lines)]
+        for y in range(max(len(lines), len(old_lines))):
+            line = lines[y] if y < len(lines) else ""
+            if y >= len(old_lines) or y >= len(lines) or line != old_lines[y]:
+                canvas.put_line(y, line)
+        return [canvas.flush()]
+
+
+    def _fits(self, lines:list[str], terminal_size:tuple[int, int]=None):
+        """Returns if the lines can be displayed in the terminal without scrolling or wrapping."""
+        columns, rows = get_terminal_size() if terminal_size is None else terminal_size
+        if len(lines) > rows:
+            return False
+        for line in lines:
+            if text_width(line) >= columns:
+                return False
+        return True
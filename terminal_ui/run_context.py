@@ -0,0 +1,142 @@
+from collections.abc import Awaitable
+from time import perf_counter
+from typing import Any, Callable, Coroutine
+
+from terminal_ui.keys import Get_key_modes, Keys
+from terminal_ui.key_map import Key_map
+from terminal_ui.backends import IO_backend, get_terminal_backend
+from terminal_ui.instrumentation import Frame_probe, get_instrumentation
+# from keys import Get_key_modes, Keys
+# from key_map import Key_map
+# from backends import IO_backend, get_terminal_backend
+# from instrumentation import Frame_probe, get_instrumentation
+
+
+class Run_context:
+    """
+    The state that is passed between the coroutines of the menus (and their nested menus).\n
+    If `is_async` is True, the menus run in an event loop: the keys are read with the async methods of the `backend`, coroutine actions are awaited, and the menus let the loop run after every frame.\n
+    Otherwise the coroutines never suspend, so they can be run with `run_sync`: the keys are read with the blocking methods of the `backend`, and coroutine actions are run in their own event loop.\n
+    If `navigate` is True, the menus don't display their nested menus, but return an `Open_menu` to the `Navigator` that runs them.\n
+    `header` is the text that is displayed above the menus. (like the breadcrumbs of the `Navigator`)\n
+    `probe` measures the frames of the menus, if the instrumentation was enabled when the context was made, otherwise it's None.
+    """
+    __slots__ = ("backend", "is_async", "navigate", "header", "probe")
+
+    def __init__(self, backend:IO_backend, is_async=False, navigate=False, header=""):
+        self.backend = backend
+        self.is_async = bool(is_async)
+        self.navigate = bool(navigate)
+        self.header = str(header)
+        self.probe:Frame_probe|None = get_instrumentation().make_probe()
+
+
+    async def get_key(self, mode:Get_key_modes, key_map:Key_map) -> Keys|str:
+        """Waits for a key from the backend."""
+        if self.probe is not None:
+            start = perf_counter()
+        if self.is_async:
+            key = await self.backend.get_key_async(mode, key_map)
+        else:
+            key = self.backend.get_key(mode, key_map)
+        if self.probe is not None:
+            self.probe.key_waited(start, key)
+        return key
+
+
+    async def poll_key(self, mode:Get_key_modes, key_map:Key_map, timeout:float=0) -> Keys|str|None:
+        """Returns the next key from the backend, if it comes in `timeout` seconds, otherwise None."""
+        if self.probe is not None:
+            start = perf_counter()
+        if self.is_async:
+            key = await self.backend.poll_key_async(mode, key_map, timeout)
+        else:
+            key = self.backend.poll_key(mode, key_map, timeout)
+        if self.probe is not None:
+            self.probe.key_waited(start, key)
+        return key
+
+
+    async def call(self, func:Callable, *args, **kwargs) -> Any:
+        """Calls an action function (after restoring the terminal), and returns what it returned. (or what it resolved to, if it returned an awaitable)"""
+        self.backend.restore()
+        result = func(*args, **kwargs)
+        if isinstance(result, Awaitable):
+            if self.is_async:
+                result = await result
+            else:
+                # (asyncio is only imported when it's needed, because importing it is slow)
+                import asyncio
+                result = asyncio.run(_await(result))
+        return result
+
+
+    async def frame_done(self):
+        """Called after a frame is written, to let the event loop run."""
+        if self.is_async:
+            import asyncio
+            await asyncio.sleep(0)
+
+
+class Menu_state:
+    """
+    The state of a menu, that is kept while its nested menus are open in a `Navigator`, so it can continue from where it was.\n
+    `selected` is the selected answer/element, `top` is the top of the viewport, `query` is the filter, and `frame` is the last frame the menu rendered.
+    """
+    __slots__ = ("selected", "top", "query", "frame")
+
+    def __init__(self):
+        self.selected:int|None = None
+        self.top = 0
+        self.query = ""
+        self.frame:str|None = None
+
+
+class Open_menu:
+    """Returned by a menu in a `Navigator`, if the `menu` should be opened on top of it."""
+    __slots__ = ("menu",)
+
+    def __init__(self, menu:Any):
+        self.menu = menu
+
+
+# the contexts of the menus, that are calling a sync `_handle_action` (the innermost one is the last)
+_handler_contexts:list[Run_context] = []
+
+
+def call_in_context(ctx:Run_context, func:Callable, *args, **kwargs) -> Any:
+    """Calls the (sync) function, with `handler_context` returning the `ctx` while it runs."""
+    _handler_contexts.append(ctx)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _handler_contexts.pop()
+
+
+def handler_context(backend:IO_backend=None) -> Run_context:
+    """
+    Returns the context, that the sync `_handle_action` of an element should run its actions in.\n
+    If a menu called it (like an override from an older version, that calls the `_handle_action` of its base class without the `backend`), it's the context of that menu, so the actions use its backend (and its event loop), otherwise it's a new context for the `backend`. (the terminal by default)
+    """
+    if _handler_contexts and (backend is None or backend is _handler_contexts[-1].backend):
+        return _handler_contexts[-1]
+    if backend is None:
+        backend = get_terminal_backend()
+    return Run_context(backend)
+
+
+async def _await(awaitable:Awaitable):
+    return await awaitable
+
+
+def run_sync(coroutine:Coroutine):
+    """
+    Runs the coroutine of a menu that uses a sync `Run_context` to the end, without an event loop, and returns what it returned.\n
+    Throws a `RuntimeError` if the coroutine tries to suspend. (it's also used for the sync `_handle_action` of the elements, which can't wait for the event loop of an async menu either)
+    """
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coroutine.close()
+    raise RuntimeError("A menu tried to suspend outside of an event loop, or in a sync `_handle_action`. (use the async version of the menu, or override `_handle_action_async`)")
@@ -0,0 +1,186 @@
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, Sequence
+
+
+_SEPARATOR = "\x00"
+
+
+class Search_results:
+    """
+    The (ordered) numbers of the answers that contain a query.\n
+    The results are only searched for when they are needed, so a query that matches most of a long list can be displayed, without finding every result first.
+    (only `len` and the negative indexes need all of them)
+    """
+    __slots__ = ("_found", "_matches")
+
+    def __init__(self, matches:Iterator[int]):
+        self._found = array("q")
+        self._matches:Iterator[int]|None = matches
+
+
+    @property
+    def complete(self):
+        """If every result was found."""
+        return self._matches is None
+
+
+    def ensure(self, count:int):
+        """Finds results until there are at least `count` of them (or there are no more)."""
+        missing = count - len(self._found)
+        if missing > 0 and self._matches is not None:
+            self._found.extend(islice(self._matches, missing))
+            if len(self._found) < count:
+                self._matches = None
+
+
+    def known_length(self):
+        """Returns the number of results that were found so far."""
+        return len(self._found)
+
+
+    def index_of(self, number:int):
+        """Returns the position of the answer `number` in the results (or where it would be), finding the results until that."""
+        while self._matches is not None and (not self._found or self._found[-1] < number):
+            self.ensure(len(self._found) * 2 + 64)
+        return bisect_left(self._found, number)
+
+
+    def __len__(self):
+        while self._matches is not None:
+            self.ensure(len(self._found) * 2 + 64)
+        return len(self._found)
+
+
+    def __bool__(self):
+        self.ensure(1)
+        return len(self._found) > 0
+
+
+    def __getitem__(self, index:int) -> int:
+        if index < 0:
+            index += len(self)
+        else:
+            self.ensure(index + 1)
+        return self._found[index]
+
+
+    def __iter__(self):
+        x = 0
+        while True:
+            if x < len(self._found):
+                yield self._found[x]
+                x += 1
+            elif self._matches is not None:
+                self.ensure(len(self._found) * 2 + 64)
+            else:
+                return
+
+
+class Search_index:
+    """
+    Finds the answers that contain a query (ignoring case), for the type-to-filter mode of `UI_list`.\n
+    The index is made once for an answer list: the case folded answers, joined into one string (each ending with a separator).
+    If the answers change, `update` only makes the index again from the first answer that changed. (it keeps where the answers start, from the first change on)\n
+    A query is searched for in the joined string, so the non-matching answers are skipped by `str.find`, (and the number of the answer is found by counting the separators before the match) and the results are only searched for as far as they are displayed.\n
+    The results of the recent queries are kept, so deleting characters from the query is free, and if the results of a query that the new query contains are all known and there are not a lot of them, only they are checked.
+    """
+    __slots__ = ("answers", "_blob", "_length", "_starts", "_results", "refine_limit", "max_queries")
+
+    def __init__(self, answers:Sequence[str|None], refine_limit=10000, max_queries=64):
+        self.answers = answers
+        self._blob = ""
+        self._length = 0
+        # where the answers start in the joined answers (only made when the answers first change)
+        self._starts:array|None = None
+        self._results:OrderedDict[str, Search_results] = OrderedDict()
+        self.refine_limit = int(refine_limit)
+        self.max_queries = int(max_queries)
+        self._append(answers)
+
+
+    def _append(self, answers:Iterable[str|None]):
+        """Adds the answers to the end of the index."""
+        texts = [("" if answer is None else answer) for answer in answers]
+        if not texts:
+            return
+        # (case folding can make some characters longer, so the positions are counted in the folded text)
+        folded = (_SEPARATOR.join(texts) + _SEPARATOR).casefold()
+        if self._starts is not None:
+            self._starts.extend(islice(accumulate((len(text) + 1 for text in folded.split(_SEPARATOR)[:-1]), initial=len(self._blob)), 1, None))
+        self._blob += folded
+        self._length += len(texts)
+
+
+    def _get_starts(self):
+        """Returns where the answers start in the joined answers (and where the last one ends), making it from the joined answers, if it's not made yet."""
+        if self._starts is None:
+            self._starts = array("q", [0])
+            self._starts.extend(accumulate(len(text) + 1 for text in self._blob.split(_SEPARATOR)[:-1]))
+        return self._starts
+
+
+    def update(self, changed_from:int=0):
+        """Makes the index again from the answer `changed_from` (the answers before it didn't change), and forgets the results of the queries."""
+        changed_from = min(max(changed_from, 0), self._length)
+        starts = self._get_starts()
+        self._blob = self._blob[:starts[changed_from]]
+        del starts[changed_from + 1:]
+        self._length = changed_from
+        self._append(self.answers[changed_from:])
+        self._results.clear()
+
+
+    def __len__(self):
+        return self._length
+
+
+    def _scan(self, query:str):
+        """Yields the answers that contain the query, by searching in the joined answers."""
+        blob = self._blob
+        index = 0
+        # where the answer `index` starts
+        start = 0
+        position = blob.find(query)
+        while position != -1:
+            index += blob.count(_SEPARATOR, start, position)
+            yield index
+            # (search from the next answer)
+            start = blob.find(_SEPARATOR, position) + 1
+            index += 1
+            position = blob.find(query, start)
+
+
+    def _filter(self, indexes:Iterable[int], query:str):
+        """Yields the answers from `indexes` that contain the query."""
+        answers = self.answers
+        for index in indexes:
+            answer = answers[index]
+            if answer is not None and query in answer.casefold():
+                yield index
+
+
+    def search(self, query:str) -> Search_results|None:
+        """Returns the numbers of the answers that contain the query (ignoring case), or None if the query is empty."""
+        # (the separator can't be searched for)
+        query = query.casefold().replace(_SEPARATOR, "")
+        if not query:
+            return None
+        results = self._results.get(query)
+        if results is not None:
+            self._results.move_to_end(query)
+            return results
+        matches = None
+        for old_query, old_results in self._results.items():
+            if old_query in query and old_results.complete and old_results.known_length() <= self.refine_limit:
+                matches = self._filter(array("q", old_results), query)
+                break
+        if matches is None:
+            matches = self._scan(query)
+        results = Search_results(matches)
+        self._results[query] = results
+        if len(self._results) > self.max_queries:
+            self._results.popitem(last=False)
+        return results
@@ -0,0 +1,174 @@
+from array import array
+
+
+class Tracked_list(list):
+    """
+    A list that remembers the lowest index that could have changed since the last `reset_changes` call.\n
+    `changed_from` is None if the list didn't change.
+    """
+    __slots__ = ("changed_from",)
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.changed_from:int|None = 0
+
+
+    def _mark(self, index:int):
+        """Marks every element from `index` as changed."""
+        if index < 0:
+            index = max(len(self) + index, 0)
+        if self.changed_from is None or index < self.changed_from:
+            self.changed_from = index
+
+
+    def _mark_slice(self, index:int|slice, length:int):
+        if type(index) is slice:
+            start, stop, step = index.indices(length)
+            self._mark(min(start, stop + 1) if step < 0 else start)
+        else:
+            self._mark(index)
+
+
+    def reset_changes(self):
+        """Forgets the changes of the list."""
+        self.changed_from = None
+
+
+    def __setitem__(self, index, value):
+        self._mark_slice(index, len(self))
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._mark_slice(index, len(self))
+        super().__delitem__(index)
+
+    def __iadd__(self, other):
+        self._mark(len(self))
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self._mark(len(self) if other > 0 else 0)
+        return super().__imul__(other)
+
+    def append(self, obj):
+        self._mark(len(self))
+        super().append(obj)
+
+    def extend(self, iterable):
+        self._mark(len(self))
+        super().extend(iterable)
+
+    def insert(self, index, obj):
+        self._mark(min(index, len(self)))
+        super().insert(index, obj)
+
+    def pop(self, index=-1):
+        self._mark(index)
+        return super().pop(index)
+
+    def remove(self, value):
+        self._mark(self.index(value))
+        super().remove(value)
+
+    def clear(self):
+        self._mark(0)
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._mark(0)
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._mark(0)
+        super().reverse()
+
+
+class Selectable_index:
+    """
+    Tables for a list, where `None` elements can't be selected, so finding the next/previous selectable element, and the number of `None`s before an element are O(1).\n
+    If the list is a `Tracked_list`, `update` only rebuilds the part of the tables, that could have changed.
+    """
+    def __init__(self, elements:list):
+        self.elements = elements
+        self._next = array("q")
+        self._previous = array("q")
+        self._nones_before = array("q", [0])
+        self._length = 0
+        self.update(0)
+
+
+    def update(self, changed_from:int=None):
+        """
+        Rebuilds the tables from the `changed_from` index.\n
+        If `changed_from` is None, it uses the changes recorded by the `Tracked_list`, or rebuilds everything, if the list is not a `Tracked_list`.
+        """
+        elements = self.elements
+        if changed_from is None:
+            if isinstance(elements, Tracked_list):
+                changed_from = elements.changed_from
+                if changed_from is None:
+                    return
+            else:
+                changed_from = 0
+        length = len(elements)
+        start = min(changed_from, self._length, length)
+        self._length = length
+        # forward tables
+        del self._previous[start:]
+        del self._nones_before[start + 1:]
+        previous = self._previous
+        nones_before = self._nones_before
+        last = previous[start - 1] if start > 0 else -1
+        nones = nones_before[start]
+        for x in range(start, length):
+            if elements[x] is None:
+                nones += 1
+            else:
+                last = x
+            previous.append(last)
+            nones_before.append(nones)
+        # backward table
+        nexts = self._next
+        del nexts[start:]
+        nexts.extend(array("q", bytes(8 * (length - start))))
+        after = -1
+        for x in range(length - 1, start - 1, -1):
+            if elements[x] is not None:
+                after = x
+            nexts[x] = after
+        # the None-s just before the changed part point into it
+        x = start - 1
+        while x >= 0 and elements[x] is None:
+            nexts[x] = after
+            x -= 1
+        if isinstance(elements, Tracked_list):
+            elements.reset_changes()
+
+
+    def first(self, index:int=0):
+        """Returns the first selectable index from `index` (wrapping around), or -1 if there are no selectable elements."""
+        if 0 <= index < self._length:
+            found = self._next[index]
+            if found != -1:
+                return found
+        return self._next[0] if self._length else -1
+
+
+    def next(self, index:int):
+        """Returns the next selectable index after `index` (wrapping around), or -1 if there are no selectable elements."""
+        return self.first(index + 1)
+
+
+    def previous(self, index:int):
+        """Returns the previous selectable index before `index` (wrapping around), or -1 if there are no selectable elements."""
+        if 0 < index <= self._length:
+            found = self._previous[index - 1]
+            if found != -1:
+                return found
+        return self._previous[-1] if self._length else -1
+
+
+    def nones_before(self, index:int):
+        """Returns the number of `None` elements before `index`."""
+        index = min(max(index, 0), self._length)
+        return self._nones_before[index]
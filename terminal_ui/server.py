@@ -0,0 +1,236 @@
+import asyncio
+import os
+import re
+from typing import Any, Callable
+
+from terminal_ui.keys import Keys
+from terminal_ui.key_map import Key_map
+from terminal_ui.backends import IO_backend
+from terminal_ui.frame_writer import SYNC_BEGIN, SYNC_END
+from terminal_ui.navigator import Navigator
+# from keys import Keys
+# from key_map import Key_map
+# from backends import IO_backend
+# from frame_writer import SYNC_BEGIN, SYNC_END
+# from navigator import Navigator
+
+
+# the answer of the terminal to "\x1b[18t": "\x1b[8;{lines};{columns}t"
+SIZE_QUERY = b"\x1b[18t"
+_SIZE_REPORT = re.compile(rb"\x1b\[8;(\d+);(\d+)t")
+
+
+class Session_backend(IO_backend):
+    """
+    Backend of one session of a `Menu_server`, that reads the keys from the bytes the connection got (`feed`), and writes the frames to the `transport` of the connection.\n
+    It only works in an event loop (with the async versions of the menus). The keys are split with the `Key_map` like the ones from a terminal, and if the bytes end in the middle of a key sequence, it waits at most `escape_delay` seconds for the rest of it.\n
+    The size is (`columns`, `lines`), until the terminal of the client reports its size. (the answer to `SIZE_QUERY`)\n
+    If `crlf` is True, the newlines of the frames are written as "\\r\\n", because the terminal of the client is usually in raw mode. If `synchronized` is True, the frames are written as synchronized updates.\n
+    `result` is what the menu of the session returned, and `bytes_written` is the number of bytes written to the session.
+    """
+    def __init__(self, transport:asyncio.WriteTransport=None, columns=80, lines=24, escape_delay=0.025, crlf=True, synchronized=False):
+        self.transport = transport
+        self.size = (int(columns), int(lines))
+        self.escape_delay = escape_delay
+        self.crlf = bool(crlf)
+        self.synchronized = bool(synchronized)
+        self.result:Any = None
+        self.bytes_written = 0
+        self._buffer = b""
+        self._closed = False
+        self._waiter:asyncio.Future|None = None
+
+
+    def feed(self, data:bytes):
+        """Gives the bytes that came from the client to the session."""
+        self._buffer += data
+        self._wake(True)
+
+
+    def feed_eof(self):
+        """Tells the session, that the client closed the connection. (the menu gets an `EOFError` after the remaining keys)"""
+        self._closed = True
+        self._wake(False)
+
+
+    def _wake(self, value:bool):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(value)
+
+
+    async def _wait(self, timeout:float=None):
+        """Waits at most `timeout` seconds (forever if None) for more bytes. Returns if they came."""
+        if self._closed or (timeout is not None and timeout <= 0):
+            return False
+        loop = asyncio.get_running_loop()
+        waiter = self._waiter = loop.create_future()
+        handle = None if timeout is None else loop.call_later(timeout, self._wake, False)
+        try:
+            return await waiter
+        finally:
+            self._waiter = None
+            if handle is not None:
+                handle.cancel()
+
+
+    def read_key(self, key_map:Key_map):
+        raise RuntimeError("The keys of a session can only be read in an event loop. (use the async version of the menu)")
+
+
+    def key_pending(self, timeout:float=0):
+        return bool(self._buffer) or self._closed
+
+
+    async def read_key_async(self, key_map:Key_map) -> Keys|str|None:
+        if not self._buffer:
+            await self._wait()
+            if not self._buffer:
+                raise EOFError("The session was closed.")
+        while key_map.is_incomplete(self._buffer) and await self._wait(self.escape_delay):
+            pass
+        sequence = key_map.split(self._buffer)
+        self._buffer = self._buffer[len(sequence):]
+        match = _SIZE_REPORT.fullmatch(sequence)
+        if match is not None:
+            self.size = (max(int(match[2]), 1), max(int(match[1]), 1))
+            return None
+        return key_map.lookup(sequence)
+
+
+    async def key_pending_async(self, timeout:float=0):
+        # (a closed session is "pending", so the next read throws the EOFError)
+        return bool(self._buffer) or self._closed or await self._wait(timeout)
+
+
+    def write(self, text:str):
+        if not text:
+            return
+        if self.crlf:
+            text = text.replace("\n", "\r\n")
+        if self.synchronized:
+            text = SYNC_BEGIN + text + SYNC_END
+        data = text.encode("utf-8", "replace")
+        self.bytes_written += len(data)
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.write(data)
+
+
+    def terminal_size(self):
+        return self.size
+
+
+    def close(self):
+        """Closes the connection of the session."""
+        self._closed = True
+        if self.transport is not None:
+            self.transport.close()
+
+
+class _Session_protocol(asyncio.Protocol):
+    """Connects the bytes of a connection to its `Session_backend`, and starts the session of the `Menu_server` when the connection is made."""
+    __slots__ = ("server", "session")
+
+    def __init__(self, server:"Menu_server"):
+        self.server = server
+        self.session:Session_backend|None = None
+
+
+    def connection_made(self, transport:asyncio.BaseTransport):
+        self.session = self.server.start_session(transport)
+
+
+    def data_received(self, data:bytes):
+        self.session.feed(data)
+
+
+    def eof_received(self):
+        self.session.feed_eof()
+
+
+    def connection_lost(self, exc:Exception|None):
+        self.session.feed_eof()
+
+
+class Menu_server:
+    """
+    Serves menus to many sessions at once (for example over a Unix socket), from one event loop.\n
+    `make_menu` is called with the `Session_backend` of every new session, and returns the menu of the session (a `UI_list`, an `Options_menu`, or a `Navigator` without a backend). It should make new elements for every session, so the sessions don't share their selections and values.\n
+    The menus are displayed with their async versions, with the `key_mapping`, and their own renderers, so a slow session doesn't block the others.\n
+    Every session starts with the size (`columns`, `lines`), and if `query_size` is True, the terminal of the client is asked for its real size. (the client should put its terminal into raw mode, like `socat -,raw,echo=0 UNIX-CONNECT:path`)\n
+    When the menu of a session exits, `on_done` is called with the session and what the menu returned, and the connection is closed. (a session that disconnected before that is only closed)
+    """
+    __slots__ = ("make_menu", "key_mapping", "columns", "lines", "query_size", "synchronized", "on_done", "sessions", "_server", "_tasks")
+
+    def __init__(self, make_menu:Callable[[Session_backend], Any], key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, columns=80, lines=24,
+                 query_size=True, synchronized=False, on_done:Callable[[Session_backend, Any], Any]=None):
+        self.make_menu = make_menu
+        self.key_mapping = key_mapping
+        self.columns = int(columns)
+        self.lines = int(lines)
+        self.query_size = bool(query_size)
+        self.synchronized = bool(synchronized)
+        self.on_done = on_done
+        self.sessions:set[Session_backend] = set()
+        self._server:asyncio.AbstractServer|None = None
+        self._tasks:set[asyncio.Task] = set()
+
+
+    async def start_unix(self, path:str|os.PathLike, backlog=1024):
+        """Starts listening on the Unix socket at `path` (in the running event loop), and returns the `asyncio` server. (`backlog` is how many connections can wait to be accepted)"""
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_unix_server(lambda: _Session_protocol(self), path, backlog=backlog)
+        return self._server
+
+
+    async def serve_unix(self, path:str|os.PathLike, backlog=1024):
+        """Serves the sessions on the Unix socket at `path`, until it's cancelled (or `close` is called)."""
+        server = await self.start_unix(path, backlog)
+        try:
+            await server.serve_forever()
+        finally:
+            await self.close()
+
+
+    def start_session(self, transport:asyncio.WriteTransport):
+        """Starts the session of a new connection (in the running event loop), and returns its backend."""
+        session = Session_backend(transport, self.columns, self.lines, synchronized=self.synchronized)
+        if self.query_size:
+            transport.write(SIZE_QUERY)
+        task = asyncio.get_running_loop().create_task(self.run_session(session))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return session
+
+
+    async def run_session(self, session:Session_backend):
+        """Displays the menu of the session until it exits (or the client disconnects), and closes the session. Returns what the menu returned."""
+        self.sessions.add(session)
+        try:
+            menu = self.make_menu(session)
+            if isinstance(menu, Navigator):
+                if menu.backend is None:
+                    menu.backend = session
+                session.result = await menu.run_async()
+            else:
+                session.result = await menu.display_async(self.key_mapping, None, session)
+            if self.on_done is not None:
+                self.on_done(session, session.result)
+            return session.result
+        except (EOFError, ConnectionError):
+            return None
+        finally:
+            self.sessions.discard(session)
+            session.close()
+
+
+    async def close(self):
+        """Stops listening, and ends the running sessions."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.wait(list(self._tasks))
@@ -1,7 +1,27 @@
-from terminal_ui.cursor import Cursor_icon
-from terminal_ui.utils import get_key, Get_key_modes, Keys
-# from cursor import Cursor_icon
-# from utils import get_key, Get_key_modes, Keys
+from terminal_ui.cursor import Cursor_icon, DEFAULT_CURSOR_ICON
+from terminal_ui.keys import Get_key_modes, Keys
+from terminal_ui.key_map import Key_map
+from terminal_ui.backends import IO_backend, get_terminal_backend
+from terminal_ui.renderer import Renderer
+from terminal_ui.viewport import Viewport
+from terminal_ui.selectable_index import Tracked_list, Selectable_index
+from terminal_ui.answer_source import Answer_source
+from terminal_ui.search_index import Search_index, Search_results
+from terminal_ui.run_context import Run_context, Menu_state, Open_menu, run_sync, handler_context
+from terminal_ui.actions import Action_kinds, Compiled_actions, handle_action
+from terminal_ui.layout import layout_answer, split_lines, get_text_width
+# from cursor import Cursor_icon, DEFAULT_CURSOR_ICON
+# from keys import Get_key_modes, Keys
+# from key_map import Key_map
+# from backends import IO_backend, get_terminal_backend
+# from renderer import Renderer
+# from viewport import Viewport
+# from selectable_index import Tracked_list, Selectable_index
+# from answer_source import Answer_source
+# from search_index import Search_index, Search_results
+# from run_context import Run_context, Menu_state, Open_menu, run_sync, handler_context
+# from actions import Action_kinds, Compiled_actions, handle_action
+# from layout import layout_answer, split_lines, get_text_width
 
 from typing import Any, Callable
 
@@ -20,13 +40,18 @@ class UI_list:
     - If the function returns a list where the first element is -1 the `display` function will instantly return that list with the first element replaced by the selected element number of that `UI_list` object.\n
     - If it is a `UI_list` object, the object's `display` function will be automaticly called, allowing for nested menus.\n
     - If `modify_list` is `True`, any function (that is not a `UI_list` object) that is in the `action_list` will get a list containing the `answer_list` and the `action_list` as it's first argument (and can modify it) when the function is called.\n
+    If `scroll` is `True`, only the answers that fit in the terminal (or in `scroll_height` lines) are displayed, with lines showing how many answers are hidden above and below them.\n
+    The `answer_list` can also be an `Answer_source`, that only fetches the answers that are displayed. (for large or slow sources, like database tables, with `scroll`) It can't be `filterable`, because the filter would fetch every answer.\n
+    If `filterable` is `True`, typing filters the answers to the ones that contain the typed text (ignoring case), backspace deletes from it, and escape clears it. The selected answer number is still the number of the answer in the whole list.\n
     """
+    __slots__ = ("_answer_list", "_selectable_index", "_search_index", "_compiled_actions", "question", "cursor_icon", "multiline", "can_esc", "action_list", "exclude_nones", "modify_list", "scroll", "scroll_height", "filterable")
 
-    def __init__(self, answer_list:list, question:str=None, cursor_icon:Cursor_icon=None, multiline=False, can_esc=False, action_list:list[Callable|"UI_list"|list[Callable|Any]]=None, exclude_nones=False, modify_list=False):
+    def __init__(self, answer_list:list|Answer_source, question:str=None, cursor_icon:Cursor_icon=None, multiline=False, can_esc=False, action_list:list[Callable|"UI_list"|list[Callable|Any]]=None, exclude_nones=False, modify_list=False, scroll=False, scroll_height:int=None, filterable=False):
         if cursor_icon is None:
-            cursor_icon = Cursor_icon()
-        answer_list = [(ans if ans is None else str(ans)) for ans in answer_list]
-        self.answer_list = list(answer_list)
+            cursor_icon = DEFAULT_CURSOR_ICON
+        if not isinstance(answer_list, Answer_source):
+            answer_list = [(ans if ans is None else str(ans)) for ans in answer_list]
+        self.answer_list = answer_list
         self.question = str(question)
         self.cursor_icon = cursor_icon
         self.multiline = bool(multiline)
@@ -35,86 +60,189 @@ class UI_list:
             self.action_list:list[Callable|"UI_list"|list[Callable|Any]] = []
         else:
             self.action_list:list[Callable|"UI_list"|list[Callable|Any]] = list(action_list)
+        self._compiled_actions = Compiled_actions()
         self.exclude_nones = exclude_nones
         self.modify_list = bool(modify_list)
+        self.scroll = bool(scroll)
+        self.scroll_height = scroll_height
+        self.filterable = bool(filterable)
+    
+    
+    @property
+    def answer_list(self) -> list[str|None]|Answer_source:
+        return self._answer_list
+    
+    
+    @answer_list.setter
+    def answer_list(self, answer_list:list[str|None]|Answer_source):
+        if isinstance(answer_list, Answer_source):
+            self._answer_list = answer_list
+        else:
+            self._answer_list = Tracked_list(answer_list)
+        self._selectable_index = None
+        self._search_index = None
+    
+    
+    def _update_indexes(self):
+        """Updates the indexes of the `answer_list` from the first answer that changed since the last update. (recorded by the `Tracked_list`)"""
+        answers = self._answer_list
+        if isinstance(answers, Answer_source) or answers.changed_from is None:
+            return
+        if self._search_index is not None:
+            self._search_index.update(answers.changed_from)
+        if self._selectable_index is not None:
+            self._selectable_index.update(answers.changed_from)
+        answers.reset_changes()
+    
+    
+    def _get_selectable_index(self) -> Selectable_index|Answer_source:
+        """Returns the selectable index of the `answer_list`, after updating the parts of it that changed. (an `Answer_source` is its own index)"""
+        if isinstance(self._answer_list, Answer_source):
+            return self._answer_list
+        self._update_indexes()
+        if self._selectable_index is None:
+            self._selectable_index = Selectable_index(self._answer_list)
+        return self._selectable_index
+    
+    
+    def _get_search_index(self):
+        """Returns the search index of the `answer_list` for the filter, after updating the parts of it that changed."""
+        self._update_indexes()
+        if self._search_index is None:
+            self._search_index = Search_index(self._answer_list)
+        return self._search_index
 
 
-    def _make_text(self, selected:int, cursor_icon:Cursor_icon=None):
-        """Returns the text that represents the UI of this object (-question)."""
+    def _make_text(self, selected:int, cursor_icon:Cursor_icon=None, viewport:Viewport=None, reserved_lines=0, terminal_lines:int=None, rows:Search_results=None, terminal_columns:int=None):
+        """
+        Returns the text that represents the UI of this object (-question).\n
+        If there is a `viewport`, only the visible answers are made into text. (`reserved_lines` is the number of lines that are already used by the question, in a terminal with `terminal_lines` lines)\n
+        If `rows` is not None, only the answers with those (ordered) numbers are displayed. (the results of the filter)\n
+        If `terminal_columns` is not None, the answers that don't fit into that many columns are wrapped.
+        """
         if cursor_icon is None:
             cursor_icon = self.cursor_icon
-        txt = ""
-        for x in range(len(self.answer_list)):
-            if self.answer_list[x] is not None:
-                if selected == x:
+        width = get_text_width(terminal_columns, [(cursor_icon.s_icon, cursor_icon.s_icon_r), (cursor_icon.icon, cursor_icon.icon_r)])
+        if rows is None:
+            length = len(self.answer_list)
+            # (an `Answer_source` that doesn't know its length yet could have more answers)
+            complete = not isinstance(self._answer_list, Answer_source) or self._answer_list.length_known
+            position = selected
+            row_height = lambda x: self._answer_height(x, width)
+        else:
+            position = rows.index_of(selected)
+            row_height = lambda x: self._answer_height(rows[x], width)
+        if viewport is not None:
+            height = viewport.get_height(reserved_lines + 1, terminal_lines)
+            if rows is not None:
+                # only find the results that can be visible (the window is moved up to the selected answer, if it's above it, so the results after the top of the old window aren't needed)
+                rows.ensure(position + height + 1)
+                length = rows.known_length()
+                complete = rows.complete
+            start, end = viewport.window(position, length, height, row_height)
+            more_up, more_down = viewport.make_indicators(start, end, length, complete)
+            parts = [more_up, "\n"]
+        else:
+            if rows is not None:
+                length = len(rows)
+            start = 0
+            end = length
+            parts = []
+        for x in range(start, end):
+            index = x if rows is None else rows[x]
+            if self.answer_list[index] is not None:
+                if selected == index:
                     curr_icon = cursor_icon.s_icon
                     curr_icon_r = cursor_icon.s_icon_r
                 else:
                     curr_icon = cursor_icon.icon
                     curr_icon_r = cursor_icon.icon_r
-                txt += curr_icon + (self.answer_list[x].replace("\n", f"{curr_icon_r}\n{curr_icon}") if self.multiline else self.answer_list[x]) + f"{curr_icon_r}\n"
+                parts.append(layout_answer(self.answer_list[index], curr_icon, curr_icon_r, self.multiline, width))
             else:
-                txt += "\n"
-        return txt
+                parts.append("\n")
+        if viewport is not None:
+            parts.append(more_down)
+            parts.append("\n")
+        return "".join(parts)
+    
+    
+    def _answer_height(self, index:int, width:int=None):
+        """Returns how many lines the answer takes up. (wrapped at `width` columns, if it's not None)"""
+        answer = self.answer_list[index]
+        if answer is None:
+            return 1
+        if width is None:
+            return answer.count("\n") + 1
+        return len(split_lines(answer, width))
     
     
     def _convert_selected(self, selected:int):
         """Converts the selected answer number to the actual number depending on if `exclude_nones` is true."""
         if self.exclude_nones:
-            selected_f = selected
-            for x in range(len(self.answer_list)):
-                if self.answer_list[x] is None:
-                    selected_f -= 1
-                if x == selected:
-                    selected = selected_f
-                    break
+            selected -= self._get_selectable_index().nones_before(selected)
         return selected
     
     
-    def _move_selection(self, key:Keys, selected:int):
-        """Moves the selection depending on the input, in a way, where the selection can't land on an empty line."""
-        if key != Keys.ENTER:
-            while True:
+    def _move_selection(self, key:Keys, selected:int, rows:Search_results=None):
+        """
+        Moves the selection depending on the input, in a way, where the selection can't land on an empty line.\n
+        If `rows` is not None, the selection moves between those answers. (the results of the filter)
+        """
+        if rows is not None:
+            if rows and key in (Keys.DOWN, Keys.UP):
+                position = rows.index_of(selected)
                 if key == Keys.DOWN:
-                    selected += 1
-                    if selected > len(self.answer_list) - 1:
-                        selected = 0
+                    rows.ensure(position + 2)
+                    if position < rows.known_length() and rows[position] == selected:
+                        position += 1
+                    selected = rows[position] if position < rows.known_length() else rows[0]
                 else:
-                    selected -= 1
-                    if selected < 0:
-                        selected = len(self.answer_list) - 1
-                if self.answer_list[selected] is not None:
-                    break
+                    selected = rows[position - 1] if position > 0 else rows[-1]
+        elif key == Keys.DOWN or key == Keys.UP:
+            if key == Keys.DOWN:
+                new_selected = self._get_selectable_index().next(selected)
+            else:
+                new_selected = self._get_selectable_index().previous(selected)
+            if new_selected != -1:
+                selected = new_selected
         return selected
+    
+    
+    def _setup_filtered(self, selected:int, rows:Search_results=None):
+        """Returns the selected answer, or the first result of the filter, if the selected answer is not one of the `rows`."""
+        if rows is None:
+            return self._setup_selected(selected)
+        position = rows.index_of(selected)
+        if position < rows.known_length() and rows[position] == selected:
+            return selected
+        return rows[0] if rows else selected
+    
+    
+    def _setup_query(self, selected:int, rows:Search_results=None):
+        """Returns the answer to select after the filter changed: the first result of the filter (without searching for the previously selected answer in the results), or the selected answer, if the filter is empty, or nothing matches it."""
+        if rows is None:
+            return self._setup_selected(selected)
+        return rows[0] if rows else selected
 
     
-    def _handle_action(self, selected:int, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]=None) -> (int|Any):
+    def _handle_action(self, selected:int, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None) -> (int|Any):
         """Handles what to return for the selected answer."""
+        return run_sync(self._handle_action_async(selected, key_mapping, renderer, handler_context(backend)))
+
+
+    async def _handle_action_async(self, selected:int, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map, renderer:Renderer|None, ctx:Run_context) -> (int|Any):
+        """`_handle_action`, that runs the actions (and nested menus) in the way the `ctx` says."""
         if self.action_list != [] and selected < len(self.action_list) and self.action_list[selected] is not None:
-            # list
-            if type(self.action_list[selected]) is list and len(self.action_list[selected]) >= 2:
-                lis = []
-                di = dict()
-                for elem in self.action_list[selected]:
-                    if type(elem) is dict:
-                        di.update(elem)
-                    else:
-                        lis.append(elem)
-                if self.modify_list:
-                    func_return = lis[0]([self.answer_list, self.action_list], *lis[1:], **di)
-                else:
-                    func_return = lis[0](*lis[1:], **di)
-                if func_return == -1:
-                    return selected
-                elif type(func_return) is list and func_return[0] == -1:
-                    func_return[0] = selected
-                    return func_return
-            # normal function
-            elif callable(self.action_list[selected]):
+            action = self._compiled_actions.get(self.action_list, selected)
+            # function (or list)
+            if action.kind == Action_kinds.CALL:
                 if self.modify_list:
-                    func_return = self.action_list[selected]([self.answer_list, self.action_list])
+                    func_return = await action.call(ctx, [self.answer_list, self.action_list])
                 else:
-                    func_return = self.action_list[selected]()
+                    func_return = await action.call(ctx)
+                # the function could have written to the terminal
+                if renderer is not None:
+                    renderer.invalidate()
                 if func_return == -1:
                     return selected
                 elif type(func_return) is list and func_return[0] == -1:
@@ -124,9 +252,17 @@ class UI_list:
             else:
                 # display function or lazy back button
                 try:
-                    self.action_list[selected].display(key_mapping=key_mapping)
+                    if action.kind == Action_kinds.MENU:
+                        # the navigator opens it
+                        if ctx.navigate:
+                            return Open_menu(action.source)
+                        await action.source._display(ctx, key_mapping, renderer)
+                    elif action.kind == Action_kinds.DISPLAY:
+                        action.display(ctx, key_mapping, renderer)
+                    else:
+                        # print("Option is not a UI_list object!")
+                        return selected
                 except AttributeError:
-                    # print("Option is not a UI_list object!")
                     return selected
         else:
             return selected
@@ -134,14 +270,11 @@ class UI_list:
         
     def _setup_selected(self, selected:int):
         """Returns a selected until it's not on an empty space."""
-        while self.answer_list[selected] is None:
-            selected += 1
-            if selected > len(self.answer_list) - 1:
-                selected = 0
-        return selected
+        new_selected = self._get_selectable_index().first(selected)
+        return selected if new_selected == -1 else new_selected
     
 
-    def display(self, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]=None):
+    def display(self, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
         """
         Prints the `question` and then the list of answers from the `answer_list` that the user can cycle between with the arrow keys and select with enter.\n
         Gives back a number from 0-n acording to the size of the list that was passed in.\n
@@ -154,40 +287,134 @@ class UI_list:
         - If the function returns a list where the first element is -1 the `display` function will instantly return that list with the first element replaced by the selected element number of that `UI_list` object.\n
         - If it is a `UI_list` object, the object's `display` function will be automaticly called, allowing for nested menus.\n
         - If `modify_list` is `True`, any function (that is not a `UI_list` object) that is in the `action_list` will get a list containing the `answer_list` and the `action_list` as it's first argument (and can modify it) when the function is called.\n
+        If `scroll` is `True`, only the answers that fit in the terminal (or in `scroll_height` lines) are displayed, with lines showing how many answers are hidden above and below them.\n
+        `renderer` decides how the frames get written to the terminal. (by default, only the lines that changed get rewritten)\n
+        Keys that are pressed faster than the screen can be rendered (or faster than the `max_fps` of the renderer) are applied together, with only one frame rendered for all of them.\n
+        If `filterable` is `True`, typing filters the answers to the ones that contain the typed text (ignoring case), backspace deletes from it, and escape clears it. The selected answer number is still the number of the answer in the whole list.\n
+        `backend` is where the keys are read from, and the frames are written to. (the terminal by default)\n
+        Actions that return awaitables (like `async` functions) are run in their own event loop. (use `display_async` to run the menu in an existing event loop)
+        """
+        if backend is None:
+            backend = get_terminal_backend()
+        return run_sync(self._display(Run_context(backend), key_mapping, renderer))
+
+
+    async def display_async(self, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, backend:IO_backend=None):
+        """
+        The coroutine version of `display`, for using the menu in an event loop.\n
+        The keys are read without blocking the loop, the loop can run after every frame, and actions that return awaitables (like `async` functions) are awaited.
+        """
+        if backend is None:
+            backend = get_terminal_backend()
+        return await self._display(Run_context(backend, True), key_mapping, renderer)
+
+
+    async def _display(self, ctx:Run_context, key_mapping:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None, renderer:Renderer=None, state:Menu_state=None):
+        """
+        The `display` function, that reads the keys and runs the actions in the way the `ctx` says.\n
+        If there is a `state`, the menu continues from it, and saves into it.
         """
-        selected = self._setup_selected(0)
-        while True:
-            selected = self._setup_selected(selected)
-            key = Keys.ESCAPE
-            while key != Keys.ENTER:
-                # render
-                # clear screen
-                txt = "\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n\n"
-                if self.question is not None:
-                    txt += self.question + "\n\n"
-                txt += self._make_text(selected)
-                print(txt)
-                # answer select
-                key = get_key(Get_key_modes.IGNORE_HORIZONTAL, key_mapping)
-                if self.can_esc and key == Keys.ESCAPE:
-                    return -1
-                while key == Keys.ESCAPE:
-                    key = get_key(Get_key_modes.IGNORE_HORIZONTAL, key_mapping)
-                selected = self._move_selection(key, selected)
-            # menu actions
-            selected = self._convert_selected(selected)
-            action = self._handle_action(selected, key_mapping)
-            if action is not None:
-                return action
+        if renderer is None:
+            renderer = Renderer()
+        backend = ctx.backend
+        viewport = Viewport(self.scroll_height) if self.scroll else None
+        question_lines = 0
+        if self.question is not None:
+            question_lines = self.question.count("\n") + 2
+        if self.filterable and isinstance(self._answer_list, Answer_source):
+            raise ValueError("An Answer_source can't be filtered, because the filter would fetch every answer. (filter the answers in the source instead)")
+        key_mapping = Key_map.compile(key_mapping)
+        if self.filterable:
+            key_mapping = key_mapping.with_text()
+        query = ""
+        rows = None
+        header_lines = ctx.header.count("\n")
+        try:
+            # (made before the first frame, so the first typed character doesn't have to wait for it)
+            if self.filterable:
+                self._get_search_index()
+            selected = self._setup_selected(0)
+            if state is not None and state.selected is not None:
+                query = state.query if self.filterable else ""
+                selected = state.selected if query else self._setup_selected(state.selected)
+                if viewport is not None:
+                    viewport.top = state.top
+            while True:
+                if query:
+                    rows = self._get_search_index().search(query)
+                selected = self._setup_filtered(selected, rows)
+                key = Keys.ESCAPE
+                while key != Keys.ENTER:
+                    # render
+                    if ctx.probe is not None:
+                        ctx.probe.frame_start()
+                    parts = [ctx.header]
+                    reserved_lines = question_lines + header_lines
+                    if self.question is not None:
+                        parts.append(self.question)
+                        parts.append("\n\n")
+                    if query:
+                        parts.append(f"Filter: {query}\n")
+                        reserved_lines += 1
+                    terminal_size = backend.terminal_size()
+                    parts.append(self._make_text(selected, viewport=viewport, reserved_lines=reserved_lines, terminal_lines=terminal_size[1], rows=rows, terminal_columns=terminal_size[0]))
+                    txt = "".join(parts)
+                    if ctx.probe is not None:
+                        ctx.probe.frame_built()
+                    out = renderer.render(txt, terminal_size)
+                    backend.write(out)
+                    if ctx.probe is not None:
+                        ctx.probe.frame_written(self.question, out)
+                    if state is not None:
+                        state.frame = txt
+                    await ctx.frame_done()
+                    # answer select
+                    # (apply the keys that came in before the next frame is due, and only render once)
+                    key = await ctx.get_key(Get_key_modes.IGNORE_HORIZONTAL, key_mapping)
+                    while True:
+                        if key == Keys.ESCAPE:
+                            if query:
+                                query = ""
+                                rows = None
+                                selected = self._setup_selected(selected)
+                            elif self.can_esc:
+                                return -1
+                        # filter
+                        elif self.filterable and (type(key) is str or key == Keys.BACKSPACE):
+                            query = query[:-1] if key == Keys.BACKSPACE else query + key
+                            rows = self._get_search_index().search(query) if query else None
+                            selected = self._setup_query(selected, rows)
+                        elif key == Keys.ENTER:
+                            # nothing to select, if nothing matches the filter
+                            if rows is None or rows:
+                                break
+                        else:
+                            selected = self._move_selection(key, selected, rows)
+                        key = await ctx.poll_key(Get_key_modes.IGNORE_HORIZONTAL, key_mapping, renderer.time_until_frame())
+                        if key is None:
+                            break
+                # menu actions
+                if state is not None:
+                    state.selected = selected
+                    state.query = query
+                    state.top = 0 if viewport is None else viewport.top
+                selected = self._convert_selected(selected)
+                action = await handle_action(self, selected, key_mapping, renderer, ctx)
+                if action is not None:
+                    return action
+        finally:
+            backend.restore()
 
 
 class UI_list_s(UI_list):
     """
     Short version of `UI_list`.\n
-    __init__(answer_list, question, cursor_icon=None, multiline, can_esc, action_list=None, exclude_nones, modify_list=False)
+    __init__(answer_list, question, cursor_icon=None, multiline, can_esc, action_list=None, exclude_nones, modify_list=False, scroll)
     """
-    def __init__(self, answer_list:list, question:str=None, multiline=False, can_esc=False, exclude_nones=False):
-        super().__init__(answer_list, question, None, multiline, can_esc, None, exclude_nones, False)
+    __slots__ = ()
+
+    def __init__(self, answer_list:list|Answer_source, question:str=None, multiline=False, can_esc=False, exclude_nones=False, scroll=False):
+        super().__init__(answer_list, question, None, multiline, can_esc, None, exclude_nones, False, scroll)
 
 
 class UI_list_button(UI_list):
@@ -195,5 +422,7 @@ class UI_list_button(UI_list):
     A version of `UI_list` for use in `options_ui`.\n
     __init__(text, question=None, cursor_icon, multiline, can_esc=False, action, exclude_nones=False, modify)
     """
+    __slots__ = ()
+
     def __init__(self, text:str, action:list[Callable|"UI_list"|list[Callable|Any]]=None, multiline=False, modify=False, cursor_icon:Cursor_icon=None):
         super().__init__([text], None, cursor_icon, multiline, False, (None if action is None else [action]), False, modify)
\ No newline at end of file
@@ -1,28 +1,16 @@
-from enum import Enum, auto
+from terminal_ui.keys import Get_key_modes, Keys
+from terminal_ui.key_map import Key_map
+from terminal_ui.key_readers import get_key_reader
+# from keys import Get_key_modes, Keys
+# from key_map import Key_map
+# from key_readers import get_key_reader
 
 
-class Get_key_modes(Enum):
-    NO_IGNORE = auto()
-    IGNORE_HORIZONTAL = auto()
-    IGNORE_VERTICAL = auto()
-    IGNORE_ESCAPE = auto()
-    IGNORE_ENTER = auto()
-
-
-class Keys(Enum):
-    ESCAPE = auto()
-    UP = auto()
-    DOWN = auto()
-    LEFT = auto()
-    RIGHT = auto()
-    ENTER = auto()
-
-
-def get_key(mode:Get_key_modes=Get_key_modes.NO_IGNORE, key_map:tuple[list[list[list[bytes]]], list[bytes]]=None):
+def get_key(mode:Get_key_modes=Get_key_modes.NO_IGNORE, key_map:tuple[list[list[list[bytes]]], list[bytes]]|Key_map=None):
     """
     Function for detecting a keypress (mainly arrow keys)\n
     Returns a value from the `Key` enum depending on the key type.\n
-    Throws an error if msvcrt/getch was not found. (this module is windows only)\n
+    Uses msvcrt on windows, and termios on POSIX systems. Throws an error if neither was found.\n
     Depending on the mode, it ignores some keys:\n
     \tNO_IGNORE: don't ignore any key
     \tIGNORE_HORIZONTAL: ignore left/right
@@ -36,32 +24,18 @@ def get_key(mode:Get_key_modes=Get_key_modes.NO_IGNORE, key_map:tuple[list[list[
     \tarrow/WASD: ([[[b"\\x1b", b"e"]], [[b"w"], [b"H"]], [[b"s"], [b"P"]], [[b"a"], [b"K"]], [[b"d"], [b"M"]], [[b"\\r", b" "]]], [b"\\xe0", b"\\x00"])
     \tonly W, A, and D without setting the mode: ([[], [[b"w"]], [], [[b"a"]], [[b"d"]], []])
     \tunintended/compressed: ([[b"\\x1b"], [[], b"H"], [[], b"P"], [[], b"K"], [[], b"M"], [b"\\r"]], b"\\xe0\\x00")
+    \tdefault on POSIX: ([[[b"\\x1b"]], [[], [b"A"]], [[], [b"B"]], [[], [b"D"]], [[], [b"C"]], [[b"\\r", b"\\n"]]], [b"\\x1b[", b"\\x1bO"])\n
+    The key map can also be a `Key_map` object (made with `Key_map.compile`), so it doesn't have to be parsed on every call.\n
+    If it's a text key map (made with `Key_map.with_text`), the typed characters are also returned, as strings, and backspace as `Keys.BACKSPACE`.\n
+    The terminal is put back into its normal mode after the key, unless it was already in the mode for reading keys (like in the action of a menu).
     """
+    reader = get_key_reader()
+    owns_terminal = not reader.active
     try:
-        from msvcrt import getch
-    except ModuleNotFoundError:
-        raise ModuleNotFoundError("msvcrt module not found!\nThis module is windows only!")
-    
-    ignore_list = [Get_key_modes.IGNORE_ESCAPE, Get_key_modes.IGNORE_VERTICAL, Get_key_modes.IGNORE_VERTICAL,
-                   Get_key_modes.IGNORE_HORIZONTAL, Get_key_modes.IGNORE_HORIZONTAL, Get_key_modes.IGNORE_ENTER]
-    response_list = [Keys.ESCAPE, Keys.UP, Keys.DOWN, Keys.LEFT, Keys.RIGHT, Keys.ENTER]
-    
-    arrow = False
-    if key_map is None:
-        key_map = ([[[b"\x1b"]], [[], [b"H"]], [[], [b"P"]], [[], [b"K"]], [[], [b"M"]], [[b"\r"]]], [b"\xe0", b"\x00"])
-    while True:
-        key = getch()
-        # print(key)
-        arrow = False
-        if len(key_map) != 1 and len(key_map) > 1 and key in key_map[1]:
-            arrow = True
-            key = getch()
-            # print("arrow", key)
-        
-        for x in range(len(response_list)):
-            if ((not arrow and len(key_map[0][x]) > 0 and key in key_map[0][x][0]) or
-                (arrow and len(key_map[0][x]) > 1 and key in key_map[0][x][1])) and mode != ignore_list[x]:
-                return response_list[x]
+        return reader.get_key(mode, Key_map.compile(key_map))
+    finally:
+        if owns_terminal:
+            reader.restore()
 
 
 def imput(ask="Num: "):
@@ -0,0 +1,92 @@
+from shutil import get_terminal_size
+from typing import Callable
+
+
+class Viewport:
+    """
+    Object that keeps track of which part of a long list of rows is visible.\n
+    The window only moves if the selected row would go out of it, and finding the window only looks at the rows around the visible part, so it costs the same, no matter how long the list is.\n
+    If `height` is None, the height of the terminal is used.\n
+    `more_up` and `more_down` are the symbols of the lines, that show how many rows are hidden above and below the window.
+    """
+    def __init__(self, height:int=None, more_up="^", more_down="v"):
+        self.height = height
+        self.more_up = str(more_up)
+        self.more_down = str(more_down)
+        self.top = 0
+
+
+    def get_height(self, reserved_lines:int=0, terminal_lines:int=None):
+        """
+        Returns how many lines the rows can take up, if `reserved_lines` lines of the screen are used by other things.\n
+        The 2 lines of the scroll indicators are also reserved.\n
+        `terminal_lines` is the height of the terminal. (if None, it's the height of the real terminal)
+        """
+        if self.height is not None:
+            return max(int(self.height), 1)
+        if terminal_lines is None:
+            terminal_lines = get_terminal_size().lines
+        return max(terminal_lines - reserved_lines - 2, 1)
+
+
+    def window(self, selected:int, length:int, height:int, row_height:Callable[[int], int]=None):
+        """
+        Moves the window, so that the `selected` row is visible, and returns the start and end (exclusive) index of the visible rows.\n
+        `row_height` should return how many lines a row takes up. (1 by default)
+        """
+        if length <= 0:
+            self.top = 0
+            return (0, 0)
+        if row_height is None:
+            row_height = lambda x: 1
+        selected = min(max(selected, 0), length - 1)
+        if self.top >= length:
+            self.top = length - 1
+        if selected < self.top:
+            self.top = selected
+        # is selected visible from the current top?
+        used = 0
+        x = self.top
+        while x <= selected:
+            used += row_height(x)
+            if used > height:
+                break
+            x += 1
+        if used > height:
+            # scroll down, until selected is the last visible row
+            self.top = selected
+            used = row_height(selected)
+            while self.top > 0 and used + row_height(self.top - 1) <= height:
+                self.top -= 1
+                used += row_height(self.top)
+            end = selected + 1
+        else:
+            end = x
+        # fill the rest of the window
+        while end < length:
+            end_height = row_height(end)
+            if used + end_height > height:
+                break
+            used += end_height
+            end += 1
+        # the end of the list is visible, so the space left is filled with the rows above (if the list got shorter)
+        if end == length:
+            while self.top > 0 and used + row_height(self.top - 1) <= height:
+                self.top -= 1
+                used += row_height(self.top)
+        return (self.top, end)
+
+
+    def make_indicators(self, start:int, end:int, length:int, complete=True):
+        """
+        Returns the lines (without newlines) that show how many rows are hidden above and below the window.\n
+        If `complete` is False, `length` is only the number of rows that are known so far, and there could be more.
+        """
+        up = f"{self.more_up} {start} more" if start > 0 else ""
+        if complete:
+            down = f"{self.more_down} {length - end} more" if end < length else ""
+        elif end < length:
+            down = f"{self.more_down} {length - end}+ more"
+        else:
+            down = f"{self.more_down} more"
+        return (up, down)
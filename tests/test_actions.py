@@ -0,0 +1,81 @@
+from terminal_ui import UI_list, Memory_backend, Keys
+from terminal_ui.actions import Action_kinds, Compiled_actions, get_compiled_action
+
+
+def first():
+    return "first"
+
+
+def second():
+    return "second"
+
+
+def test_compiled_once():
+    actions = [first, [second, 1, {"a": 2}]]
+    compiled_actions = Compiled_actions()
+    compiled = compiled_actions.get(actions, 1)
+    assert compiled.kind is Action_kinds.CALL
+    assert compiled.func is second and compiled.args == (1,) and compiled.kwargs == {"a": 2}
+    assert compiled_actions.get(actions, 1) is compiled
+    assert get_compiled_action(compiled, actions[1]) is compiled
+
+
+def test_replaced_action():
+    actions = [first, second]
+    compiled_actions = Compiled_actions()
+    assert compiled_actions.get(actions, 0).func is first
+    actions[0] = second
+    assert compiled_actions.get(actions, 0).func is second
+
+
+def test_list_action_changed_in_place():
+    action = [first, 1]
+    actions = [action]
+    compiled_actions = Compiled_actions()
+    compiled = compiled_actions.get(actions, 0)
+    action[1] = 2
+    assert not compiled.is_valid_for(action)
+    assert compiled_actions.get(actions, 0).args == (2,)
+    action.append(3)
+    assert compiled_actions.get(actions, 0).args == (2, 3)
+    action[0] = second
+    assert compiled_actions.get(actions, 0).func is second
+
+
+def test_shorter_action_list():
+    actions = [first, second]
+    compiled_actions = Compiled_actions()
+    compiled = compiled_actions.get(actions, 1)
+    actions[:] = [second, first]
+    assert compiled_actions.get(actions, 1) is not compiled
+    assert compiled_actions.get(actions, 1).func is first
+    del actions[1]
+    assert compiled_actions.get(actions, 0).func is second
+
+
+def test_kinds():
+    class Page:
+        def display(self, key_mapping=None, backend=None):
+            pass
+
+    assert get_compiled_action(None, UI_list(["a"])).kind is Action_kinds.MENU
+    assert get_compiled_action(None, Page()).kind is Action_kinds.DISPLAY
+    assert get_compiled_action(None, Page()).display_arguments == ("backend",)
+    assert get_compiled_action(None, None).kind is Action_kinds.NONE
+    assert get_compiled_action(None, 5).kind is Action_kinds.NONE
+
+
+def test_changed_action_in_ui_list():
+    calls = []
+    answers = UI_list(["a", "b"], action_list=[[calls.append, 1], None])
+
+    def change():
+        answers.action_list[0][1] = 2
+
+    answers.action_list[1] = change
+    backend = Memory_backend([Keys.ENTER, Keys.DOWN, Keys.ENTER, Keys.UP, Keys.ENTER], capture=False)
+    try:
+        answers.display(backend=backend)
+    except EOFError:
+        pass
+    assert calls == [1, 2]
@@ -0,0 +1,84 @@
+import pytest
+
+from terminal_ui import Answer_source, UI_list, Memory_backend, Keys
+
+
+class Counting_fetch:
+    """A fetch function of `count` numbers, that remembers the offsets it was called with."""
+
+    def __init__(self, count:int):
+        self.count = count
+        self.calls = []
+
+    def __call__(self, offset:int, count:int):
+        self.calls.append(offset)
+        return [f"answer {x}" for x in range(offset, min(offset + count, self.count))]
+
+
+def test_pages_are_fetched_when_needed():
+    fetch = Counting_fetch(1000)
+    source = Answer_source(fetch, 1000, page_size=10)
+    assert source[5] == "answer 5"
+    assert source[9] == "answer 9"
+    assert source[995] == "answer 995"
+    assert fetch.calls == [0, 990]
+    assert len(source) == 1000
+
+
+def test_least_recently_used_page_is_evicted():
+    fetch = Counting_fetch(100)
+    source = Answer_source(fetch, 100, page_size=10, cache_pages=2)
+    source[0]
+    source[10]
+    source[0]
+    # page 1 is the least recently used one
+    source[20]
+    source[0]
+    source[10]
+    assert fetch.calls == [0, 10, 20, 10]
+
+
+def test_unknown_length():
+    fetch = Counting_fetch(25)
+    source = Answer_source(fetch, page_size=10)
+    assert len(source) == 10 and not source.length_known
+    assert source[24] == "answer 24"
+    assert len(source) == 25 and source.length_known
+    assert list(source)[-1] == "answer 24"
+
+
+def test_selectable_answers():
+    source = Answer_source([None, "a", None, None, "b", None], page_size=2)
+    assert source.first() == 1
+    assert source.next(1) == 4
+    assert source.next(4) == 1
+    assert source.previous(1) == 4
+    assert source.nones_before(4) == 3
+
+
+def test_invalidate():
+    answers = ["a", "b"]
+    source = Answer_source(answers)
+    assert source[0] == "a"
+    answers[0] = "c"
+    assert source[0] == "a"
+    source.invalidate()
+    assert source[0] == "c"
+
+
+def test_open_ended_indicator_until_the_length_is_known():
+    source = Answer_source(Counting_fetch(25), page_size=10)
+    answers = UI_list(source, "q", scroll=True, scroll_height=3)
+    backend = Memory_backend([Keys.ENTER])
+    assert answers.display(backend=backend) == 0
+    assert "\nv 7+ more\n" in backend.getvalue()
+    source[24]
+    backend = Memory_backend([Keys.ENTER])
+    assert answers.display(backend=backend) == 0
+    assert "\nv 22 more\n" in backend.getvalue()
+
+
+def test_filter_is_not_allowed():
+    answers = UI_list(Answer_source(Counting_fetch(10)), filterable=True)
+    with pytest.raises(ValueError):
+        answers.display(backend=Memory_backend([Keys.ENTER]))
@@ -0,0 +1,81 @@
+from terminal_ui import Canvas
+
+
+RED = "\x1b[31m"
+RESET = "\x1b[0m"
+
+
+def test_first_flush_writes_everything():
+    canvas = Canvas(3, 2)
+    canvas.put(0, 0, "ab")
+    assert canvas.flush() == "\x1b[1;1Hab \x1b[2;1H   "
+    assert canvas.flush() == ""
+
+
+def test_only_changed_cells_are_written():
+    canvas = Canvas(10, 3)
+    canvas.put_line(0, "hello")
+    canvas.put_line(1, "world")
+    canvas.flush()
+    canvas.put_line(0, "help")
+    assert canvas.flush() == "\x1b[1;4Hp "
+    # (drawing the same text again doesn't write anything)
+    canvas.put_line(1, "world")
+    assert canvas.flush() == ""
+    assert canvas.text().split("\n") == ["help      ", "world     ", " " * 10]
+
+
+def test_changes_outside_dirty_rectangles_are_not_seen():
+    canvas = Canvas(5, 1)
+    canvas.flush()
+    canvas._chars[2] = "x"
+    assert canvas.flush() == ""
+    canvas.mark_dirty(2, 0, 1, 1)
+    assert canvas.flush() == "\x1b[1;3Hx"
+
+
+def test_invalidate_and_mark_flushed():
+    canvas = Canvas(4, 1)
+    canvas.put(0, 0, "ab")
+    canvas.mark_flushed()
+    assert canvas.flush() == ""
+    canvas.invalidate()
+    assert canvas.flush() == "\x1b[1;1Hab  "
+
+
+def test_attributes():
+    canvas = Canvas(4, 1)
+    canvas.flush()
+    canvas.put(1, 0, "xy", "1")
+    assert canvas.flush() == "\x1b[1;2H\x1b[0;1mxy\x1b[0m"
+    # the same characters with an other attribute
+    canvas.put(1, 0, "xy")
+    assert canvas.flush() == "\x1b[1;2Hxy"
+
+
+def test_wide_characters():
+    canvas = Canvas(6, 1)
+    canvas.flush()
+    assert canvas.put(0, 0, "日本") == 4
+    assert canvas.flush() == "\x1b[1;1H日本"
+    # overwriting half of a wide character clears the other half
+    canvas.put(1, 0, "x")
+    assert canvas.text() == " x本  "
+    assert canvas.flush() == "\x1b[1;1H x"
+
+
+def test_resize_keeps_cells():
+    canvas = Canvas(4, 2)
+    canvas.put_line(0, "abcd")
+    canvas.put(0, 1, "日本")
+    canvas.flush()
+    canvas.resize(3, 1)
+    assert canvas.text() == "abc"
+    assert canvas.flush() == "\x1b[1;1Habc"
+
+
+def test_canvas_applies_sgr():
+    canvas = Canvas(10, 1)
+    assert canvas.put(0, 0, f"a{RED}bc{RESET}d", "1") == 4
+    assert canvas._chars[:5] == ["a", "b", "c", "d", " "]
+    assert [canvas._attr_table[code] for code in canvas._attrs[:4]] == ["1", "1;31", "1;31", ""]
@@ -0,0 +1,32 @@
+from terminal_ui import options_ui, UI_list, Memory_backend, Keys, Slider, Text_field
+
+
+def test_flood_renders_once_in_display():
+    answers = UI_list([str(x) for x in range(100)], scroll=True)
+    backend = Memory_backend([Keys.DOWN] * 40 + [Keys.ENTER], capture=False)
+    assert answers.display(backend=backend) == 40
+    assert backend.writes == 1
+
+
+def test_typed_keys_are_applied_one_frame_apart():
+    answers = UI_list([str(x) for x in range(100)], scroll=True)
+    backend = Memory_backend([Keys.DOWN] * 3 + [Keys.ENTER], capture=False, buffered=False)
+    assert answers.display(backend=backend) == 3
+    assert backend.writes == 4
+
+
+def test_flood_renders_once_in_options_ui():
+    slider = Slider(range(100))
+    backend = Memory_backend([Keys.RIGHT] * 40 + [Keys.ESCAPE], capture=False)
+    options_ui([slider], backend=backend)
+    assert slider.value == 40
+    assert backend.writes == 1
+
+
+def test_keys_that_change_nothing_are_not_rendered():
+    # (the slider gets the typed characters too, because the text field wants them)
+    backend = Memory_backend(["x", "y", Keys.DOWN, "z", Keys.ESCAPE], capture=False, buffered=False)
+    field = Text_field()
+    options_ui([Slider(range(10)), field], backend=backend)
+    assert field.value == "z"
+    assert backend.writes == 3
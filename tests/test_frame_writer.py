@@ -0,0 +1,48 @@
+import os
+
+from terminal_ui import Frame_writer
+from terminal_ui.frame_writer import SYNC_BEGIN, SYNC_END
+from terminal_ui.server import Session_backend
+
+
+def read_frames(writer:Frame_writer, frames:list[str]):
+    read_fd, writer.fd = os.pipe()
+    try:
+        for frame in frames:
+            writer.write(frame)
+        os.close(writer.fd)
+        data = b""
+        while chunk := os.read(read_fd, 4096):
+            data += chunk
+        return data.decode()
+    finally:
+        os.close(read_fd)
+
+
+def test_synchronized_frames():
+    writer = Frame_writer(synchronized=True)
+    data = read_frames(writer, ["first", "", "sécond"])
+    assert data == f"{SYNC_BEGIN}first{SYNC_END}{SYNC_BEGIN}sécond{SYNC_END}"
+    assert writer.frames == 2
+    assert writer.last_frame_bytes == len(f"{SYNC_BEGIN}sécond{SYNC_END}".encode())
+    assert writer.bytes_written == len(data.encode())
+
+
+def test_unsynchronized_frames():
+    writer = Frame_writer()
+    assert read_frames(writer, ["first", "second"]) == "firstsecond"
+    assert writer.last_frame_bytes == 6
+
+
+def test_empty_frame():
+    writer = Frame_writer(synchronized=True)
+    assert read_frames(writer, ["frame", ""]) == f"{SYNC_BEGIN}frame{SYNC_END}"
+    assert writer.last_frame_bytes == 0
+    assert writer.frames == 1
+
+
+def test_synchronized_session():
+    session = Session_backend(synchronized=True)
+    session.write("a\nb")
+    session.write("")
+    assert session.bytes_written == len(f"{SYNC_BEGIN}a\r\nb{SYNC_END}")
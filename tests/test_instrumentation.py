@@ -0,0 +1,74 @@
+import csv
+import json
+
+from terminal_ui import Instrumentation, Frame_stats, get_instrumentation, UI_list, Memory_backend, Keys
+
+
+def make_stats(build_time:float, latency:float|None, keys=1):
+    return Frame_stats("menu", build_time, build_time / 2, 0.0, keys, 10, latency)
+
+
+def test_summary():
+    instrumentation = Instrumentation(max_records=100)
+    assert instrumentation.summary()["frames"] == 0
+    assert instrumentation.summary()["latency_p99"] == 0.0
+    for x in range(1, 101):
+        instrumentation.record(make_stats(x / 1000, None if x % 2 else x / 100))
+    summary = instrumentation.summary()
+    assert summary["frames"] == 100 and summary["keys"] == 100 and summary["bytes"] == 1000
+    assert summary["build_time_p50"] == 0.051
+    assert summary["build_time_p99"] == 0.1
+    assert summary["write_time_p50"] == 0.0255
+    # (only the frames with a latency count)
+    assert summary["latency_p50"] == 0.52
+    # the oldest records are dropped
+    instrumentation.record(make_stats(1.0, None))
+    assert len(instrumentation.records) == 100
+    assert instrumentation.records[0].build_time == 0.002
+
+
+def test_callbacks():
+    instrumentation = Instrumentation()
+    got = []
+    remove = instrumentation.add_callback(got.append)
+    stats = make_stats(0.1, 0.2)
+    instrumentation.record(stats)
+    remove()
+    instrumentation.record(stats)
+    assert got == [stats]
+
+
+def test_export(tmp_path):
+    instrumentation = Instrumentation()
+    instrumentation.record(make_stats(0.5, None, 3))
+    instrumentation.record(make_stats(0.25, 0.75))
+    instrumentation.export_json(tmp_path / "frames.json")
+    with open(tmp_path / "frames.json", encoding="utf-8") as file:
+        records = json.load(file)
+    assert [record["keys"] for record in records] == [3, 1]
+    assert records[1]["latency"] == 0.75
+    assert list(records[0]) == list(Frame_stats.FIELDS)
+    instrumentation.export_csv(tmp_path / "frames.csv")
+    with open(tmp_path / "frames.csv", encoding="utf-8", newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert [row["build_time"] for row in rows] == ["0.5", "0.25"]
+    assert rows[0]["latency"] == ""
+
+
+def test_menu_frames():
+    instrumentation = get_instrumentation()
+    enabled = instrumentation.enabled
+    instrumentation.enable()
+    instrumentation.clear()
+    try:
+        backend = Memory_backend([Keys.DOWN, Keys.ENTER], buffered=False)
+        assert UI_list(["a", "b"], "question\nline").display(backend=backend) == 1
+        records = list(instrumentation.records)
+    finally:
+        instrumentation.enabled = enabled
+        instrumentation.clear()
+    assert len(records) == 2
+    assert [stats.menu for stats in records] == ["question", "question"]
+    assert records[0].latency is None and records[0].keys == 0
+    assert records[1].keys == 1 and records[1].latency is not None
+    assert sum(stats.bytes for stats in records) == len(backend.getvalue().encode())
@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+from terminal_ui import Job, Job_states, Memory_backend, Keys, options_ui
+from terminal_ui.options_menu import Job_button
+
+
+def test_result_and_error():
+    job = Job(lambda a, b: a + b, 2)
+    assert job.state == Job_states.IDLE
+    assert job.start(1)
+    assert job.wait(5) == Job_states.DONE
+    assert job.result == 3
+
+    def fail():
+        raise ValueError("no")
+
+    job = Job(fail)
+    job()
+    assert job.wait(5) == Job_states.FAILED
+    assert str(job.error) == "no"
+
+
+def test_cancel_running():
+    started = Event()
+    ended = []
+
+    def work(job:Job):
+        started.set()
+        while not job.cancel_requested:
+            job.progress = 0.5
+            started.wait(0.001)
+        return "stopped"
+
+    job = Job(work, pass_job=True, on_done=ended.append)
+    job.start()
+    assert started.wait(5)
+    assert not job.start()
+    assert job.cancel()
+    assert job.wait(5) == Job_states.CANCELLED
+    assert job.result is None
+    assert ended == [job]
+    assert not job.cancel()
+    # (it can run again after it ended)
+    assert job.start()
+    job.cancel()
+    job.wait(5)
+
+
+def test_cancel_before_start():
+    with ThreadPoolExecutor(1) as executor:
+        release = Event()
+        blocker = Job(release.wait, 5, executor=executor)
+        blocker.start()
+        called = []
+        job = Job(called.append, 1, executor=executor)
+        job.start()
+        assert job.cancel()
+        assert job.wait(5) == Job_states.CANCELLED
+        release.set()
+        assert blocker.wait(5) == Job_states.DONE
+    assert called == []
+
+
+def test_job_button_states():
+    started = Event()
+    release = Event()
+
+    def work():
+        started.set()
+        return release.wait(5)
+
+    job = Job(work)
+    button = Job_button("job", job, spinner="*")
+    assert button._make_state_text() == ""
+    backend = Memory_backend([Keys.ENTER], capture=False)
+    try:
+        options_ui([button], backend=backend)
+    except EOFError:
+        pass
+    assert job.running
+    # (a job that didn't start yet would be cancelled at once)
+    assert started.wait(5)
+    assert button._make_state_text() == "*"
+    job.progress = 0.25
+    assert button._make_state_text() == "* 25%"
+    # pressing it again cancels the job
+    backend = Memory_backend([Keys.ENTER, Keys.ESCAPE], capture=False)
+    options_ui([button], backend=backend)
+    assert job.cancel_requested
+    assert button._make_state_text() == "* 25% cancelling"
+    release.set()
+    assert job.wait(5) == Job_states.CANCELLED
+    assert button._make_state_text() == "cancelled"
+    job.start()
+    assert job.wait(5) == Job_states.DONE
+    assert button._make_state_text() == "done: True"
@@ -0,0 +1,56 @@
+from terminal_ui import Key_map, Keys
+from terminal_ui.key_map import POSIX_KEY_MAP, WINDOWS_KEY_MAP
+
+
+def test_decode():
+    key_map = Key_map(POSIX_KEY_MAP)
+    assert key_map.decode(b"\x1b[A\x1bOB\x1b[D\x1b[C\r\n\x1b") == [Keys.UP, Keys.DOWN, Keys.LEFT, Keys.RIGHT, Keys.ENTER, Keys.ENTER, Keys.ESCAPE]
+    # unknown escape sequences are skipped as a whole
+    assert key_map.decode(b"\x1b[1;5C\x1b[A") == [Keys.UP]
+
+
+def test_decode_text():
+    key_map = Key_map(POSIX_KEY_MAP).with_text()
+    assert key_map.decode("a\x1b[Bé".encode()) == ["a", Keys.DOWN, "é"]
+    assert key_map.with_text() is key_map
+
+
+def test_split():
+    key_map = Key_map(POSIX_KEY_MAP)
+    assert key_map.split(b"\x1b[Ax") == b"\x1b[A"
+    assert key_map.split(b"\x1b[15~x") == b"\x1b[15~"
+    assert key_map.split(b"\x1b[Ax", 3) == b"x"
+
+
+def test_windows_key_map():
+    key_map = Key_map(WINDOWS_KEY_MAP)
+    assert key_map.decode(b"\xe0H\x00P\r\x1b") == [Keys.UP, Keys.DOWN, Keys.ENTER, Keys.ESCAPE]
+
+
+def test_short_key_map_format():
+    key_map = Key_map(([[b"q"], [[b"w"], b"k"]], b"\x00"))
+    assert key_map.decode(b"qw\x00k") == [Keys.ESCAPE, Keys.UP, Keys.UP]
+
+
+def test_incomplete_sequences():
+    key_map = Key_map(POSIX_KEY_MAP)
+    for data in (b"\x1b", b"\x1b[", b"\x1bO", b"\x1b[1;5", b"\x1b[?25"):
+        assert key_map.is_incomplete(data)
+    for data in (b"\x1b[A", b"\x1b[1;5C", b"a", b"\x1b[Ax"):
+        assert not key_map.is_incomplete(data)
+
+
+def test_compile_reuses_equal_key_maps():
+    key_map = ([[[b"q"]], [[b"w"]]], [])
+    compiled = Key_map.compile(key_map)
+    assert Key_map.compile(([[[b"q"]], [[b"w"]]], [])) is compiled
+    assert Key_map.compile(compiled) is compiled
+    # changed in place
+    key_map[0][1][0].append(b"k")
+    assert Key_map.compile(key_map).decode(b"k") == [Keys.UP]
+
+
+def test_backspace_only_in_text_key_maps():
+    key_map = Key_map(POSIX_KEY_MAP)
+    assert key_map.decode(b"\x7f\x1b[A") == [Keys.UP]
+    assert key_map.with_text().decode(b"\x7fa") == [Keys.BACKSPACE, "a"]
@@ -0,0 +1,57 @@
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("termios")
+
+from terminal_ui import Key_map, Keys
+from terminal_ui.key_map import POSIX_KEY_MAP
+from terminal_ui.key_readers import Posix_key_reader
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def write_later(fd:int, data:bytes, delay=0.05):
+    timer = threading.Timer(delay, os.write, (fd, data))
+    timer.start()
+    return timer
+
+
+def test_keys_in_one_read(pipe):
+    reader = Posix_key_reader(pipe[0])
+    key_map = Key_map(POSIX_KEY_MAP).with_text()
+    os.write(pipe[1], b"\x1b[Bx\r")
+    assert [reader.read_key(key_map) for _ in range(3)] == [Keys.DOWN, "x", Keys.ENTER]
+    assert not reader.key_pending()
+
+
+def test_split_key_sequence(pipe):
+    reader = Posix_key_reader(pipe[0], escape_delay=2)
+    os.write(pipe[1], b"\x1b[")
+    timer = write_later(pipe[1], b"A")
+    assert reader.read_key(Key_map(POSIX_KEY_MAP)) == Keys.UP
+    timer.join()
+
+
+def test_split_unknown_escape_sequence(pipe):
+    reader = Posix_key_reader(pipe[0], escape_delay=2)
+    key_map = Key_map(POSIX_KEY_MAP).with_text()
+    os.write(pipe[1], b"\x1b[1;")
+    timer = write_later(pipe[1], b"5Cx")
+    # (the whole sequence is skipped, and its bytes don't come through as text)
+    assert reader.read_key(key_map) is None
+    assert reader.read_key(key_map) == "x"
+    timer.join()
+
+
+def test_lone_escape(pipe):
+    reader = Posix_key_reader(pipe[0], escape_delay=0.01)
+    os.write(pipe[1], b"\x1b")
+    assert reader.read_key(Key_map(POSIX_KEY_MAP)) == Keys.ESCAPE
@@ -0,0 +1,56 @@
+import os
+import signal
+
+import pytest
+
+from terminal_ui import Terminal_backend
+from terminal_ui import backends, layout
+from terminal_ui.key_readers import Key_reader
+from terminal_ui.layout import text_width, wrap_line
+from terminal_ui.renderer import Renderer
+
+
+RED = "\x1b[31m"
+RESET = "\x1b[0m"
+
+
+def test_sgr_has_no_width():
+    assert text_width(f"{RED}red{RESET} text") == 8
+    assert text_width(f"{RED}日本{RESET}") == 4
+
+
+def test_wrap_keeps_sgr():
+    pieces = wrap_line(f"{RED}abcdef{RESET}", 3)
+    assert pieces == (f"{RED}abc", f"def{RESET}")
+
+
+def test_colored_line_fits():
+    assert Renderer()._fits([f"{RED}{'x' * 10}{RESET}"], (12, 5))
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH")
+def test_resize_callback_can_be_removed():
+    calls = []
+    stop = layout.on_resize(lambda: calls.append(True))
+    assert stop is not None
+    os.kill(os.getpid(), signal.SIGWINCH)
+    stop()
+    os.kill(os.getpid(), signal.SIGWINCH)
+    assert calls == [True]
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH")
+def test_restore_stops_watching_resizes(monkeypatch):
+    # (the terminal must not be used)
+    monkeypatch.setattr(backends, "get_key_reader", Key_reader)
+    callbacks = len(layout._resize_callbacks)
+    backend = Terminal_backend()
+    size = backend.terminal_size()
+    assert len(layout._resize_callbacks) == callbacks + 1
+    assert backend.terminal_size() == size
+    backend.restore()
+    assert len(layout._resize_callbacks) == callbacks
+    # watched again, when it's used again
+    backend.terminal_size()
+    assert len(layout._resize_callbacks) == callbacks + 1
+    backend.restore()
@@ -0,0 +1,46 @@
+from terminal_ui import UI_list, Memory_backend, Keys, Navigator
+
+
+def make_menus():
+    sub = UI_list(["s0", "s1"], "sub\nsecond line", can_esc=True)
+    root = UI_list(["a", "b", "sub"], "root", action_list=[None, None, sub])
+    return root, sub
+
+
+def test_back_keeps_the_selection():
+    root, _ = make_menus()
+    backend = Memory_backend([Keys.DOWN, Keys.DOWN, Keys.ENTER, Keys.ESCAPE, Keys.UP, Keys.ENTER], buffered=False)
+    # (if the selection was lost, UP would wrap around to "sub")
+    assert Navigator(root, backend=backend).run() == 1
+
+
+def test_back_redraws_the_parent():
+    root, _ = make_menus()
+    backend = Memory_backend([Keys.UP, Keys.ENTER, Keys.ESCAPE, Keys.DOWN, Keys.ENTER], buffered=False)
+    navigator = Navigator(root, backend=backend)
+    assert navigator.run() == 0
+    assert navigator.path == []
+    parent_frame = "\x1b[1;1Hroot\x1b[K\x1b[2;1H\x1b[K\x1b[3;1H a\x1b[K\x1b[4;1H b\x1b[K\x1b[5;1H>sub\x1b[K"
+    assert parent_frame in backend.getvalue()
+
+
+def test_breadcrumbs():
+    paths = []
+    root, sub = make_menus()
+    navigator = Navigator(root, breadcrumbs=True, separator="/")
+    sub.action_list = [lambda: paths.append(navigator.path), None]
+    navigator.backend = Memory_backend([Keys.UP, Keys.ENTER, Keys.ENTER, Keys.ESCAPE, Keys.UP, Keys.UP, Keys.ENTER], buffered=False)
+    assert navigator.run() == 0
+    assert paths == [["root", "sub"]]
+    assert "root/sub" in navigator.backend.getvalue()
+
+
+def test_max_frames():
+    writes = []
+    for max_frames in (1, 0):
+        root, _ = make_menus()
+        backend = Memory_backend([Keys.UP, Keys.ENTER, Keys.ESCAPE, Keys.DOWN, Keys.ENTER], capture=False, buffered=False)
+        assert Navigator(root, backend=backend, max_frames=max_frames).run() == 0
+        writes.append(backend.writes)
+    # (without a kept frame, the parent is only displayed again when it continues)
+    assert writes[1] == writes[0] - 1
@@ -0,0 +1,180 @@
+import asyncio
+
+import pytest
+
+from terminal_ui import options_ui, options_ui_async, Memory_backend, Keys, Renderer, Render_modes, Base_UI, Slider, Button, Text_field, Tree, UI_list
+from terminal_ui import backends
+from terminal_ui.layout import text_width
+
+
+def frames(backend:Memory_backend):
+    """Returns the frames that a FULL renderer wrote to the backend."""
+    return [frame[:-1] for frame in backend.getvalue().split("\n" * 65)[1:]]
+
+
+async def load_async(key):
+    await asyncio.sleep(0)
+    prefix = "" if key is None else key
+    return [(f"{prefix}{x}", f"node {prefix}{x}", key is None) for x in range(3)]
+
+
+def test_tree_async_root():
+    tree = Tree(load_async)
+    backend = Memory_backend([Keys.DOWN, Keys.RIGHT, Keys.RIGHT, Keys.ESCAPE], capture=False)
+    options_ui([tree], "tree", backend=backend)
+    assert tree.selected_node.key == "10"
+    assert [node.key for node in tree._rows] == ["0", "1", "10", "11", "12", "2"]
+
+
+def test_tree_async_root_in_event_loop():
+    tree = Tree(load_async)
+    backend = Memory_backend([Keys.RIGHT, Keys.DOWN, Keys.ESCAPE], capture=False)
+    asyncio.run(options_ui_async([tree], "tree", backend=backend))
+    assert tree.selected_node.key == "00"
+
+
+def test_tree_async_root_before_display():
+    with pytest.raises(TypeError):
+        Tree(load_async).selected_node
+
+
+def test_old_handle_action_overrides():
+    calls = []
+
+    class Old_slider(Slider):
+        def _handle_action(self, key, key_mapping=None):
+            calls.append(key)
+            return super()._handle_action(key, key_mapping)
+
+    class Old_list(UI_list):
+        def _handle_action(self, key, key_mapping=None):
+            calls.append(("list", key))
+            return False
+
+    slider = Old_slider(range(10), 3)
+    backend = Memory_backend([Keys.RIGHT, Keys.DOWN, Keys.ENTER, Keys.ESCAPE], capture=False)
+    options_ui([slider, Old_list(["list"])], backend=backend)
+    assert calls == [Keys.RIGHT, ("list", 0)]
+    assert slider.value == 4
+
+
+class Old_button(Button):
+    def _handle_action(self, key, key_mapping=None):
+        return super()._handle_action(key, key_mapping)
+
+
+def test_old_override_uses_the_menu_backend(monkeypatch):
+    # (the terminal must not be used)
+    monkeypatch.setattr(backends, "_terminal_backend", object())
+    nested = UI_list(["nested"], "nested", can_esc=True)
+    backend = Memory_backend([Keys.ENTER, Keys.ESCAPE, Keys.ESCAPE])
+    options_ui([Old_button("open", nested)], backend=backend)
+    assert "nested" in backend.getvalue()
+
+
+def test_old_tree_override_uses_the_menu_backend(monkeypatch):
+    monkeypatch.setattr(backends, "_terminal_backend", object())
+    selected = []
+
+    class Old_tree(Tree):
+        def _handle_action(self, key, key_mapping=None):
+            return super()._handle_action(key, key_mapping)
+
+    def load(key):
+        prefix = "" if key is None else key
+        return [(f"{prefix}{x}", f"node {prefix}{x}", key is None) for x in range(2)]
+
+    tree = Old_tree(load, action=selected.append)
+    backend = Memory_backend([Keys.ENTER, Keys.DOWN, Keys.ENTER, Keys.ESCAPE], capture=False)
+    options_ui([tree], backend=backend)
+    assert selected == ["00"]
+
+
+def test_old_override_in_event_loop(monkeypatch):
+    monkeypatch.setattr(backends, "_terminal_backend", object())
+    called = []
+
+    async def action():
+        called.append(True)
+
+    backend = Memory_backend([Keys.ENTER, Keys.ESCAPE], capture=False)
+    asyncio.run(options_ui_async([Old_button("run", action)], backend=backend))
+    assert called == [True]
+
+
+def test_text_cache():
+    slider = Slider(range(10), 3, "volume ")
+    text = slider.make_text(">", "")
+    assert slider.make_text(">", "") is text
+    slider.value = 5
+    assert slider.make_text(">", "") == ">volume #####-----\n"
+    texts = slider._texts
+    slider.pre_text = "level "
+    # (cleared, not replaced)
+    assert slider._texts is texts and not texts
+
+
+def test_old_make_text_overrides():
+    class Old_button(Button):
+        def make_text(self, icon, icon_r):
+            return f"{icon}old button{icon_r}\n"
+
+    class Old_special(Base_UI):
+        def _make_special(self, icons_str):
+            return "special"
+
+    backend = Memory_backend([Keys.ESCAPE])
+    options_ui([Old_button(), Old_special(pre_text="x ")], renderer=Renderer(Render_modes.FULL), backend=backend)
+    assert frames(backend)[0] == ">old button\n x special\n"
+
+
+def test_full_width_slider():
+    backend = Memory_backend([Keys.ESCAPE], columns=40)
+    options_ui([Slider(range(10), 3, "volume ", pre_value=" ", display_value=True, bar_width=0)], renderer=Renderer(Render_modes.FULL), backend=backend)
+    line = frames(backend)[0].split("\n")[0]
+    assert text_width(line) == 39
+    assert line.startswith(">volume ###")
+    assert line.endswith(" 3")
+
+
+def test_slider_steps():
+    slider = Slider(range(0, 100), 50, step=10)
+    backend = Memory_backend([Keys.RIGHT, Keys.RIGHT, Keys.LEFT, Keys.ESCAPE], capture=False)
+    options_ui([slider], backend=backend)
+    assert slider.value == 60
+
+
+def test_text_field_editing():
+    field = Text_field("ac", "name: ")
+    backend = Memory_backend([Keys.LEFT, "b", Keys.RIGHT, Keys.RIGHT, "d", Keys.BACKSPACE, Keys.BACKSPACE, "é", Keys.ESCAPE], capture=False)
+    options_ui([field], backend=backend)
+    assert field.value == "abé"
+    assert field.cursor == 3
+    assert field.cursor_position(">") == (0, len(">name: abé"))
+
+
+def test_text_field_limits():
+    field = Text_field("abc", max_length=4)
+    assert field._handle_action("de") and field.value == "abcd"
+    assert not field._handle_action("e")
+    field.cursor = 0
+    assert not field._handle_action(Keys.BACKSPACE)
+    field._handle_action(Keys.LEFT)
+    assert field.cursor == 0
+    field.value = ""
+    field._handle_action(Keys.RIGHT)
+    assert field.cursor == 0
+    # (the cursor after the end of a changed value)
+    field.value = "x"
+    field.cursor = 5
+    field._handle_action("y")
+    assert field.value == "xy" and field.cursor == 2
+
+
+def test_text_field_placeholder():
+    field = Text_field(placeholder="type here", pre_text="> ")
+    backend = Memory_backend(["a", Keys.ESCAPE], buffered=False)
+    options_ui([field], backend=backend)
+    output = backend.getvalue()
+    assert "type here" in output
+    assert field.value == "a"
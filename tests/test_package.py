@@ -0,0 +1,18 @@
+import os
+import subprocess
+import sys
+
+
+def test_function_names_win_over_submodules():
+    code = "from terminal_ui.options_menu import Slider\nfrom terminal_ui import options_ui\nprint(callable(options_ui), type(options_ui).__name__)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), capture_output=True, text=True, check=True).stdout
+    assert output.split() == ["True", "function"]
+
+
+def test_lazy_names():
+    import terminal_ui
+    from terminal_ui import options_menu
+    for name in terminal_ui.__all__:
+        assert getattr(terminal_ui, name) is not None
+    assert terminal_ui.options_ui is options_menu.options_ui
+    assert "Slider" in dir(terminal_ui)
@@ -0,0 +1,46 @@
+from terminal_ui import Renderer, Render_modes
+
+
+SIZE = (20, 10)
+
+
+def test_first_frame_is_full():
+    renderer = Renderer()
+    assert renderer.render("a\nb", SIZE) == "\x1b[H\x1b[2Ja\nb"
+
+
+def test_only_changed_lines_are_written():
+    renderer = Renderer()
+    renderer.render("a\nb\nc", SIZE)
+    assert renderer.render("a\nB\nc", SIZE) == "\x1b[2;1HB\x1b[K\x1b[3;2H"
+
+
+def test_same_frame_writes_nothing():
+    renderer = Renderer()
+    renderer.render("a\nb", SIZE)
+    assert renderer.render("a\nb", SIZE) == ""
+
+
+def test_shorter_frame_clears_the_rest():
+    renderer = Renderer()
+    renderer.render("a\nb\nc", SIZE)
+    assert renderer.render("a", SIZE) == "\x1b[2;1H\x1b[J\x1b[1;2H"
+
+
+def test_invalidate_redraws():
+    renderer = Renderer()
+    renderer.render("a", SIZE)
+    renderer.invalidate()
+    assert renderer.render("a", SIZE) == "\x1b[H\x1b[2Ja"
+
+
+def test_frame_that_does_not_fit_is_redrawn():
+    renderer = Renderer()
+    renderer.render("a", SIZE)
+    assert renderer.render("x" * 25, SIZE) == "\x1b[H\x1b[2J" + "x" * 25
+    # (the next frame can't be diffed against it)
+    assert renderer.render("a", SIZE).startswith("\x1b[H\x1b[2J")
+
+
+def test_full_mode():
+    assert Renderer(Render_modes.FULL).render("a") == "\n" * 65 + "a\n"
@@ -0,0 +1,28 @@
+from terminal_ui.search_index import Search_index
+
+
+def test_search():
+    index = Search_index(["Apple", None, "banana", "grape", "PINEAPPLE"])
+    assert list(index.search("apple")) == [0, 4]
+    assert list(index.search("AN")) == [2]
+    assert index.search("") is None
+    assert not index.search("kiwi")
+
+
+def test_update():
+    answers = ["a0", "b1", "c2", "d1"]
+    index = Search_index(answers)
+    assert list(index.search("1")) == [1, 3]
+    answers[2:] = ["x1", "ß", "e1"]
+    index.update(2)
+    assert len(index) == 5
+    assert list(index.search("1")) == [1, 2, 4]
+    # (case folding makes "ß" longer, the answers after it still start at the right place)
+    assert list(index.search("ss")) == [3]
+    answers[3:] = ["f1"]
+    index.update(3)
+    assert list(index.search("1")) == [1, 2, 3]
+    del answers[1:]
+    index.update(1)
+    assert list(index.search("1")) == []
+    assert list(index.search("a")) == [0]
@@ -0,0 +1,77 @@
+import random
+
+from terminal_ui import UI_list, Memory_backend, Keys
+from terminal_ui.selectable_index import Tracked_list, Selectable_index
+
+
+def expected(elements:list, index:int, step:int):
+    """Finds the next (or previous) selectable element by walking the list."""
+    length = len(elements)
+    for x in range(1, length + 1):
+        found = (index + step * x) % length
+        if elements[found] is not None:
+            return found
+    return -1
+
+
+def check(index:Selectable_index, elements:list):
+    for x in range(len(elements)):
+        assert index.next(x) == expected(elements, x, 1)
+        assert index.previous(x) == expected(elements, x, -1)
+        assert index.nones_before(x) == elements[:x].count(None)
+
+
+def test_tracked_list_records_the_first_change():
+    elements = Tracked_list(range(10))
+    elements.reset_changes()
+    elements[7] = 0
+    elements.append(1)
+    elements.insert(3, 2)
+    assert elements.changed_from == 3
+    elements.reset_changes()
+    del elements[-2:]
+    assert elements.changed_from == 10
+    elements.reset_changes()
+    elements.sort()
+    assert elements.changed_from == 0
+
+
+def test_incremental_updates_match_a_full_build():
+    random.seed(3)
+    elements = Tracked_list(random.choice(["a", None]) for _ in range(50))
+    index = Selectable_index(elements)
+    for _ in range(200):
+        change = random.randrange(4)
+        position = random.randrange(len(elements) + 1)
+        value = random.choice(["a", None])
+        if change == 0:
+            elements.insert(position, value)
+        elif change == 1 and position < len(elements):
+            elements[position] = value
+        elif change == 2 and len(elements) > 1:
+            elements.pop(min(position, len(elements) - 1))
+        else:
+            elements.append(value)
+        index.update()
+        assert elements.changed_from is None
+        check(index, elements)
+
+
+def test_no_selectable_elements():
+    index = Selectable_index(Tracked_list([None, None]))
+    assert index.first() == -1
+    assert index.next(0) == -1
+    assert index.previous(1) == -1
+
+
+def test_modify_list_updates_the_navigation():
+    def remove_first(lists:list[list]):
+        answers, actions = lists
+        del answers[0:2]
+        del actions[0:2]
+
+    # after the action, "b" is selected, and the None after it is skipped
+    answers = UI_list(["a", None, "b", None, "c"], action_list=[remove_first, None, None, None, None], modify_list=True, exclude_nones=True)
+    backend = Memory_backend([Keys.ENTER, Keys.DOWN, Keys.ENTER], capture=False)
+    assert answers.display(backend=backend) == 1
+    assert answers.answer_list == ["b", None, "c"]
@@ -0,0 +1,78 @@
+import asyncio
+
+from terminal_ui import Menu_server, Session_backend, UI_list, Key_map, Keys
+from terminal_ui.key_map import POSIX_KEY_MAP
+
+
+async def read_split(parts:list[bytes]):
+    session = Session_backend(escape_delay=1)
+    key_map = Key_map(POSIX_KEY_MAP)
+    task = asyncio.create_task(session.read_key_async(key_map))
+    for part in parts:
+        await asyncio.sleep(0)
+        session.feed(part)
+    key = await task
+    return key, session
+
+
+def test_split_escape_sequences():
+    key, session = asyncio.run(read_split([b"\x1b[", b"A"]))
+    assert key == Keys.UP
+    # an unknown sequence is skipped as a whole, instead of being an escape and text
+    key, session = asyncio.run(read_split([b"\x1b[1;5", b"Cx"]))
+    assert key is None
+    assert session._buffer == b"x"
+    key, session = asyncio.run(read_split([b"\x1b[8;4", b"0;100t"]))
+    assert key is None
+    assert session.terminal_size() == (100, 40)
+
+
+def test_escape_alone():
+    async def read():
+        session = Session_backend(escape_delay=0.01)
+        session.feed(b"\x1b")
+        return await session.read_key_async(Key_map(POSIX_KEY_MAP))
+
+    assert asyncio.run(read()) == Keys.ESCAPE
+
+
+def test_sessions_are_isolated():
+    done = []
+    server = Menu_server(lambda session: UI_list(["a", "b", "c"], "menu"), query_size=False, on_done=lambda session, result: done.append((session, result)))
+
+    async def run():
+        first = Session_backend()
+        second = Session_backend()
+        tasks = [asyncio.create_task(server.run_session(session)) for session in (first, second)]
+        await asyncio.sleep(0)
+        assert server.sessions == {first, second}
+        first.feed(b"\x1b[B")
+        second.feed(b"\x1b[A")
+        await asyncio.sleep(0.01)
+        first.feed(b"\r")
+        second.feed(b"\r")
+        results = await asyncio.gather(*tasks)
+        return first, second, results
+
+    first, second, results = asyncio.run(run())
+    assert results == [1, 2]
+    assert first.result == 1 and second.result == 2
+    assert sorted(done, key=lambda item: item[1]) == [(first, 1), (second, 2)]
+    assert not server.sessions
+    assert first.bytes_written > 0 and second.bytes_written > 0
+
+
+def test_closed_session():
+    server = Menu_server(lambda session: UI_list(["a", "b"]), query_size=False)
+
+    async def run():
+        session = Session_backend()
+        task = asyncio.create_task(server.run_session(session))
+        await asyncio.sleep(0)
+        session.feed(b"\x1b[B")
+        session.feed_eof()
+        return await task, session
+
+    result, session = asyncio.run(run())
+    assert result is None and session.result is None
+    assert not server.sessions
@@ -0,0 +1,81 @@
+import pytest
+
+from terminal_ui import Table, Keys
+
+
+def make_table(**kwargs):
+    return Table.from_rows(["name", "size"], [("b", 30), ("c", 10), ("a", 20)], **kwargs)
+
+
+def displayed_rows(table:Table):
+    return [table._row_at(position) for position in range(table._row_count)]
+
+
+def test_sort_and_reverse():
+    table = make_table()
+    assert displayed_rows(table) == [0, 1, 2]
+    table.column = 1
+    table._handle_action(Keys.ENTER)
+    assert table.sort_column == 1 and not table.reverse
+    assert displayed_rows(table) == [1, 2, 0]
+    order = table._get_order()
+    table._handle_action(Keys.ENTER)
+    assert table.reverse
+    assert displayed_rows(table) == [0, 2, 1]
+    # (reversing doesn't sort again)
+    assert table._get_order() is order
+    table.sort(0)
+    assert displayed_rows(table) == [2, 0, 1]
+    table.sort(None)
+    assert displayed_rows(table) == [0, 1, 2]
+    with pytest.raises(IndexError):
+        table.sort(2)
+
+
+def test_selection_follows_the_row():
+    table = make_table(value=0, sort_column=1)
+    # row 0 ("b", 30) is the last one, when sorted by size
+    assert table._position_of(0) == 2
+    assert not table._move(Keys.DOWN)
+    assert table._move(Keys.UP)
+    assert table.value == 2
+    table.reverse = True
+    assert table._position_of(2) == 1
+    assert table._move(Keys.UP) and table.value == 0
+
+
+def test_sort_markers():
+    table = make_table(sort_column=1, reverse=True)
+    header = table.make_text(">", "").split("\n")[0]
+    assert [cell.strip() for cell in header.split(" | ")] == ["*name", "size v"]
+
+
+def test_column_window():
+    table = Table({f"c{x}": [x * 111] for x in range(10)})
+    # (every column is 5 wide, and 8 with its separator, so 5 of them fit)
+    text = table.make_text(">", "", 40)
+    assert text.split("\n")[0] == " *c0   | c1    | c2    | c3    | c4   "
+    assert "columns 1-5/10" in text
+    table.column = 9
+    text = table.make_text(">", "", 40)
+    assert "columns 6-10/10" in text
+    assert ">  555 |   666 |   777 |   888 |   999" in text
+    # all columns fit
+    assert "columns" not in table.make_text(">", "", 100)
+
+
+def test_row_window():
+    table = Table({"n": list(range(100))}, height=5, value=50)
+    lines = table.make_text(">", "").split("\n")
+    # (scrolled down only as far as needed)
+    assert lines[-2] == " rows 47-51/100, columns 1-1/1"
+    assert ">  50" in lines
+
+
+def test_set_data():
+    table = make_table(sort_column=1, value=2)
+    with pytest.raises(ValueError):
+        table.set_data({"a": [1], "b": [1, 2]})
+    table.set_data({"name": ["x"]})
+    assert table.sort_column is None
+    assert table.value == 0 and table.column == 0
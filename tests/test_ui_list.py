@@ -0,0 +1,41 @@
+from terminal_ui import UI_list, Memory_backend, Keys
+
+
+def test_filter_selects_first_match():
+    answers = UI_list(["a0", "b1", "c2", "d1"], filterable=True)
+    backend = Memory_backend([Keys.UP, "1", Keys.ENTER], capture=False)
+    assert answers.display(backend=backend) == 1
+
+
+def test_filter_keeps_index_across_actions():
+    indexes = []
+
+    def add_answer():
+        indexes.append(answers._search_index)
+        answers.answer_list.append("new")
+
+    answers = UI_list(["a0", "b1", "c2"], filterable=True, action_list=[add_answer, None, None])
+    backend = Memory_backend([Keys.ENTER, "n", Keys.BACKSPACE, Keys.UP, Keys.UP, Keys.UP, Keys.ENTER, "n", Keys.ENTER], capture=False)
+    assert answers.display(backend=backend) == 3
+    assert indexes[0] is not None and indexes[0] is indexes[1]
+    assert list(answers._get_search_index().search("new")) == [3, 4]
+
+
+def test_duck_typed_display_action():
+    shown = []
+
+    class Page:
+        def display(self, key_mapping=None):
+            shown.append(key_mapping is not None)
+
+    answers = UI_list(["page"], can_esc=True, action_list=[Page()])
+    backend = Memory_backend([Keys.ENTER, Keys.ESCAPE], capture=False)
+    assert answers.display(backend=backend) == -1
+    assert shown == [True]
+
+
+def test_moving_rewrites_only_the_changed_lines():
+    answers = UI_list(["a", "b", "c"], "q", can_esc=True)
+    backend = Memory_backend([Keys.DOWN, Keys.ESCAPE], buffered=False)
+    assert answers.display(backend=backend) == -1
+    assert backend.getvalue() == "\x1b[H\x1b[2Jq\n\n>a\n b\n c\n" + "\x1b[3;1H a\x1b[K\x1b[4;1H>b\x1b[K\x1b[6;1H"
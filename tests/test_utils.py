@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+termios = pytest.importorskip("termios")
+pty = pytest.importorskip("pty")
+
+from terminal_ui import key_readers, get_key, Keys
+
+
+def test_get_key_restores_terminal(monkeypatch):
+    master, slave = pty.openpty()
+    try:
+        monkeypatch.setattr(key_readers, "_key_reader", key_readers.Posix_key_reader(slave))
+        os.write(master, b"\r")
+        assert get_key() == Keys.ENTER
+        assert termios.tcgetattr(slave)[3] & termios.ECHO
+    finally:
+        os.close(master)
+        os.close(slave)
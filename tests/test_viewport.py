@@ -0,0 +1,40 @@
+from terminal_ui import Viewport
+
+
+def test_window_follows_the_selection():
+    viewport = Viewport()
+    assert viewport.window(0, 100, 5) == (0, 5)
+    assert viewport.window(4, 100, 5) == (0, 5)
+    # scrolls down by one, when the selection goes below the window
+    assert viewport.window(5, 100, 5) == (1, 6)
+    # and up, when it goes above it
+    assert viewport.window(0, 100, 5) == (0, 5)
+    assert viewport.window(99, 100, 5) == (95, 100)
+
+
+def test_window_with_row_heights():
+    viewport = Viewport()
+    heights = [1, 3, 1, 2, 1]
+    assert viewport.window(0, 5, 4, heights.__getitem__) == (0, 2)
+    assert viewport.window(3, 5, 4, heights.__getitem__) == (2, 5)
+
+
+def test_window_after_the_list_got_shorter():
+    viewport = Viewport()
+    viewport.window(50, 100, 5)
+    assert viewport.window(2, 3, 5) == (0, 3)
+    assert viewport.window(0, 0, 5) == (0, 0)
+
+
+def test_indicators():
+    viewport = Viewport()
+    assert viewport.make_indicators(0, 5, 5) == ("", "")
+    assert viewport.make_indicators(3, 8, 10) == ("^ 3 more", "v 2 more")
+    assert viewport.make_indicators(0, 5, 7, complete=False) == ("", "v 2+ more")
+    assert viewport.make_indicators(2, 7, 7, complete=False) == ("^ 2 more", "v more")
+
+
+def test_height():
+    assert Viewport(3).get_height(10, 5) == 3
+    assert Viewport().get_height(4, 20) == 14
+    assert Viewport().get_height(30, 20) == 1